@@ -0,0 +1,267 @@
+"""
+Descrição: Benchmarks sem interface gráfica para todas as estruturas de dados dos quatro módulos
+(BinaryTree.py, LinkedList.py, Stack.py e MetodoSimplificado.py). Para cada tamanho e tipo de carga
+(sequencial, aleatória e ordenada) mede inserção, remoção, busca, travessia e operações posicionais,
+e escreve um relatório JSON que pode ser comparado entre versões.
+
+Casos com custo quadrático (árvores sem balanceamento com chaves ordenadas, operações posicionais em
+listas sem índice) são ignorados acima de --quadratic-limit e aparecem no relatório como "skipped".
+
+O relatório inclui também o tempo de importação de simuladores.core num interpretador novo, que deve
+ficar abaixo de CORE_IMPORT_BUDGET sem carregar Tkinter (--check-import-budget falha caso contrário).
+
+Uso:
+    python benchmark.py --sizes 1000 10000 100000 --output atual.json
+    python benchmark.py --compare antigo.json atual.json
+    python benchmark.py --check-import-budget
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from simuladores.core import BinaryTree, ArrayBinaryTree, BPlusTree, LinkedList, ArrayLinkedList, Stack, RingStack
+from simuladores.core import simplificado as MetodoSimplificado
+
+WORKLOADS = ('sequential', 'random', 'sorted')
+# Número de operações posicionais/buscas pontuais por caso de lista
+POINT_OPERATIONS = 1000
+# Tempo máximo, em segundos, para importar simuladores.core num interpretador novo
+CORE_IMPORT_BUDGET = 0.05
+
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import simuladores.core\n"
+    "print(time.perf_counter() - start, 'tkinter' in sys.modules)\n"
+)
+
+
+def make_keys(workload, n, rng):
+    if workload == 'sequential':
+        return list(range(n))
+    if workload == 'random':
+        keys = list(range(n))
+        rng.shuffle(keys)
+        return keys
+    return sorted(rng.sample(range(10 * n), n))
+
+
+def timed(function, *args):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def call_each(method, values):
+    for value in values:
+        method(value)
+
+
+def call_each_pair(method, pairs):
+    for first, second in pairs:
+        method(first, second)
+
+
+def drain(method, count):
+    for _ in range(count):
+        method()
+
+
+# Árvores: nome -> (fábrica, método de travessia, sem balanceamento)
+TREES = {
+    'BinaryTree': (lambda: BinaryTree(), 'inorder', True),
+    'BinaryTree[avl]': (lambda: BinaryTree('avl'), 'inorder', False),
+    'BinaryTree[rb]': (lambda: BinaryTree('rb'), 'inorder', False),
+    'ArrayBinaryTree': (lambda: ArrayBinaryTree(), 'inorder', True),
+    'BPlusTree': (lambda: BPlusTree(), 'inorder', False),
+    'MetodoSimplificado.BinaryTree': (lambda: MetodoSimplificado.BinaryTree(), 'in_order_traversal', True),
+}
+
+LISTS = {
+    'LinkedList': lambda: LinkedList(),
+    'LinkedList[doubly]': lambda: LinkedList(doubly=True),
+    'LinkedList[skiplist]': lambda: LinkedList(skiplist=True),
+    'ArrayLinkedList': lambda: ArrayLinkedList(),
+}
+
+STACKS = {
+    'Stack': lambda: Stack(),
+    'Stack[compact]': lambda: Stack(compact=True),
+    'RingStack': lambda: RingStack(),
+    'MetodoSimplificado.Stack': lambda: MetodoSimplificado.Stack(),
+}
+
+
+def bench_tree(factory, traversal, keys, rng):
+    lookups = list(keys)
+    rng.shuffle(lookups)
+    tree = factory()
+    results = {'insert': timed(call_each, tree.insert, keys)}
+    if hasattr(tree, 'search'):
+        results['search'] = timed(call_each, tree.search, lookups)
+    if hasattr(tree, 'search_many'):
+        # Inclui a construção do snapshot
+        results['search_many'] = timed(tree.search_many, lookups)
+    results['traverse'] = timed(getattr(tree, traversal))
+    if hasattr(tree, 'select'):
+        results['select'] = timed(call_each, tree.select, rng.sample(range(len(keys)), len(keys)))
+        results['rank'] = timed(call_each, tree.rank, lookups)
+    results['delete'] = timed(call_each, tree.delete, lookups)
+    if hasattr(tree, 'union'):
+        first, second = factory(), factory()
+        call_each(first.insert, lookups[::2])
+        call_each(second.insert, lookups[1::2])
+        results['union'] = timed(first.union, second)
+    return results
+
+
+def bench_list(factory, keys, rng):
+    linked_list = factory()
+    results = {'append': timed(call_each, linked_list.append, keys)}
+    count = min(POINT_OPERATIONS, len(keys))
+    positions = [rng.randrange(len(keys)) for _ in range(count)]
+    values = [rng.choice(keys) for _ in range(count)]
+    results['find_position'] = timed(call_each, linked_list.find_position, positions)
+    results['find_value'] = timed(call_each, linked_list.find_value, values)
+    if hasattr(linked_list, 'find_values'):
+        results['find_values'] = timed(linked_list.find_values, values)
+    results['insert_at_position'] = timed(call_each_pair, linked_list.insert_at_position,
+                                          [(value, position) for value, position in zip(values, positions)])
+    results['remove_at_position'] = timed(call_each, linked_list.remove_at_position, positions)
+    results['remove_last'] = timed(drain, linked_list.remove_last, count)
+    return results
+
+
+def bench_simplified_list(keys, rng):
+    linked_list = MetodoSimplificado.LinkedList()
+    count = min(POINT_OPERATIONS, len(keys))
+    results = {'insert': timed(call_each, linked_list.insert, keys)}
+    results['traverse'] = timed(linked_list.display)
+    results['delete'] = timed(call_each, linked_list.delete, [rng.choice(keys) for _ in range(count)])
+    return results
+
+
+def bench_stack(factory, keys, rng):
+    stack = factory()
+    results = {'push': timed(call_each, stack.push, keys)}
+    results['pop'] = timed(drain, stack.pop, len(keys))
+    if hasattr(stack, 'push_many'):
+        results['push_many'] = timed(stack.push_many, keys)
+    if hasattr(stack, 'pop_many'):
+        results['pop_many'] = timed(stack.pop_many, len(keys))
+    return results
+
+
+def cases(n, workload, quadratic_limit):
+    # Gera (estrutura, função de benchmark ou None se ignorado)
+    ordered = workload != 'random'
+    for name, (factory, traversal, unbalanced) in TREES.items():
+        skip = unbalanced and ordered and n > quadratic_limit
+        yield name, None if skip else (lambda keys, rng, f=factory, t=traversal: bench_tree(f, t, keys, rng))
+    for name, factory in LISTS.items():
+        skip = name != 'LinkedList[skiplist]' and n > quadratic_limit
+        yield name, None if skip else (lambda keys, rng, f=factory: bench_list(f, keys, rng))
+    yield 'MetodoSimplificado.LinkedList', None if n > quadratic_limit else bench_simplified_list
+    for name, factory in STACKS.items():
+        yield name, (lambda keys, rng, f=factory: bench_stack(f, keys, rng))
+
+
+def measure_core_import(repeat=5):
+    # Melhor de `repeat` importações, cada uma num processo novo para não haver cache de módulos
+    root = os.path.dirname(os.path.abspath(__file__))
+    best, tkinter_loaded = float('inf'), False
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=root, check=True,
+                                capture_output=True, text=True).stdout.split()
+        best = min(best, float(output[0]))
+        tkinter_loaded = tkinter_loaded or output[1] == 'True'
+    return {'seconds': best, 'budget': CORE_IMPORT_BUDGET, 'tkinter_loaded': tkinter_loaded}
+
+
+def run(sizes, workloads, quadratic_limit, seed):
+    results = []
+    for n in sizes:
+        for workload in workloads:
+            for name, bench in cases(n, workload, quadratic_limit):
+                if bench is None:
+                    results.append({'structure': name, 'workload': workload, 'n': n, 'skipped': True})
+                    continue
+                rng = random.Random(seed)
+                keys = make_keys(workload, n, rng)
+                for operation, seconds in bench(keys, rng).items():
+                    results.append({'structure': name, 'workload': workload, 'n': n,
+                                    'operation': operation, 'seconds': seconds})
+                print(f"{name:<32}{workload:<12}{n:>10}", file=sys.stderr)
+    return {
+        'python': sys.version,
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'core_import': measure_core_import(),
+        'results': results,
+    }
+
+
+def compare(old_path, new_path):
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+
+    def key(entry):
+        return entry['structure'], entry['workload'], entry['n'], entry.get('operation')
+
+    baseline = {key(entry): entry for entry in old['results'] if not entry.get('skipped')}
+    print(f"{'estrutura':<32}{'carga':<12}{'n':>10}  {'operação':<20}{'antes':>10}{'depois':>10}{'razão':>8}")
+    for entry in new['results']:
+        before = baseline.get(key(entry))
+        if entry.get('skipped') or before is None:
+            continue
+        ratio = entry['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+        print(f"{entry['structure']:<32}{entry['workload']:<12}{entry['n']:>10}  {entry['operation']:<20}"
+              f"{before['seconds']:>10.4f}{entry['seconds']:>10.4f}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks das estruturas de dados")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--workloads', nargs='+', choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument('--quadratic-limit', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="ficheiro JSON de saída (por omissão, a saída padrão)")
+    parser.add_argument('--compare', nargs=2, metavar=('ANTES', 'DEPOIS'))
+    parser.add_argument('--check-import-budget', action='store_true',
+                        help="só mede a importação de simuladores.core e falha se exceder o orçamento")
+    args = parser.parse_args(argv)
+
+    if args.check_import_budget:
+        result = measure_core_import()
+        print(f"simuladores.core: {result['seconds'] * 1000:.1f} ms (orçamento {CORE_IMPORT_BUDGET * 1000:.0f} ms), "
+              f"tkinter carregado: {result['tkinter_loaded']}")
+        if result['seconds'] > CORE_IMPORT_BUDGET or result['tkinter_loaded']:
+            sys.exit(1)
+        return
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    report = run(args.sizes, args.workloads, args.quadratic_limit, args.seed)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Descrição: Benchmark de contenção das estruturas concorrentes. Para 1, 2, 4 e 8 threads de um
+ThreadPoolExecutor, mede o débito (operações por segundo) da pilha e da lista encadeada protegidas por
+um único lock global contra ConcurrentStack (Treiber) e ConcurrentLinkedList (lock por nó), e a
+escalabilidade em relação a uma thread.
+
+Com o GIL ativo só uma thread executa bytecode de cada vez, por isso o ganho vem apenas de as threads
+não se bloquearem umas às outras; num Python sem GIL (3.13t) as variantes finas escalam com os núcleos.
+
+Uso: python contention_benchmark.py [operações por thread] [tamanho inicial da lista]
+"""
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from simuladores.core import ConcurrentLinkedList, ConcurrentStack, LinkedList, Stack
+
+THREADS = (1, 2, 4, 8)
+
+
+class GlobalLock:
+    # Envolve uma estrutura com um único lock, como se fazia antes das variantes concorrentes
+    def __init__(self, structure):
+        self.structure = structure
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.structure)
+
+    def __getattr__(self, name):
+        # Cria o método protegido uma vez e guarda-o na instância
+        method = getattr(self.structure, name)
+        lock = self.lock
+
+        def locked(*args):
+            with lock:
+                return method(*args)
+        setattr(self, name, locked)
+        return locked
+
+
+def stack_worker(stack, operations, seed):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        if rng.random() < 0.5:
+            stack.push(1)
+        else:
+            try:
+                stack.pop()
+            except IndexError:
+                pass
+
+
+def list_worker(linked_list, operations, seed):
+    # Inserções, remoções e buscas em posições aleatórias de uma lista de tamanho aproximadamente fixo
+    rng = random.Random(seed)
+    for _ in range(operations):
+        size = len(linked_list)
+        r = rng.random()
+        try:
+            if r < 0.25:
+                linked_list.insert_at_position(0, rng.randint(0, size))
+            elif r < 0.5:
+                linked_list.remove_at_position(rng.randint(0, max(size - 1, 0)))
+            else:
+                linked_list.find_position(rng.randint(0, max(size - 1, 0)))
+        except IndexError:
+            pass  # Outra thread encolheu a lista entre len() e a operação
+
+
+def throughput(factory, worker, threads, operations):
+    structure = factory()
+    barrier = threading.Barrier(threads + 1)
+
+    def run(seed):
+        barrier.wait()
+        worker(structure, operations, seed)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(run, seed) for seed in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return threads * operations / elapsed
+
+
+def main(operations, list_size):
+    def filled(linked_list):
+        for value in range(list_size):
+            linked_list.append(value)
+        return linked_list
+
+    cases = [
+        ("Stack + lock global", lambda: GlobalLock(Stack()), stack_worker),
+        ("ConcurrentStack", ConcurrentStack, stack_worker),
+        ("LinkedList + lock global", lambda: GlobalLock(filled(LinkedList())), list_worker),
+        ("ConcurrentLinkedList", lambda: filled(ConcurrentLinkedList()), list_worker),
+    ]
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'ativo' if gil else 'desativado'}")
+    print(f"{'Estrutura':<28}{'threads':>8}{'ops/s':>14}{'escala':>8}")
+    for name, factory, worker in cases:
+        base = None
+        for threads in THREADS:
+            rate = throughput(factory, worker, threads, operations)
+            base = base or rate
+            print(f"{name:<28}{threads:>8}{rate:>14.0f}{rate / base:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 200)
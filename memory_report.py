@@ -0,0 +1,61 @@
+"""
+Descrição: Relatório de memória por elemento das estruturas de dados. Constrói cada representação
+(nós com __slots__, pools em arrays paralelos e a versão simplificada) com n inteiros aleatórios e
+mede com tracemalloc quantos bytes cada elemento ocupa.
+
+Uso: python memory_report.py [n]
+"""
+import random
+import sys
+import tracemalloc
+
+from simuladores.core import BinaryTree, ArrayBinaryTree, BPlusTree, LinkedList, ArrayLinkedList, Stack, RingStack
+from simuladores.core import simplificado as MetodoSimplificado
+
+
+def fill(structure, method, keys):
+    add = getattr(structure, method)
+    for key in keys:
+        add(key)
+    return structure
+
+
+BUILDERS = [
+    ("LinkedList", lambda keys: fill(LinkedList(), 'append', keys)),
+    ("LinkedList (dupla)", lambda keys: fill(LinkedList(doubly=True), 'append', keys)),
+    ("ArrayLinkedList", lambda keys: fill(ArrayLinkedList(), 'append', keys)),
+    ("BinaryTree", lambda keys: fill(BinaryTree(), 'insert', keys)),
+    ("BinaryTree (AVL)", lambda keys: fill(BinaryTree('avl'), 'insert', keys)),
+    ("ArrayBinaryTree", lambda keys: fill(ArrayBinaryTree(), 'insert', keys)),
+    ("BPlusTree", lambda keys: fill(BPlusTree(), 'insert', keys)),
+    ("Stack", lambda keys: fill(Stack(), 'push', keys)),
+    ("Stack (compacta)", lambda keys: fill(Stack(compact=True), 'push', keys)),
+    ("RingStack", lambda keys: fill(RingStack(), 'push', keys)),
+    ("MetodoSimplificado.LinkedList", lambda keys: fill(MetodoSimplificado.LinkedList(), 'insert', keys)),
+    ("MetodoSimplificado.Stack", lambda keys: fill(MetodoSimplificado.Stack(), 'push', keys)),
+    ("MetodoSimplificado.BinaryTree", lambda keys: fill(MetodoSimplificado.BinaryTree(), 'insert', keys)),
+]
+
+
+def bytes_per_element(build, keys):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(keys)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / len(keys)
+
+
+def main(n):
+    # As chaves já existem antes da medição: conta-se só o que cada estrutura aloca. As
+    # estruturas de nós guardam referências para esses int (mais 28 bytes cada, na prática),
+    # enquanto os arrays copiam o valor para 8 bytes.
+    keys = random.sample(range(1000, 1000 + 10 * n), n)
+    print(f"{'Estrutura':<32}{'bytes/elemento':>16}")
+    for name, build in BUILDERS:
+        print(f"{name:<32}{bytes_per_element(build, list(keys)):>16.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,88 @@
+"""
+Descrição: Repete um registo de operações (ficheiro ou entrada padrão, uma operação por linha, ver
+simuladores.core.replay) sobre uma Stack, LinkedList ou BinaryTree, sem interface gráfica, com lotes,
+checkpoints periódicos e relatório de débito; ou anima a repetição na aplicação Tkinter correspondente.
+
+Uso:
+    python replay.py operacoes.txt --structure tree --balance avl --checkpoint arvore.bin --checkpoint-every 1000000
+    python replay.py - --structure stack < operacoes.txt
+    python replay.py operacoes.txt --structure list --gui --fps 30 --ops-per-frame 50
+"""
+import argparse
+import json
+import sys
+
+from simuladores.core import BinaryTree, LinkedList, Replayer, Stack
+
+STRUCTURES = ('stack', 'list', 'tree')
+
+
+def build(args):
+    if args.structure == 'stack':
+        cls, options = Stack, {'compact': args.compact}
+    elif args.structure == 'list':
+        cls, options = LinkedList, {'doubly': args.doubly, 'skiplist': args.skiplist}
+    else:
+        cls, options = BinaryTree, {}
+    if args.load:
+        return cls.load(args.load, **options)
+    return cls(args.balance) if cls is BinaryTree else cls(**options)
+
+
+def animate(args, lines):
+    # As aplicações criam as suas próprias estruturas; a repetição é feita sobre elas
+    import tkinter as tk
+    from simuladores.gui import BinaryTreeApp, LinkedListApp, ReplayPlayer, StackApp
+
+    root = tk.Tk()
+    if args.structure == 'stack':
+        app = StackApp(root)
+        structure, draw = app.stack, app.draw_stack
+    elif args.structure == 'list':
+        app = LinkedListApp(root)
+        structure, draw = app.linked_list, app.draw_linked_list
+    else:
+        app = BinaryTreeApp(root, args.balance)
+        structure, draw = app.tree, app.draw_tree
+    player = ReplayPlayer(root, Replayer(structure, lines, strict=args.strict), draw, args.fps, args.ops_per_frame)
+    player.start()
+    root.mainloop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Repetição de registos de operações")
+    parser.add_argument('log', help="ficheiro com as operações ('-' para a entrada padrão)")
+    parser.add_argument('--structure', choices=STRUCTURES, required=True)
+    parser.add_argument('--balance', choices=('avl', 'rb'), help="modo de balanceamento da árvore")
+    parser.add_argument('--compact', action='store_true', help="pilha compacta em array('q')")
+    parser.add_argument('--doubly', action='store_true', help="lista duplamente encadeada")
+    parser.add_argument('--skiplist', action='store_true', help="lista com faixas de skip list")
+    parser.add_argument('--load', help="snapshot inicial (por exemplo, um checkpoint anterior)")
+    parser.add_argument('--batch', type=int, default=10000, help="operações lidas e aplicadas por lote")
+    parser.add_argument('--checkpoint', help="ficheiro do snapshot regravado periodicamente")
+    parser.add_argument('--checkpoint-every', type=int, default=1000000)
+    parser.add_argument('--report-every', type=float, default=1.0, help="segundos entre relatórios de débito")
+    parser.add_argument('--strict', action='store_true', help="parar no primeiro erro (pilha vazia, valor inexistente...)")
+    parser.add_argument('--gui', action='store_true', help="animar a repetição na aplicação Tkinter")
+    parser.add_argument('--fps', type=float, default=30)
+    parser.add_argument('--ops-per-frame', type=int, default=100)
+    args = parser.parse_args(argv)
+    if args.gui and (args.load or args.checkpoint):
+        parser.error("--load e --checkpoint só são suportados sem --gui")
+
+    source = sys.stdin if args.log == '-' else open(args.log)
+    try:
+        if args.gui:
+            animate(args, source)
+            return
+        replayer = Replayer(build(args), source, args.checkpoint, args.checkpoint_every, args.strict)
+        stats = replayer.run(args.batch, args.report_every)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    json.dump(stats, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Simuladores de estruturas de dados.
+
+simuladores.core contém as estruturas (listas encadeadas, pilhas e árvores) sem qualquer dependência
+de Tkinter; simuladores.gui contém as aplicações gráficas, que só importam Tkinter quando são usadas.
+"""
@@ -0,0 +1,14 @@
+"""
+Estruturas de dados sem interface gráfica. Importar este pacote não carrega Tkinter.
+"""
+from .binary_tree import RED, BLACK, TreeNode, BinaryTree, PooledTreeNode, ArrayBinaryTree
+from .linked_list import Node, MAX_SKIP_LEVELS, LinkedList, PooledNode, ArrayLinkedList
+from .bplus_tree import BPlusNode, BPlusTree
+from .stack import Stack, RingStack
+from .metrics import OperationStats, Metrics
+from .batch import Snapshot
+from .persistent import PersistentBinaryTree, PersistentBPlusTree, PersistentStack, History
+from .concurrent import ConcurrentStack, LockedNode, ConcurrentLinkedList
+from .storage import save, load, open_mapped, MappedBinaryTree, MappedLinkedList, MappedStack
+from .replay import Replayer
+from . import simplificado
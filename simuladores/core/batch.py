@@ -0,0 +1,61 @@
+"""
+Consultas em lote: um Snapshot congela os valores de uma estrutura (pela ordem em que ela os guarda)
+e responde a muitas consultas de uma vez. Com NumPy, os valores distintos ficam num array ordenado com a
+primeira posição de cada um, e as consultas resolvem-se com searchsorted; sem NumPy, com um dicionário.
+As estruturas descartam o Snapshot sempre que são alteradas. Não depende de Tkinter.
+
+NumPy é opcional e só é importado na primeira construção de um Snapshot, para não pesar na importação de
+simuladores.core.
+"""
+_numpy = None
+
+
+def load_numpy():
+    # Devolve o módulo numpy, ou None se não estiver instalado; a tentativa só é feita uma vez
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+class Snapshot:
+    __slots__ = ('np', 'keys', 'positions', 'first')
+
+    def __init__(self, values):
+        np = self.np = load_numpy()
+        if np is not None:
+            # unique ordena os valores distintos e devolve o índice da primeira ocorrência de cada um
+            self.keys, self.positions = np.unique(np.asarray(values), return_index=True)
+            self.first = None
+        else:
+            self.first = {}
+            for position, value in enumerate(values):
+                self.first.setdefault(value, position)
+
+    def _match(self, queries):
+        # Índice de cada consulta em keys e máscara das que existem (keys não pode estar vazio)
+        index = self.np.minimum(self.np.searchsorted(self.keys, queries), len(self.keys) - 1)
+        return index, self.keys[index] == queries
+
+    def contains(self, queries):
+        # Array booleano (lista sem NumPy): se cada consulta existe na estrutura
+        if self.np is None:
+            return [query in self.first for query in queries]
+        queries = self.np.asarray(queries)
+        if not len(self.keys):
+            return self.np.zeros(queries.shape, dtype=bool)
+        return self._match(queries)[1]
+
+    def find(self, queries):
+        # Array de inteiros (lista sem NumPy): primeira posição de cada consulta, -1 se não existir
+        if self.np is None:
+            return [self.first.get(query, -1) for query in queries]
+        queries = self.np.asarray(queries)
+        if not len(self.keys):
+            return self.np.full(queries.shape, -1, dtype=self.np.intp)
+        index, found = self._match(queries)
+        return self.np.where(found, self.positions[index], -1)
@@ -0,0 +1,1120 @@
+"""
+Árvores binárias de busca: BinaryTree (com modos AVL e rubro-negro opcionais) e ArrayBinaryTree,
+guardada em arrays paralelos. Não depende de Tkinter.
+
+union, intersection e difference aceitam um executor (por exemplo um ProcessPoolExecutor) que reparte
+a recursão entre processos. As subárvores vão e voltam por pickle, o que custa mais do que o trabalho
+quando as chaves se comparam em C: com inteiros o executor chegou a ser 5x mais lento. Por isso só é
+usado com chaves que não sejam de SEQUENTIAL_KEYS e com pelo menos 2 * PARALLEL_GRAIN chaves no total;
+nos outros casos as operações correm no próprio processo e o executor é ignorado.
+"""
+import os
+from array import array
+from collections import deque
+
+from .batch import Snapshot
+
+# Cores usadas no modo rubro-negro
+RED = True
+BLACK = False
+# Nas operações de conjunto com executor, pares de subárvores com menos chaves do que isto são
+# resolvidos no próprio processo (enviá-los por pickle custaria mais do que o trabalho)
+PARALLEL_GRAIN = 1 << 15
+# Tipos de chave com comparações baratas, para os quais o executor das operações de conjunto é ignorado
+SEQUENTIAL_KEYS = (int, float, str, bytes)
+
+class TreeNode:
+    __slots__ = ('left', 'right', 'val', 'height', 'size', 'color', 'layout')
+
+    def __init__(self, key):
+        self.left = None
+        self.right = None
+        self.val = key
+        self.height = 1  # Mantida apenas nos modos balanceados
+        self.size = 1  # Número de nós da subárvore, mantido em todos os modos (estatísticas de ordem)
+        self.color = RED
+        # Cache do TidyTreeLayout; as operações que alteram a subárvore repõem-no a None
+        self.layout = None
+
+    def copy(self):
+        # Cópia rasa (partilha os filhos), usada pela PersistentBinaryTree
+        node = TreeNode.__new__(TreeNode)
+        node.left, node.right, node.val = self.left, self.right, self.val
+        node.height, node.size, node.color, node.layout = self.height, self.size, self.color, self.layout
+        return node
+
+    def __reduce__(self):
+        # Subárvores enviadas por pickle a outro processo (operações de conjunto com executor), sem o
+        # cache do layout
+        return _rebuild_node, (self.val, self.left, self.right, self.height, self.size, self.color)
+
+
+def _rebuild_node(key, left, right, height, size, color):
+    node = TreeNode(key)
+    node.left, node.right, node.height, node.size, node.color = left, right, height, size, color
+    return node
+
+class BinaryTree:
+    # Operações cronometradas quando há métricas (ver simuladores.core.metrics)
+    INSTRUMENTED = ('insert', 'delete', 'search', 'search_many', 'select', 'rank', 'count_range', 'inorder',
+                    'preorder', 'postorder', 'levelorder')
+
+    def __init__(self, balance=None, metrics=None):
+        # balance: None (árvore de busca simples), 'avl' ou 'rb' (rubro-negra inclinada à esquerda)
+        if balance not in (None, 'avl', 'rb'):
+            raise ValueError(f"Modo de balanceamento inválido: {balance}")
+        self.root = None
+        self.balance = balance
+        # Snapshot das chaves para search_many; descartado a cada insert/delete
+        self._snapshot = None
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'altura', self.height)
+
+    def __len__(self):
+        return self._size(self.root)
+
+    def height(self):
+        # Nos modos balanceados a altura está guardada na raiz; sem balanceamento percorre a árvore
+        if self.balance is not None:
+            return self._height(self.root)
+        height, level = 0, [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return height
+
+    def _count(self, hops, comparisons, allocations=0):
+        # Só é chamado com métricas ligadas
+        self.metrics.hops += hops
+        self.metrics.comparisons += comparisons
+        self.metrics.allocations += allocations
+
+    @classmethod
+    def from_sorted(cls, keys, balance=None):
+        # Constrói em O(n) uma árvore perfeitamente balanceada a partir de chaves estritamente
+        # crescentes (uma sequência indexável). No modo 'rb' essa forma nem sempre é uma
+        # rubro-negra inclinada à esquerda válida, por isso as chaves são inseridas uma a uma.
+        tree = cls(balance)
+        if balance == 'rb':
+            for key in keys:
+                tree.insert(key)
+        else:
+            tree.root = tree._build_balanced(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys, balance=None):
+        return cls.from_sorted(sorted(set(keys)), balance)
+
+    def save(self, path):
+        # Snapshot binário (ver simuladores.core.storage)
+        from .storage import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path):
+        from .storage import load
+        return load(cls, path)
+
+    def _build_balanced(self, keys):
+        # Cada entrada da pilha é (nó, início, meio, fim) do intervalo que o nó representa;
+        # a altura de uma subárvore assim construída com m chaves é m.bit_length()
+        if not keys:
+            return None
+        mid = len(keys) // 2
+        root = TreeNode(keys[mid])
+        root.height = len(keys).bit_length()
+        root.size = len(keys)
+        stack = [(root, 0, mid, len(keys))]
+        while stack:
+            node, lo, mid, hi = stack.pop()
+            if lo < mid:
+                child_mid = (lo + mid) // 2
+                node.left = TreeNode(keys[child_mid])
+                node.left.height = (mid - lo).bit_length()
+                node.left.size = mid - lo
+                stack.append((node.left, lo, child_mid, mid))
+            if mid + 1 < hi:
+                child_mid = (mid + 1 + hi) // 2
+                node.right = TreeNode(keys[child_mid])
+                node.right.height = (hi - mid - 1).bit_length()
+                node.right.size = hi - mid - 1
+                stack.append((node.right, mid + 1, child_mid, hi))
+        return root
+
+    # Todas as operações são iterativas: os modos balanceados guardam o caminho percorrido
+    # numa pilha explícita (pares (nó, desceu_à_esquerda)) e reequilibram ao subir por ela.
+
+    def insert(self, key):
+        self._snapshot = None
+        if self.balance == 'avl':
+            self._insert_path(key, self._avl_rebalance)
+        elif self.balance == 'rb':
+            self._insert_path(key, self._rb_fix_up)
+            self.root.color = BLACK
+        elif self.root is None:
+            self.root = TreeNode(key)
+            if self.metrics is not None:
+                self._count(0, 0, 1)
+        elif self.metrics is not None:
+            self._insert_counted(self.root, key)
+        else:
+            self._insert(self.root, key)
+
+    def _insert(self, node, key):
+        # Conta o novo nó em cada ancestral durante a descida; um duplicado desfaz a contagem
+        while True:
+            node.layout = None
+            node.size += 1
+            if key < node.val:
+                if node.left is None:
+                    node.left = TreeNode(key)
+                    return
+                node = node.left
+            elif key > node.val:  # Permitir valores apenas se forem diferentes
+                if node.right is None:
+                    node.right = TreeNode(key)
+                    return
+                node = node.right
+            else:
+                # Se o valor for igual, não fazer nada (evitar duplicados)
+                self._uncount(key)
+                return
+
+    def _uncount(self, key):
+        # Desfaz a contagem de _insert nos nós do caminho até key, inclusive
+        node = self.root
+        while True:
+            node.size -= 1
+            if key == node.val:
+                return
+            node = node.left if key < node.val else node.right
+
+    def _insert_counted(self, node, key):
+        # O mesmo percurso de _insert, a contar os nós visitados; usado só com métricas ligadas
+        depth = 0
+        while True:
+            node.layout = None
+            node.size += 1
+            depth += 1
+            if key < node.val:
+                if node.left is None:
+                    node.left = TreeNode(key)
+                    break
+                node = node.left
+            elif key > node.val:
+                if node.right is None:
+                    node.right = TreeNode(key)
+                    break
+                node = node.right
+            else:
+                self._uncount(key)
+                self._count(depth - 1, depth)
+                return
+        self._count(depth, depth, 1)
+
+    def _insert_path(self, key, fix):
+        if self.root is None:
+            self.root = TreeNode(key)
+            if self.metrics is not None:
+                self._count(0, 0, 1)
+            return
+        path = []
+        node = self.root
+        while node is not None:
+            if key == node.val:
+                break
+            left = key < node.val
+            path.append((node, left))
+            node = node.left if left else node.right
+        if self.metrics is not None:
+            self._count(len(path), len(path) + (node is not None), node is None)
+        if node is not None:
+            return
+        self.root = self._rebuild_path(path, TreeNode(key), fix)
+
+    def _rebuild_path(self, path, child, fix):
+        # Religa a subárvore resultante a cada ancestral, do mais profundo até a raiz
+        for parent, left in reversed(path):
+            if left:
+                parent.left = child
+            else:
+                parent.right = child
+            child = fix(parent)
+        return child
+
+    def delete(self, key):
+        self._snapshot = None
+        if self.balance == 'avl':
+            self.root, deleted = self._avl_delete(self.root, key)
+        elif self.balance == 'rb':
+            # _rb_delete_root pressupõe que a chave existe. A verificação não conta para as métricas
+            # quando a encontra: conta o percurso de _rb_delete_root, que volta a descer da raiz.
+            node, depth = self.root, 0
+            while node is not None and node.val != key:
+                node = node.left if key < node.val else node.right
+                depth += 1
+            deleted = node is not None
+            if deleted:
+                self._rb_delete_root(key)
+            elif self.metrics is not None:
+                self._count(depth, depth)
+        else:
+            self.root, deleted = self._delete(self.root, key)
+        if not deleted:
+            raise ValueError(f"O valor {key} não foi encontrado na árvore")
+
+    def _detach(self, root, key):
+        # Localiza o nó a remover; com dois filhos, copia o sucessor e remove-o no lugar.
+        # Devolve o caminho até o nó desligado e a subárvore que ocupa a sua posição.
+        path = []
+        node = root
+        while node is not None and node.val != key:
+            left = key < node.val
+            path.append((node, left))
+            node = node.left if left else node.right
+        found = len(path)
+        if node is None:
+            if self.metrics is not None:
+                self._count(found, found)
+            return None, None
+        for parent, _ in path:
+            parent.layout = None
+        node.layout = None
+        if node.left is not None and node.right is not None:
+            path.append((node, False))
+            successor = node.right
+            while successor.left is not None:
+                path.append((successor, True))
+                successor.layout = None
+                successor = successor.left
+            node.val = successor.val
+            node = successor
+        if self.metrics is not None:
+            # A descida até o sucessor conta como saltos, mas não como comparações com a chave
+            self._count(len(path), found + 1)
+        child = node.left if node.left is not None else node.right
+        return path, child
+
+    def _delete(self, root, key):
+        path, child = self._detach(root, key)
+        if path is None:
+            return root, False
+        if not path:
+            return child, True
+        for parent, _ in path:
+            parent.size -= 1
+        parent, left = path[-1]
+        if left:
+            parent.left = child
+        else:
+            parent.right = child
+        return root, True
+
+    def _min_value_node(self, node):
+        current = node
+        while current.left is not None:
+            current = current.left
+        return current
+
+    def _height(self, node):
+        return node.height if node else 0
+
+    def _size(self, node):
+        return node.size if node else 0
+
+    def _update(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+        node.layout = None
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        pivot.color = node.color
+        node.color = RED
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        pivot.color = node.color
+        node.color = RED
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    # AVL
+
+    def _avl_rebalance(self, node):
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _avl_delete(self, root, key):
+        path, child = self._detach(root, key)
+        if path is None:
+            return root, False
+        return self._rebuild_path(path, child, self._avl_rebalance), True
+
+    # Rubro-negra inclinada à esquerda (Sedgewick)
+
+    def _is_red(self, node):
+        return node is not None and node.color == RED
+
+    def _flip_colors(self, node):
+        node.color = not node.color
+        node.left.color = not node.left.color
+        node.right.color = not node.right.color
+
+    def _rb_fix_up(self, node):
+        if self._is_red(node.right) and not self._is_red(node.left):
+            node = self._rotate_left(node)
+        if self._is_red(node.left) and self._is_red(node.left.left):
+            node = self._rotate_right(node)
+        if self._is_red(node.left) and self._is_red(node.right):
+            self._flip_colors(node)
+        self._update(node)
+        return node
+
+    def _move_red_left(self, node):
+        self._flip_colors(node)
+        if self._is_red(node.right.left):
+            node.right = self._rotate_right(node.right)
+            node = self._rotate_left(node)
+            self._flip_colors(node)
+        return node
+
+    def _move_red_right(self, node):
+        self._flip_colors(node)
+        if self._is_red(node.left.left):
+            node = self._rotate_right(node)
+            self._flip_colors(node)
+        return node
+
+    def _rb_delete_min(self, node):
+        path = []
+        while node.left is not None:
+            if not self._is_red(node.left) and not self._is_red(node.left.left):
+                node = self._move_red_left(node)
+            path.append((node, True))
+            node = node.left
+        return self._rebuild_path(path, None, self._rb_fix_up)
+
+    def _rb_delete_root(self, key):
+        # Pressupõe que a chave existe na árvore
+        if not self._is_red(self.root.left) and not self._is_red(self.root.right):
+            self.root.color = RED
+        path = []
+        node = self.root
+        descent = 0
+        while True:
+            if key < node.val:
+                if not self._is_red(node.left) and not self._is_red(node.left.left):
+                    node = self._move_red_left(node)
+                path.append((node, True))
+                node = node.left
+                continue
+            if self._is_red(node.left):
+                node = self._rotate_right(node)
+            if key == node.val and node.right is None:
+                child = None
+                break
+            if not self._is_red(node.right) and not self._is_red(node.right.left):
+                node = self._move_red_right(node)
+            if key == node.val:
+                successor, descent = node.right, 1
+                while successor.left is not None:
+                    successor = successor.left
+                    descent += 1
+                node.val = successor.val
+                node.right = self._rb_delete_min(node.right)
+                child = self._rb_fix_up(node)
+                break
+            path.append((node, False))
+            node = node.right
+        if self.metrics is not None:
+            # Como em _detach: a descida até o sucessor conta como saltos, não como comparações
+            self._count(len(path) + descent, len(path) + 1)
+        self.root = self._rebuild_path(path, child, self._rb_fix_up)
+        if self.root is not None:
+            self.root.color = BLACK
+
+    def search(self, key):
+        return self._search(self.root, key)
+
+    def _search(self, node, key):
+        if self.metrics is not None:
+            return self._search_counted(node, key)
+        while node is not None and node.val != key:
+            node = node.left if key < node.val else node.right
+        return node
+
+    def search_path(self, key):
+        # Nós visitados por search(key), da raiz até ao nó com key ou até sair da árvore; produzidos
+        # sob demanda (usado pelas animações das aplicações) e sem contar para as métricas
+        node = self.root
+        while node is not None:
+            yield node
+            if key == node.val:
+                return
+            node = node.left if key < node.val else node.right
+
+    def search_many(self, keys):
+        # Pertença de um lote de chaves de uma só vez (array booleano com NumPy, lista sem ele).
+        # O snapshot custa O(n) e é reaproveitado até a árvore ser alterada.
+        if self._snapshot is None:
+            self._snapshot = Snapshot(self.inorder())
+        return self._snapshot.contains(keys)
+
+    def _search_counted(self, node, key):
+        # O mesmo percurso de _search, a contar os nós visitados; usado só com métricas ligadas
+        hops = 0
+        while node is not None and node.val != key:
+            node = node.left if key < node.val else node.right
+            hops += 1
+        self._count(hops, hops + (node is not None))
+        return node
+
+    # Estatísticas de ordem: com o tamanho de cada subárvore, select, rank e count_range descem
+    # um único caminho (O(h), O(log n) nos modos balanceados)
+
+    def select(self, k):
+        # k-ésima menor chave, a contar de 0
+        if k < 0 or k >= self._size(self.root):
+            raise IndexError("Posição fora dos limites")
+        node = self.root
+        while True:
+            left = self._size(node.left)
+            if k < left:
+                node = node.left
+            elif k > left:
+                k -= left + 1
+                node = node.right
+            else:
+                return node.val
+
+    def rank(self, key):
+        # Número de chaves estritamente menores que key
+        return self._rank(key, False)
+
+    def _rank(self, key, inclusive):
+        # Com inclusive=True conta também a própria key, se existir
+        rank = 0
+        node = self.root
+        while node is not None:
+            if key < node.val or (key == node.val and not inclusive):
+                node = node.left
+            else:
+                rank += self._size(node.left) + 1
+                if key == node.val:
+                    break
+                node = node.right
+        return rank
+
+    def count_range(self, lo, hi):
+        # Número de chaves em [lo, hi]
+        if hi < lo:
+            return 0
+        return self._rank(hi, True) - self._rank(lo, False)
+
+    def range(self, lo, hi):
+        # Chaves em [lo, hi] por ordem, produzidas sob demanda: só desce às subárvores que podem
+        # conter chaves do intervalo, visitando O(h + m) nós para m resultados
+        stack = []
+        node = self.root
+        while True:
+            while node:
+                if node.val < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.val > hi:
+                return
+            yield node.val
+            node = node.right
+
+    # Operações de conjunto por junção: _join(left, node, right) junta duas árvores com um nó do meio,
+    # reequilibrando só ao longo da espinha da mais alta (O(diferença de alturas)), e split, union,
+    # intersection e difference reduzem-se a _split e _join, com O(m log(n/m + 1)) de trabalho para
+    # árvores de m <= n chaves nos modos balanceados. Os nós das árvores de entrada são reaproveitados
+    # (a outra árvore fica vazia); _own é o ponto em que a PersistentBinaryTree os copia.
+
+    def _own(self, node):
+        return node
+
+    def split(self, key):
+        # Parte a árvore em duas novas, com as chaves < key e as chaves >= key; esta fica vazia
+        left, found, right = self._split(self.root, key)
+        if found is not None:
+            right = self._join(None, found, right)
+        self.root = None
+        self._snapshot = None
+        return self._tree(left), self._tree(right)
+
+    @classmethod
+    def join(cls, left, right):
+        # Nova árvore com as chaves de left e de right, sendo todas as de left menores que as de
+        # right; as duas ficam vazias
+        if left.balance != right.balance:
+            raise ValueError("As árvores têm modos de balanceamento diferentes")
+        if left.root is not None and right.root is not None:
+            last = left.root
+            while last.right is not None:
+                last = last.right
+            if last.val >= right._min_value_node(right.root).val:
+                raise ValueError("As chaves da primeira árvore têm de ser menores que as da segunda")
+        tree = cls(left.balance)
+        tree.root = left.root
+        left.root = None
+        left._snapshot = None
+        tree._concatenate(right)
+        return tree
+
+    def union(self, other, executor=None):
+        # Esta árvore passa a ter as chaves das duas; other fica vazia. executor (por exemplo um
+        # ProcessPoolExecutor) reparte os ramos independentes da recursão entre processos, só para
+        # chaves com comparações caras (ver a descrição do módulo); com inteiros é ignorado.
+        self._set_operation('union', other, executor)
+
+    def intersection(self, other, executor=None):
+        # Esta árvore fica só com as chaves que também estão em other; other fica vazia
+        self._set_operation('intersection', other, executor)
+
+    def difference(self, other, executor=None):
+        # Esta árvore perde as chaves que estão em other; other fica vazia
+        self._set_operation('difference', other, executor)
+
+    def _tree(self, root):
+        tree = type(self)(self.balance)
+        tree.root = self._finish(root)
+        return tree
+
+    def _finish(self, root):
+        # A raiz de uma árvore rubro-negra é sempre preta
+        return self._blacken(root) if self.balance == 'rb' else root
+
+    def _concatenate(self, other):
+        self.root = self._finish(self._join2(self.root, other.root))
+        self._snapshot = None
+        other.root = None
+        other._snapshot = None
+
+    def _set_operation(self, operation, other, executor):
+        if self.balance != other.balance:
+            raise ValueError("As árvores têm modos de balanceamento diferentes")
+        a, b = self.root, other.root
+        if self.balance is None:
+            # Sem balanceamento a altura não é limitada (nem a recursão): as chaves das duas árvores
+            # fundem-se por ordem em O(n + m) e o resultado é reconstruído balanceado
+            root = self._build_balanced(list(_merge_keys(operation, self._iter_inorder(a), self._iter_inorder(b))))
+        else:
+            if operation != 'difference' and self._size(a) < self._size(b):
+                # Simétricas: a recursão segue a árvore mais pequena e parte a maior
+                a, b = b, a
+            if (executor is not None and self._size(a) + self._size(b) >= 2 * PARALLEL_GRAIN
+                    and not isinstance((a or b).val, SEQUENTIAL_KEYS)):
+                tasks = 2 * (os.cpu_count() or 1)
+                root = self._fork(operation, a, b, executor, (tasks - 1).bit_length())()
+            else:
+                root = self._set(operation, a, b)
+        self.root = self._finish(root)
+        self._snapshot = None
+        other.root = None
+        other._snapshot = None
+
+    def _set(self, operation, a, b):
+        # Expõe a raiz de b, parte a por ela e resolve os dois lados independentemente; a recursão
+        # tem a profundidade de b, O(log m) nos modos balanceados
+        if a is None or b is None:
+            return _base(operation, a, b)
+        left, found, right = self._split(a, b.val)
+        b_left, b_right = b.left, b.right
+        return self._combine(operation, self._set(operation, left, b_left), b, found,
+                             self._set(operation, right, b_right))
+
+    def _fork(self, operation, a, b, executor, depth):
+        # Como _set, mas nos primeiros depth níveis os pares de subárvores vão para o executor; devolve
+        # uma função que espera pelos resultados e junta-os, para que todos sejam submetidos antes
+        if a is None or b is None:
+            result = _base(operation, a, b)
+            return lambda: result
+        if depth == 0 or self._size(a) + self._size(b) < PARALLEL_GRAIN:
+            return executor.submit(_set_operation_task, operation, self.balance, a, b).result
+        left, found, right = self._split(a, b.val)
+        b_left, b_right = b.left, b.right
+        left_result = self._fork(operation, left, b_left, executor, depth - 1)
+        right_result = self._fork(operation, right, b_right, executor, depth - 1)
+        return lambda: self._combine(operation, left_result(), b, found, right_result())
+
+    def _combine(self, operation, left, node, found, right):
+        # node é a raiz exposta de b; found é o nó de a com a mesma chave, ou None
+        if operation == 'union' or (operation == 'intersection' and found is not None):
+            return self._join(left, node, right)
+        return self._join2(left, right)
+
+    def _split(self, root, key):
+        # Devolve (chaves < key, nó com key ou None, chaves > key). Desce até key e, ao subir, junta
+        # cada nó do caminho com a subárvore que ficou do lado dele: O(log n) no total. No modo 'rb'
+        # as alturas pretas das subárvores saem da da raiz ao descer, e a de cada junção sai das
+        # alturas das partes (ver _joined_black), para nenhuma junção ter de as medir.
+        rb = self.balance == 'rb'
+        black = self._black_height(root) if rb else None
+        path = []
+        node = root
+        while node is not None and node.val != key:
+            left = key < node.val
+            if rb:
+                black -= node.color != RED
+            path.append((node, left, black))
+            node = node.left if left else node.right
+        if node is None:
+            left = right = None
+        else:
+            left, right = node.left, node.right
+            if rb:
+                black -= node.color != RED
+        left_black = right_black = black
+        for parent, went_left, child_black in reversed(path):
+            if went_left:
+                joined_black = self._joined_black(right, right_black, parent.right, child_black) if rb else None
+                right = self._join(right, parent, parent.right, right_black, child_black)
+                right_black = joined_black
+            else:
+                joined_black = self._joined_black(parent.left, child_black, left, left_black) if rb else None
+                left = self._join(parent.left, parent, left, child_black, left_black)
+                left_black = joined_black
+        return left, node, right
+
+    def _split_last(self, root):
+        # Devolve (árvore sem a maior chave, nó da maior chave, altura preta da primeira no modo 'rb'
+        # ou None), com as alturas pretas passadas às junções como em _split
+        rb = self.balance == 'rb'
+        black = self._black_height(root) if rb else None
+        path = []
+        node = root
+        while node.right is not None:
+            if rb:
+                black -= node.color != RED
+            path.append((node, black))
+            node = node.right
+        rest = node.left
+        if rb:
+            black -= node.color != RED
+        for parent, child_black in reversed(path):
+            joined_black = self._joined_black(parent.left, child_black, rest, black) if rb else None
+            rest = self._join(parent.left, parent, rest, child_black, black)
+            black = joined_black
+        return rest, node, black
+
+    def _join2(self, left, right):
+        # Junção sem nó do meio: usa a maior chave de left
+        if left is None:
+            return right
+        if right is None:
+            return left
+        left, last, left_black = self._split_last(left)
+        return self._join(left, last, right, left_black)
+
+    def _join(self, left, node, right, left_black=None, right_black=None):
+        # Todas as chaves de left < node.val < todas as de right. left_black e right_black são as
+        # alturas pretas de left e right, se quem chama já as souber (só usadas no modo 'rb')
+        node = self._own(node)
+        if self.balance == 'avl':
+            return self._avl_join(left, node, right)
+        if self.balance == 'rb':
+            return self._rb_join(left, node, right, left_black, right_black)
+        node.left, node.right = left, right
+        self._update(node)
+        return node
+
+    def _avl_join(self, left, node, right):
+        # Desce pela espinha direita da árvore mais alta (ou esquerda, se for right) até uma subárvore
+        # com altura no máximo uma acima da outra, pendura node aí e reequilibra ao subir
+        left_height, right_height = self._height(left), self._height(right)
+        path = []
+        if left_height > right_height + 1:
+            child = left
+            while self._height(child) > right_height + 1:
+                child = self._own(child)
+                path.append((child, False))
+                child = child.right
+            node.left, node.right = child, right
+        elif right_height > left_height + 1:
+            child = right
+            while self._height(child) > left_height + 1:
+                child = self._own(child)
+                path.append((child, True))
+                child = child.left
+            node.left, node.right = left, child
+        else:
+            node.left, node.right = left, right
+        self._update(node)
+        return self._rebuild_path(path, node, self._avl_rebalance)
+
+    def _rb_join(self, left, node, right, left_black=None, right_black=None):
+        # O mesmo com alturas pretas: node entra vermelho ao lado de uma subárvore preta com a altura
+        # preta da outra árvore e as violações corrigem-se ao subir como numa inserção. Os filhos
+        # direitos nunca são vermelhos, por isso cada passo na espinha direita desce um nível preto.
+        # Só se medem as alturas pretas que quem chama não passou (O(h) cada).
+        if left_black is None:
+            left_black = self._black_height(left)
+        if right_black is None:
+            right_black = self._black_height(right)
+        left_black += self._is_red(left)
+        right_black += self._is_red(right)
+        left, right = self._blacken(left), self._blacken(right)
+        node.color = RED
+        path = []
+        if left_black > right_black:
+            child = left
+            for _ in range(left_black - right_black):
+                child = self._own(child)
+                path.append((child, False))
+                child = child.right
+            node.left, node.right = child, right
+        elif right_black > left_black:
+            child, black = right, right_black
+            while child is not None and (self._is_red(child) or black > left_black):
+                black -= not self._is_red(child)
+                child = self._own(child)
+                path.append((child, True))
+                child = child.left
+            node.left, node.right = left, child
+        else:
+            node.left, node.right = left, right
+        self._update(node)
+        return self._rebuild_path(path, node, self._rb_fix_up)
+
+    def _blacken(self, node):
+        if self._is_red(node):
+            node = self._own(node)
+            node.color = BLACK
+        return node
+
+    def _joined_black(self, left, left_black, right, right_black):
+        # Altura preta de _join(left, node, right), lida antes da junção: as raízes vermelhas ficam
+        # pretas e node entra vermelho; as correções de cor e as rotações preservam o número de nós
+        # pretos em cada caminho, por isso a raiz do resultado pode ser vermelha, mas a altura é esta
+        return max(left_black + self._is_red(left), right_black + self._is_red(right))
+
+    def _black_height(self, node):
+        black = 0
+        while node is not None:
+            black += node.color != RED
+            node = node.left
+        return black
+
+    # Travessias preguiçosas: produzem os valores sob demanda usando O(h) de memória
+
+    def iter_inorder(self):
+        return self._iter_inorder(self.root)
+
+    def _iter_inorder(self, node):
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.val
+            node = node.right
+
+    def iter_preorder(self):
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.val
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        stack = []
+        last = None
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                last = stack.pop()
+                yield last.val
+
+    def iter_levelorder(self):
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield node.val
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def inorder(self):
+        return list(self.iter_inorder())
+
+    def preorder(self):
+        return list(self.iter_preorder())
+
+    def postorder(self):
+        return list(self.iter_postorder())
+
+    def levelorder(self):
+        return list(self.iter_levelorder())
+
+def _base(operation, a, b):
+    # Resultado de uma operação de conjunto quando uma das árvores está vazia
+    if operation == 'union':
+        return a if b is None else b
+    return None if operation == 'intersection' else a
+
+
+def _set_operation_task(operation, balance, a, b):
+    # Corre num processo do executor: as subárvores chegam e o resultado volta por pickle
+    return BinaryTree(balance)._set(operation, a, b)
+
+
+_END = object()
+
+
+def _merge_keys(operation, first, second):
+    # Funde duas sequências estritamente crescentes segundo a operação de conjunto
+    a, b = next(first, _END), next(second, _END)
+    while a is not _END and b is not _END:
+        if a < b:
+            if operation != 'intersection':
+                yield a
+            a = next(first, _END)
+        elif b < a:
+            if operation == 'union':
+                yield b
+            b = next(second, _END)
+        else:
+            if operation != 'difference':
+                yield a
+            a, b = next(first, _END), next(second, _END)
+    if a is not _END and operation != 'intersection':
+        yield a
+        yield from first
+    if b is not _END and operation == 'union':
+        yield b
+        yield from second
+
+class PooledTreeNode:
+    # Vista leve de uma posição do pool, com a mesma interface de TreeNode (val/left/right)
+    __slots__ = ('pool', 'index')
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    def _view(self, index):
+        return PooledTreeNode(self.pool, index) if index != -1 else None
+
+    @property
+    def val(self):
+        return self.pool.values[self.index]
+
+    @property
+    def left(self):
+        return self._view(self.pool.lefts[self.index])
+
+    @property
+    def right(self):
+        return self._view(self.pool.rights[self.index])
+
+class ArrayBinaryTree:
+    # Árvore de busca de inteiros guardada em arrays paralelos values/lefts/rights (-1 = nenhum
+    # filho), com 24 bytes por elemento. Índices libertados formam uma lista livre encadeada por
+    # lefts. Não tem modos balanceados.
+    def __init__(self):
+        self.values = array('q')
+        self.lefts = array('q')
+        self.rights = array('q')
+        self.root_index = -1
+        self.free = -1
+        self.size = 0
+        # Snapshot das chaves para search_many; descartado em _alloc e _release
+        self._snapshot = None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def root(self):
+        return PooledTreeNode(self, self.root_index) if self.root_index != -1 else None
+
+    def save(self, path):
+        # Snapshot binário (ver simuladores.core.storage)
+        from .storage import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path):
+        from .storage import load
+        return load(cls, path)
+
+    def _alloc(self, key):
+        if self.free != -1:
+            index = self.free
+            self.free = self.lefts[index]
+            self.values[index] = key
+            self.lefts[index] = -1
+            self.rights[index] = -1
+        else:
+            index = len(self.values)
+            self.values.append(key)
+            self.lefts.append(-1)
+            self.rights.append(-1)
+        self.size += 1
+        self._snapshot = None
+        return index
+
+    def _release(self, index):
+        self.lefts[index] = self.free
+        self.free = index
+        self.size -= 1
+        self._snapshot = None
+
+    def insert(self, key):
+        if self.root_index == -1:
+            self.root_index = self._alloc(key)
+            return
+        values, lefts, rights = self.values, self.lefts, self.rights
+        index = self.root_index
+        while True:
+            if key < values[index]:
+                if lefts[index] == -1:
+                    lefts[index] = self._alloc(key)
+                    return
+                index = lefts[index]
+            elif key > values[index]:
+                if rights[index] == -1:
+                    rights[index] = self._alloc(key)
+                    return
+                index = rights[index]
+            else:
+                return
+
+    def delete(self, key):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        parent = -1
+        index = self.root_index
+        while index != -1 and values[index] != key:
+            parent = index
+            index = lefts[index] if key < values[index] else rights[index]
+        if index == -1:
+            raise ValueError(f"O valor {key} não foi encontrado na árvore")
+        if lefts[index] != -1 and rights[index] != -1:
+            parent = index
+            successor = rights[index]
+            while lefts[successor] != -1:
+                parent = successor
+                successor = lefts[successor]
+            values[index] = values[successor]
+            index = successor
+        child = lefts[index] if lefts[index] != -1 else rights[index]
+        if parent == -1:
+            self.root_index = child
+        elif lefts[parent] == index:
+            lefts[parent] = child
+        else:
+            rights[parent] = child
+        self._release(index)
+
+    def search(self, key):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        index = self.root_index
+        while index != -1 and values[index] != key:
+            index = lefts[index] if key < values[index] else rights[index]
+        return PooledTreeNode(self, index) if index != -1 else None
+
+    def search_many(self, keys):
+        # Como BinaryTree.search_many; as posições livres dos arrays ficam fora do snapshot
+        if self._snapshot is None:
+            self._snapshot = Snapshot(array('q', self.iter_inorder()))
+        return self._snapshot.contains(keys)
+
+    def iter_inorder(self):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        stack = []
+        index = self.root_index
+        while stack or index != -1:
+            while index != -1:
+                stack.append(index)
+                index = lefts[index]
+            index = stack.pop()
+            yield values[index]
+            index = rights[index]
+
+    def iter_preorder(self):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        stack = [self.root_index] if self.root_index != -1 else []
+        while stack:
+            index = stack.pop()
+            yield values[index]
+            if rights[index] != -1:
+                stack.append(rights[index])
+            if lefts[index] != -1:
+                stack.append(lefts[index])
+
+    def iter_postorder(self):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        stack = []
+        last = -1
+        index = self.root_index
+        while stack or index != -1:
+            while index != -1:
+                stack.append(index)
+                index = lefts[index]
+            top = stack[-1]
+            if rights[top] != -1 and rights[top] != last:
+                index = rights[top]
+            else:
+                last = stack.pop()
+                yield values[last]
+
+    def iter_levelorder(self):
+        values, lefts, rights = self.values, self.lefts, self.rights
+        queue = deque([self.root_index] if self.root_index != -1 else [])
+        while queue:
+            index = queue.popleft()
+            yield values[index]
+            if lefts[index] != -1:
+                queue.append(lefts[index])
+            if rights[index] != -1:
+                queue.append(rights[index])
+
+    def inorder(self):
+        return list(self.iter_inorder())
+
+    def preorder(self):
+        return list(self.iter_preorder())
+
+    def postorder(self):
+        return list(self.iter_postorder())
+
+    def levelorder(self):
+        return list(self.iter_levelorder())
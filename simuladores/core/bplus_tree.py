@@ -0,0 +1,329 @@
+"""
+Árvore B+ de inteiros (BPlusTree): cada nó guarda até fanout - 1 chaves num array('q') contíguo, as
+chaves ficam todas nas folhas e as folhas estão ligadas por ordem, por isso percorrer ou ler um
+intervalo é seguir a cadeia de folhas sem voltar a descer. Tem a interface insert/delete/search/inorder
+da BinaryTree. As subclasses com LINKED_LEAVES = False (a PersistentBPlusTree) não mantêm next e passam
+de uma folha à seguinte subindo pelo caminho desde a raiz. Não depende de Tkinter.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Filhos por nó interno quando não é indicado outro valor
+DEFAULT_FANOUT = 64
+
+class BPlusNode:
+    # children é None nas folhas. Num nó interno keys[i] é a menor chave que pode existir em
+    # children[i + 1]; numa folha next é a folha seguinte. layout é o cache do desenho da aplicação.
+    __slots__ = ('keys', 'children', 'next', 'layout')
+
+    def __init__(self, keys, children=None):
+        self.keys = keys
+        self.children = children
+        self.next = None
+        self.layout = None
+
+    def is_leaf(self):
+        return self.children is None
+
+    def copy(self):
+        # Cópia das chaves e da lista de filhos (os filhos são partilhados), usada pela
+        # PersistentBPlusTree, que não liga as folhas; next fica por ligar
+        node = BPlusNode(array('q', self.keys), None if self.children is None else list(self.children))
+        node.layout = self.layout
+        return node
+
+class BPlusTree:
+    # Operações cronometradas quando há métricas (ver simuladores.core.metrics)
+    INSTRUMENTED = ('insert', 'delete', 'search', 'inorder')
+    # Se as folhas estão ligadas por next
+    LINKED_LEAVES = True
+
+    def __init__(self, fanout=DEFAULT_FANOUT, metrics=None):
+        # fanout: número máximo de filhos de um nó interno (e de chaves + 1 de uma folha). Todos os
+        # nós exceto a raiz ficam com pelo menos (fanout - 1) // 2 chaves.
+        if fanout < 3:
+            raise ValueError("O fanout tem de ser pelo menos 3")
+        self.fanout = fanout
+        self.max_keys = fanout - 1
+        self.min_keys = (fanout - 1) // 2
+        self.root = None
+        self.size = 0
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'altura', self.height)
+
+    def __len__(self):
+        return self.size
+
+    def height(self):
+        height, node = 0, self.root
+        while node is not None:
+            height += 1
+            node = node.children[0] if node.children is not None else None
+        return height
+
+    def _count(self, hops, comparisons, allocations=0):
+        # Só é chamado com métricas ligadas
+        self.metrics.hops += hops
+        self.metrics.comparisons += comparisons
+        self.metrics.allocations += allocations
+
+    @classmethod
+    def from_sorted(cls, keys, fanout=DEFAULT_FANOUT):
+        # Constrói em O(n) de baixo para cima a partir de chaves estritamente crescentes: as folhas
+        # ficam cheias (com as chaves repartidas por igual, para nenhuma ficar abaixo do mínimo) e
+        # cada nível interno agrupa o de baixo da mesma maneira
+        tree = cls(fanout)
+        keys = keys if isinstance(keys, array) and keys.typecode == 'q' else array('q', keys)
+        if not keys:
+            return tree
+        level = [BPlusNode(keys[start:stop]) for start, stop in _spread(len(keys), tree.max_keys)]
+        if cls.LINKED_LEAVES:
+            for leaf, following in zip(level, level[1:]):
+                leaf.next = following
+        lows = [leaf.keys[0] for leaf in level]
+        while len(level) > 1:
+            parents, parent_lows = [], []
+            for start, stop in _spread(len(level), fanout):
+                parents.append(BPlusNode(array('q', lows[start + 1:stop]), level[start:stop]))
+                parent_lows.append(lows[start])
+            level, lows = parents, parent_lows
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys, fanout=DEFAULT_FANOUT):
+        return cls.from_sorted(sorted(set(keys)), fanout)
+
+    def _descend(self, key):
+        # Caminho (nó, índice do filho seguido) da raiz até a folha onde key está ou ficaria
+        path = []
+        node = self.root
+        while node.children is not None:
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+        if self.metrics is not None:
+            self._count(len(path), len(path) + 1)
+        return path, node
+
+    def insert(self, key):
+        if self.root is None:
+            self.root = BPlusNode(array('q', (key,)))
+            self.size = 1
+            if self.metrics is not None:
+                self._count(0, 0, 1)
+            return
+        path, node = self._descend(key)
+        keys = node.keys
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            # Se o valor já existir, não fazer nada (evitar duplicados)
+            return
+        keys.insert(index, key)
+        self.size += 1
+        node.layout = None
+        # Divide os nós cheios de baixo para cima; cada divisão acrescenta uma chave ao pai
+        splits = 0
+        while len(node.keys) > self.max_keys:
+            separator, right = self._split(node)
+            splits += 1
+            if not path:
+                self.root = BPlusNode(array('q', (separator,)), [node, right])
+                splits += 1
+                break
+            node, index = path.pop()
+            node.keys.insert(index, separator)
+            node.children.insert(index + 1, right)
+            node.layout = None
+        for node, _ in path:
+            node.layout = None
+        if self.metrics is not None:
+            self._count(0, 0, splits)
+
+    def _split(self, node):
+        # Passa a metade de cima de node para um novo nó à direita; devolve (separador, novo nó)
+        keys = node.keys
+        half = len(keys) // 2
+        if node.children is None:
+            right = BPlusNode(keys[half:])
+            del keys[half:]
+            if self.LINKED_LEAVES:
+                right.next, node.next = node.next, right
+            return right.keys[0], right
+        # Num nó interno a chave do meio sobe para o pai
+        separator = keys[half]
+        right = BPlusNode(keys[half + 1:], node.children[half + 1:])
+        del keys[half:]
+        del node.children[half + 1:]
+        return separator, right
+
+    def delete(self, key):
+        if self.root is not None:
+            path, node = self._descend(key)
+            index = bisect_left(node.keys, key)
+        if self.root is None or index == len(node.keys) or node.keys[index] != key:
+            raise ValueError(f"O valor {key} não foi encontrado na árvore")
+        del node.keys[index]
+        self.size -= 1
+        node.layout = None
+        # Os separadores iguais à chave removida continuam válidos (só delimitam os filhos). Um nó com
+        # menos chaves que o mínimo pede uma a um irmão ou junta-se a ele, e o pai perde um separador.
+        while path and len(node.keys) < self.min_keys:
+            parent, index = path.pop()
+            self._fill(parent, index)
+            node = parent
+        for parent, _ in path:
+            parent.layout = None
+        root = self.root
+        if root.children is not None and not root.keys:
+            self.root = root.children[0]
+        elif root.children is None and not root.keys:
+            self.root = None
+
+    def _fill(self, parent, index):
+        # parent.children[index] ficou abaixo do mínimo
+        node = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+        parent.layout = None
+        for sibling in (left, right):
+            if sibling is not None:
+                sibling.layout = None
+        leaf = node.children is None
+        if left is not None and len(left.keys) > self.min_keys:
+            if leaf:
+                node.keys.insert(0, left.keys.pop())
+                parent.keys[index - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[index - 1])
+                parent.keys[index - 1] = left.keys.pop()
+                node.children.insert(0, left.children.pop())
+        elif right is not None and len(right.keys) > self.min_keys:
+            if leaf:
+                node.keys.append(right.keys.pop(0))
+                parent.keys[index] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[index])
+                parent.keys[index] = right.keys.pop(0)
+                node.children.append(right.children.pop(0))
+        else:
+            # Junta o nó da direita ao da esquerda
+            if left is None:
+                left, node, index = node, right, index + 1
+            if not leaf:
+                left.keys.append(parent.keys[index - 1])
+                left.children.extend(node.children)
+            left.keys.extend(node.keys)
+            if self.LINKED_LEAVES:
+                left.next = node.next
+            del parent.keys[index - 1]
+            del parent.children[index]
+
+    def search(self, key):
+        # Folha que contém key, ou None
+        leaf = self.root
+        if leaf is None:
+            return None
+        hops = 0
+        while leaf.children is not None:
+            leaf = leaf.children[bisect_right(leaf.keys, key)]
+            hops += 1
+        if self.metrics is not None:
+            self._count(hops, hops + 1)
+        index = bisect_left(leaf.keys, key)
+        return leaf if index < len(leaf.keys) and leaf.keys[index] == key else None
+
+    def search_path(self, key):
+        # Nós visitados por search(key), da raiz até a folha; produzidos sob demanda (usado pelas
+        # animações das aplicações) e sem contar para as métricas
+        node = self.root
+        while node is not None:
+            yield node
+            node = node.children[bisect_right(node.keys, key)] if node.children is not None else None
+
+    def first_leaf(self):
+        node = self.root
+        while node is not None and node.children is not None:
+            node = node.children[0]
+        return node
+
+    def _leaves_from(self, path, leaf):
+        # Folhas por ordem a partir de leaf, a que se chegou por path (caminho como o de _descend): segue
+        # next ou, sem folhas ligadas, sobe pelo caminho até o primeiro nó com um filho seguinte e desce
+        # pela esquerda desse filho (O(1) nós amortizado por folha)
+        if self.LINKED_LEAVES:
+            while leaf is not None:
+                yield leaf
+                leaf = leaf.next
+            return
+        while True:
+            yield leaf
+            while path and path[-1][1] + 1 == len(path[-1][0].children):
+                path.pop()
+            if not path:
+                return
+            node, index = path.pop()
+            path.append((node, index + 1))
+            leaf = node.children[index + 1]
+            while leaf.children is not None:
+                path.append((leaf, 0))
+                leaf = leaf.children[0]
+
+    def iter_leaves(self):
+        path, node = [], self.root
+        if node is None:
+            return
+        while node.children is not None:
+            path.append((node, 0))
+            node = node.children[0]
+        yield from self._leaves_from(path, node)
+
+    def range(self, lo, hi):
+        # Chaves em [lo, hi] por ordem: desce uma vez até a folha de lo e segue pelas folhas seguintes,
+        # copiando de cada uma a fatia do intervalo
+        if self.root is None or hi < lo:
+            return
+        path, leaf = self._descend(lo)
+        start = bisect_left(leaf.keys, lo)
+        for leaf in self._leaves_from(path, leaf):
+            stop = bisect_right(leaf.keys, hi)
+            yield from leaf.keys[start:stop]
+            if stop < len(leaf.keys):
+                return
+            start = 0
+
+    def count_range(self, lo, hi):
+        # Número de chaves em [lo, hi]; as folhas inteiramente dentro do intervalo contam-se pelo tamanho
+        if self.root is None or hi < lo:
+            return 0
+        path, leaf = self._descend(lo)
+        count = -bisect_left(leaf.keys, lo)
+        for leaf in self._leaves_from(path, leaf):
+            if leaf.keys[-1] > hi:
+                return count + bisect_right(leaf.keys, hi)
+            count += len(leaf.keys)
+        return count
+
+    def iter_inorder(self):
+        for leaf in self.iter_leaves():
+            yield from leaf.keys
+
+    def inorder(self):
+        values = array('q')
+        for leaf in self.iter_leaves():
+            values.extend(leaf.keys)
+        return values.tolist()
+
+
+def _spread(count, per_group):
+    # Divide count elementos no menor número de grupos de até per_group, com tamanhos que diferem no
+    # máximo de 1; devolve os intervalos (início, fim)
+    groups = -(-count // per_group)
+    size, extra = divmod(count, groups)
+    start = 0
+    for group in range(groups):
+        stop = start + size + (group < extra)
+        yield start, stop
+        start = stop
@@ -0,0 +1,215 @@
+"""
+Variantes seguras para várias threads: ConcurrentStack, uma pilha de Treiber sobre a cadeia de Node
+de simplificado.Stack, e ConcurrentLinkedList, uma lista encadeada com um lock por nó percorrida de
+mão em mão (hand-over-hand). Não depende de Tkinter.
+
+Python não expõe compare-and-swap; a pilha emula-o com um lock que protege só a troca do ponteiro do
+topo, por isso a construção dos nós e as tentativas falhadas acontecem fora de qualquer secção crítica.
+Como os nós nunca são reutilizados enquanto alguém os referencia, não há o problema ABA.
+"""
+import threading
+
+from .simplificado import Node
+
+class ConcurrentStack:
+    def __init__(self):
+        self.top = None
+        self._cas_lock = threading.Lock()
+        # Número de CAS falhados (contenção); é só uma estatística, atualizada sem lock
+        self.retries = 0
+
+    def _compare_and_set(self, expected, new):
+        with self._cas_lock:
+            if self.top is expected:
+                self.top = new
+                return True
+            return False
+
+    def push(self, value):
+        node = Node(value)
+        while True:
+            node.next = self.top
+            if self._compare_and_set(node.next, node):
+                return
+            self.retries += 1
+
+    def push_many(self, values):
+        # Liga a cadeia toda fora do lock e publica-a com um único CAS
+        first = last = None
+        for value in values:
+            node = Node(value)
+            node.next = first
+            first = node
+            if last is None:
+                last = node
+        if first is None:
+            return
+        while True:
+            last.next = self.top
+            if self._compare_and_set(last.next, first):
+                return
+            self.retries += 1
+
+    def pop(self):
+        while True:
+            top = self.top
+            if top is None:
+                raise IndexError("Remover de uma pilha vazia")
+            if self._compare_and_set(top, top.next):
+                return top.data
+            self.retries += 1
+
+    def peek(self):
+        top = self.top
+        if top is None:
+            raise IndexError("Ver elemento no topo")
+        return top.data
+
+    def is_empty(self):
+        return self.top is None
+
+class LockedNode:
+    __slots__ = ('value', 'next', 'lock')
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.lock = threading.Lock()
+
+class ConcurrentLinkedList:
+    # Cada operação segura no máximo dois locks de nós adjacentes, adquiridos sempre da cabeça para a
+    # cauda (sem deadlocks), por isso threads em posições diferentes da lista avançam em paralelo.
+    # As posições seguem a LinkedList: inserir aceita 0..size, remover em size não faz nada.
+    def __init__(self):
+        self.head = LockedNode(None)  # Sentinela: o primeiro elemento é head.next
+        self._size = 0
+        self._size_lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def _add_size(self, delta):
+        with self._size_lock:
+            self._size += delta
+
+    def _lock_predecessor(self, position):
+        # Devolve, com o lock adquirido, o nó na posição position - 1 (a sentinela para 0)
+        if position < 0:
+            raise IndexError("Posição fora dos limites")
+        pred = self.head
+        pred.lock.acquire()
+        for _ in range(position):
+            current = pred.next
+            if current is None:
+                pred.lock.release()
+                raise IndexError("Posição fora dos limites")
+            current.lock.acquire()
+            pred.lock.release()
+            pred = current
+        return pred
+
+    def insert_at_position(self, value, position):
+        new_node = LockedNode(value)
+        pred = self._lock_predecessor(position)
+        try:
+            new_node.next = pred.next
+            pred.next = new_node
+        finally:
+            pred.lock.release()
+        self._add_size(1)
+
+    def insert_at_start(self, value):
+        self.insert_at_position(value, 0)
+
+    def append(self, value):
+        new_node = LockedNode(value)
+        pred = self.head
+        pred.lock.acquire()
+        while pred.next is not None:
+            current = pred.next
+            current.lock.acquire()
+            pred.lock.release()
+            pred = current
+        pred.next = new_node
+        pred.lock.release()
+        self._add_size(1)
+
+    def remove_at_position(self, position):
+        pred = self._lock_predecessor(position)
+        try:
+            victim = pred.next
+            if victim is None:
+                return
+            # Espera que quem ainda segura o nó removido saia dele antes de o desligar
+            with victim.lock:
+                pred.next = victim.next
+        finally:
+            pred.lock.release()
+        self._add_size(-1)
+
+    def remove_first(self):
+        self.remove_at_position(0)
+
+    def remove_last(self):
+        pred = self.head
+        pred.lock.acquire()
+        current = pred.next
+        if current is None:
+            pred.lock.release()
+            return
+        current.lock.acquire()
+        while current.next is not None:
+            following = current.next
+            following.lock.acquire()
+            pred.lock.release()
+            pred, current = current, following
+        pred.next = None
+        current.lock.release()
+        pred.lock.release()
+        self._add_size(-1)
+
+    def find_value(self, value):
+        pred = self.head
+        pred.lock.acquire()
+        position = 0
+        current = pred.next
+        while current is not None:
+            current.lock.acquire()
+            pred.lock.release()
+            if current.value == value:
+                current.lock.release()
+                return position
+            pred, current = current, current.next
+            position += 1
+        pred.lock.release()
+        return -1
+
+    def find_position(self, position):
+        # Uma posição negativa devolve a cabeça, como LinkedList.find_position
+        position = max(position, 0)
+        try:
+            pred = self._lock_predecessor(position)
+        except IndexError:
+            return None
+        current = pred.next
+        value = current.value if current is not None else None
+        pred.lock.release()
+        return value
+
+    def to_list(self):
+        values = []
+        pred = self.head
+        pred.lock.acquire()
+        current = pred.next
+        while current is not None:
+            current.lock.acquire()
+            pred.lock.release()
+            values.append(current.value)
+            pred, current = current, current.next
+        pred.lock.release()
+        return values
+
+    def display(self):
+        for value in self.to_list():
+            print(value, end=" -> ")
+        print("Nenhum")
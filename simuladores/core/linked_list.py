@@ -0,0 +1,624 @@
+"""
+Listas encadeadas: LinkedList (com modos duplamente encadeado, skip list e índice de valores
+opcionais) e ArrayLinkedList, guardada em arrays paralelos. Não depende de Tkinter.
+
+Posições: insert_at_position e remove_at_position levantam IndexError("Posição fora dos limites") para
+posições negativas ou maiores que o tamanho (antes uma posição negativa alterava o nó a seguir à
+cabeça e size + 1 falhava com AttributeError); remove_at_position(size) continua a não fazer nada.
+find_position devolve None fora da lista e, como sempre, o valor da cabeça para posições negativas.
+"""
+import random
+from array import array
+
+from .batch import Snapshot
+
+class Node:
+    __slots__ = ('value', 'next', 'prev', 'levels')
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None  # Só é mantido no modo duplamente encadeado
+        self.levels = None  # Faixas expressas [próximo, largura] do modo skip list (níveis 1 em diante)
+
+# Altura máxima das faixas expressas da skip list (suficiente para 2**32 elementos)
+MAX_SKIP_LEVELS = 32
+
+class LinkedList:
+    # Operações cronometradas quando há métricas (ver simuladores.core.metrics)
+    INSTRUMENTED = ('append', 'extend', 'insert_at_start', 'insert_at_position', 'remove_first', 'remove_last',
+                    'remove_at_position', 'find_value', 'find_values', 'find_position')
+
+    def __init__(self, doubly=False, skiplist=False, value_index=False, metrics=None):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.doubly = doubly
+        # Último acesso posicional (posição, nó): acessos sequenciais continuam a partir dele
+        self._cursor = None
+        # Com skiplist=True, faixas expressas sobre a própria cadeia de nós dão acesso posicional
+        # em O(log n) esperado; _skip guarda as faixas do cabeçalho (posição -1).
+        # Com value_index=True, um dicionário valor -> lista dos nós com esse valor, pela ordem da lista
+        # (~130 bytes por valor distinto e 8 por ocorrência), responde a pertença em O(1); find_value
+        # calcula pelas faixas a posição da primeira ocorrência em O(log n) esperado, por isso liga
+        # também skiplist. Inserir ou remover a meio custa O(log k · log n) comparações de posições,
+        # mais a deslocação em C da lista das k ocorrências do valor.
+        self.skiplist = skiplist or value_index
+        self._skip = []
+        self._index = {} if value_index else None
+        # Snapshot dos valores para find_values; descartado a cada inserção ou remoção
+        self._snapshot = None
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'tamanho', self.__len__)
+
+    def __len__(self):
+        return self.size
+
+    def save(self, path):
+        # Snapshot binário (ver simuladores.core.storage)
+        from .storage import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path, **options):
+        from .storage import load
+        return load(cls, path, **options)
+
+    def __contains__(self, value):
+        if self._index is not None:
+            return value in self._index
+        return self.find_value(value) != -1
+
+    def _on_insert(self, node, position):
+        # Atualiza os índices opcionais; chamado antes de alterar size. O índice de valores é
+        # atualizado primeiro, enquanto as faixas ainda descrevem a lista sem o novo nó.
+        self._snapshot = None
+        if self.metrics is not None:
+            self.metrics.allocations += 1
+        if self._index is not None:
+            nodes = self._index.get(node.value)
+            if nodes is None:
+                self._index[node.value] = [node]
+            else:
+                nodes.insert(self._index_slot(nodes, position), node)
+        if self.skiplist:
+            self._skip_insert(node, position)
+
+    def _on_remove(self, node, position):
+        self._snapshot = None
+        if self._index is not None:
+            nodes = self._index[node.value]
+            if len(nodes) == 1:
+                del self._index[node.value]
+            elif nodes[-1] is node:
+                nodes.pop()
+            else:
+                del nodes[self._index_slot(nodes, position)]
+        if self.skiplist:
+            self._skip_remove(node, position)
+
+    def _index_slot(self, nodes, position):
+        # Índice, na lista ordenada nodes, da primeira ocorrência em position ou depois dela. As
+        # inserções e remoções nas pontas (append, insert_at_start, remove_first, remove_last) não
+        # precisam de calcular posições.
+        if position >= self.size or position <= 0:
+            return len(nodes) if position >= self.size else 0
+        if self._position_of(nodes[-1]) < position:
+            return len(nodes)
+        low, high = 0, len(nodes) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._position_of(nodes[middle]) < position:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _node_at(self, position):
+        # Pressupõe 0 <= position < size
+        if position == self.size - 1:
+            return self.tail
+        if self.skiplist:
+            _, current, start = self._skip_find(position + 1)
+            if current is None:
+                current, start = self.head, 0
+            for _ in range(position - start):
+                current = current.next
+            if self.metrics is not None:
+                self.metrics.hops += position - start
+            return current
+        start, current = 0, self.head
+        if self._cursor is not None and self._cursor[0] <= position:
+            start, current = self._cursor
+        if self.doubly and self.size - 1 - position < position - start:
+            current = self.tail
+            hops = self.size - 1 - position
+            for _ in range(hops):
+                current = current.prev
+        else:
+            hops = position - start
+            for _ in range(hops):
+                current = current.next
+        if self.metrics is not None:
+            self.metrics.hops += hops
+        self._cursor = (position, current)
+        return current
+
+    def _shift_cursor(self, position, delta):
+        # Ajusta o cursor após uma inserção (delta=1) ou remoção (delta=-1) em position
+        if self._cursor is None or self._cursor[0] < position:
+            return
+        if delta < 0 and self._cursor[0] == position:
+            self._cursor = None
+        else:
+            self._cursor = (self._cursor[0] + delta, self._cursor[1])
+
+    def _skip_find(self, position):
+        # Para cada nível, o último nó expresso (None = cabeçalho) antes de position e a sua posição
+        update = [None] * len(self._skip)
+        node, pos = None, -1
+        hops = 0
+        for lvl in range(len(self._skip) - 1, -1, -1):
+            while True:
+                nxt, width = (self._skip if node is None else node.levels)[lvl]
+                if nxt is None or pos + width >= position:
+                    break
+                node, pos = nxt, pos + width
+                hops += 1
+            update[lvl] = (node, pos)
+        if self.metrics is not None:
+            self.metrics.hops += hops
+        return update, node, pos
+
+    def _skip_insert(self, new_node, position):
+        # Chamado com o tamanho anterior à inserção
+        height = 0
+        while height < MAX_SKIP_LEVELS and random.random() < 0.5:
+            height += 1
+        while len(self._skip) < height:
+            self._skip.append([None, self.size + 1])
+        update, _, _ = self._skip_find(position)
+        if height:
+            new_node.levels = []
+        for lvl, (pred, pred_pos) in enumerate(update):
+            links = self._skip if pred is None else pred.levels
+            if lvl < height:
+                nxt, width = links[lvl]
+                new_node.levels.append([nxt, pred_pos + width + 1 - position])
+                links[lvl] = [new_node, position - pred_pos]
+            else:
+                links[lvl][1] += 1
+
+    def _skip_remove(self, node, position):
+        # Chamado com o tamanho anterior à remoção
+        update, _, _ = self._skip_find(position)
+        for lvl, (pred, _) in enumerate(update):
+            links = self._skip if pred is None else pred.levels
+            if links[lvl][0] is node:
+                nxt, width = node.levels[lvl]
+                links[lvl] = [nxt, links[lvl][1] + width - 1]
+            else:
+                links[lvl][1] -= 1
+        while self._skip and self._skip[-1][0] is None:
+            self._skip.pop()
+
+    def append(self, value):
+        new_node = Node(value)
+        self._on_insert(new_node, self.size)
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+            if self.doubly:
+                new_node.prev = self.tail
+        self.tail = new_node
+        self.size += 1
+
+    def extend(self, values):
+        # Liga todos os nós numa única passagem a partir da cauda
+        if self.skiplist:
+            for value in values:
+                self.append(value)
+            return
+        self._snapshot = None
+        tail = self.tail
+        added = 0
+        for value in values:
+            new_node = Node(value)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+                if self.doubly:
+                    new_node.prev = tail
+            tail = new_node
+            added += 1
+        self.tail = tail
+        self.size += added
+        if self.metrics is not None:
+            self.metrics.allocations += added
+
+    def splice(self, other):
+        # Move os nós de outra LinkedList para o fim desta e deixa-a vazia. Em O(1) quando nenhuma
+        # tem faixas de skip list (nem índice de valores) e other mantém os prev de que esta precisa;
+        # senão custa o mesmo que extend. Serve para anexar uma lista construída noutra thread.
+        if other is self:
+            raise ValueError("Não é possível juntar uma lista a si própria")
+        if other.head is None:
+            return
+        if self.skiplist or other.skiplist or (self.doubly and not other.doubly):
+            def values():
+                current = other.head
+                while current:
+                    yield current.value
+                    current = current.next
+            self.extend(values())
+        else:
+            self._snapshot = None
+            if self.tail is None:
+                self.head = other.head
+            else:
+                self.tail.next = other.head
+                if self.doubly:
+                    other.head.prev = self.tail
+            self.tail = other.tail
+            self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+        other._cursor = None
+        other._skip = []
+        other._snapshot = None
+        if other._index is not None:
+            other._index = {}
+
+    def insert_at_start(self, value):
+        new_node = Node(value)
+        self._on_insert(new_node, 0)
+        new_node.next = self.head
+        if self.doubly and self.head:
+            self.head.prev = new_node
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
+        self._shift_cursor(0, 1)
+
+    def insert_at_position(self, value, position):
+        if position < 0 or position > self.size:
+            raise IndexError("Posição fora dos limites")
+        if position == 0:
+            self.insert_at_start(value)
+            return
+        if position == self.size:
+            self.append(value)
+            return
+        current = self._node_at(position - 1)
+        new_node = Node(value)
+        self._on_insert(new_node, position)
+        new_node.next = current.next
+        current.next = new_node
+        if self.doubly:
+            new_node.prev = current
+            new_node.next.prev = new_node
+        self.size += 1
+        self._shift_cursor(position, 1)
+
+    def remove_first(self):
+        if self.head:
+            self._on_remove(self.head, 0)
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            elif self.doubly:
+                self.head.prev = None
+            self.size -= 1
+            self._shift_cursor(0, -1)
+
+    def remove_last(self):
+        if not self.head:
+            return
+        if not self.head.next:
+            self._on_remove(self.head, 0)
+            self.head = self.tail = None
+            self.size = 0
+            self._cursor = None
+            self._skip = []
+            return
+        self._shift_cursor(self.size - 1, -1)
+        self._on_remove(self.tail, self.size - 1)
+        if self.doubly:
+            current = self.tail.prev
+        else:
+            current = self._node_at(self.size - 2)
+        current.next = None
+        self.tail = current
+        self.size -= 1
+
+    def remove_at_position(self, position):
+        # Remover na posição igual ao tamanho não faz nada, como antes
+        if position < 0 or position > self.size:
+            raise IndexError("Posição fora dos limites")
+        if position == 0:
+            self.remove_first()
+            return
+        if position == self.size:
+            return
+        if position == self.size - 1:
+            self.remove_last()
+            return
+        current = self._node_at(position - 1)
+        self._on_remove(current.next, position)
+        current.next = current.next.next
+        if self.doubly:
+            current.next.prev = current
+        self.size -= 1
+        self._shift_cursor(position, -1)
+
+    def _position_of(self, node):
+        # Posição de um nó sem partir da cabeça: segue a faixa mais alta de cada nó (a cadeia next
+        # quando não tem faixas) até sair da lista; as larguras somam a distância até ao fim. Cada
+        # faixa leva a um nó pelo menos tão alto, por isso são O(log n) saltos esperados.
+        distance = hops = 0
+        while node is not None:
+            if node.levels:
+                node, width = node.levels[-1]
+            else:
+                node, width = node.next, 1
+            distance += width
+            hops += 1
+        if self.metrics is not None:
+            self.metrics.hops += hops
+        return self.size - distance
+
+    def find_value(self, value):
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if self.metrics is not None:
+                self.metrics.comparisons += 1
+            return self._position_of(nodes[0]) if nodes else -1
+        current = self.head
+        position = 0
+        while current:
+            if current.value == value:
+                break
+            current = current.next
+            position += 1
+        if self.metrics is not None:
+            self.metrics.hops += position
+            self.metrics.comparisons += position + (current is not None)
+        return position if current is not None else -1
+
+    def find_values(self, values):
+        # find_value para um lote de valores de uma só vez (array de inteiros com NumPy, lista sem
+        # ele). O snapshot custa O(n) e é reaproveitado até a lista ser alterada.
+        if self._snapshot is None:
+            values_in_order = []
+            current = self.head
+            while current:
+                values_in_order.append(current.value)
+                current = current.next
+            self._snapshot = Snapshot(values_in_order)
+        return self._snapshot.find(values)
+
+    def node_at(self, position):
+        # Nó na posição indicada (pelas faixas ou pelo cursor, como find_position); serve para
+        # começar a percorrer a cadeia a meio, por exemplo na parte visível do desenho
+        if position < 0 or position >= self.size:
+            raise IndexError("Posição fora dos limites")
+        return self._node_at(position)
+
+    def find_position(self, position):
+        # Uma posição negativa devolve a cabeça, como na versão original
+        position = max(position, 0)
+        if position >= self.size:
+            return None
+        return self._node_at(position).value
+
+    def display(self):
+        current = self.head
+        while current:
+            print(current.value, end=" -> ")
+            current = current.next
+        print("Nenhum")
+
+class PooledNode:
+    # Vista leve de uma posição do pool, com a mesma interface de Node (value/next)
+    __slots__ = ('pool', 'index')
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def value(self):
+        return self.pool.values[self.index]
+
+    @property
+    def next(self):
+        index = self.pool.links[self.index]
+        return PooledNode(self.pool, index) if index != -1 else None
+
+class ArrayLinkedList:
+    # Lista encadeada de inteiros guardada em arrays paralelos: values[i] e links[i] (próximo
+    # índice, -1 = nenhum). Índices libertados são reaproveitados através de uma lista livre
+    # encadeada pelo próprio links. Usa 16 bytes por elemento em vez de um objeto Node.
+    def __init__(self):
+        self.values = array('q')
+        self.links = array('q')
+        self.head_index = -1
+        self.tail_index = -1
+        self.free = -1
+        self.size = 0
+        # Snapshot dos valores para find_values; descartado em _alloc, _release e extend
+        self._snapshot = None
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.find_value(value) != -1
+
+    @property
+    def head(self):
+        return PooledNode(self, self.head_index) if self.head_index != -1 else None
+
+    def save(self, path):
+        # Snapshot binário (ver simuladores.core.storage)
+        from .storage import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path):
+        from .storage import load
+        return load(cls, path)
+
+    def _alloc(self, value, link):
+        if self.free != -1:
+            index = self.free
+            self.free = self.links[index]
+            self.values[index] = value
+            self.links[index] = link
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.links.append(link)
+        self.size += 1
+        self._snapshot = None
+        return index
+
+    def _release(self, index):
+        self.links[index] = self.free
+        self.free = index
+        self.size -= 1
+        self._snapshot = None
+
+    def _index_at(self, position):
+        if position == self.size - 1:
+            return self.tail_index
+        index = self.head_index
+        links = self.links
+        for _ in range(position):
+            index = links[index]
+        return index
+
+    def append(self, value):
+        index = self._alloc(value, -1)
+        if self.tail_index == -1:
+            self.head_index = index
+        else:
+            self.links[self.tail_index] = index
+        self.tail_index = index
+
+    def extend(self, values):
+        if self.free != -1:
+            for value in values:
+                self.append(value)
+            return
+        # Sem índices livres, os novos nós ocupam posições consecutivas no fim dos arrays
+        start = len(self.values)
+        self.values.extend(values)
+        added = len(self.values) - start
+        if not added:
+            return
+        self.links.extend(range(start + 1, start + added + 1))
+        self.links[-1] = -1
+        if self.tail_index == -1:
+            self.head_index = start
+        else:
+            self.links[self.tail_index] = start
+        self.tail_index = start + added - 1
+        self.size += added
+        self._snapshot = None
+
+    def insert_at_start(self, value):
+        self.head_index = self._alloc(value, self.head_index)
+        if self.tail_index == -1:
+            self.tail_index = self.head_index
+
+    def insert_at_position(self, value, position):
+        if position < 0 or position > self.size:
+            raise IndexError("Posição fora dos limites")
+        if position == 0:
+            self.insert_at_start(value)
+            return
+        if position == self.size:
+            self.append(value)
+            return
+        current = self._index_at(position - 1)
+        self.links[current] = self._alloc(value, self.links[current])
+
+    def remove_first(self):
+        if self.head_index != -1:
+            old = self.head_index
+            self.head_index = self.links[old]
+            if self.head_index == -1:
+                self.tail_index = -1
+            self._release(old)
+
+    def remove_last(self):
+        if self.head_index == -1:
+            return
+        if self.size == 1:
+            self.remove_first()
+            return
+        current = self._index_at(self.size - 2)
+        self._release(self.links[current])
+        self.links[current] = -1
+        self.tail_index = current
+
+    def remove_at_position(self, position):
+        if position < 0 or position > self.size:
+            raise IndexError("Posição fora dos limites")
+        if position == 0:
+            self.remove_first()
+            return
+        if position == self.size:
+            return
+        if position == self.size - 1:
+            self.remove_last()
+            return
+        current = self._index_at(position - 1)
+        removed = self.links[current]
+        self.links[current] = self.links[removed]
+        self._release(removed)
+
+    def find_value(self, value):
+        index = self.head_index
+        position = 0
+        values, links = self.values, self.links
+        while index != -1:
+            if values[index] == value:
+                return position
+            index = links[index]
+            position += 1
+        return -1
+
+    def find_values(self, values):
+        # Como LinkedList.find_values: o snapshot guarda os valores pela ordem da lista
+        if self._snapshot is None:
+            values_in_order = array('q')
+            index, links = self.head_index, self.links
+            while index != -1:
+                values_in_order.append(self.values[index])
+                index = links[index]
+            self._snapshot = Snapshot(values_in_order)
+        return self._snapshot.find(values)
+
+    def node_at(self, position):
+        if position < 0 or position >= self.size:
+            raise IndexError("Posição fora dos limites")
+        return PooledNode(self, self._index_at(position))
+
+    def find_position(self, position):
+        position = max(position, 0)
+        if position >= self.size:
+            return None
+        return self.values[self._index_at(position)]
+
+    def display(self):
+        index = self.head_index
+        while index != -1:
+            print(self.values[index], end=" -> ")
+            index = self.links[index]
+        print("Nenhum")
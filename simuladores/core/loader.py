@@ -0,0 +1,54 @@
+"""
+Leitura de ficheiros de inteiros (separados por espaços ou mudanças de linha) em partes independentes:
+split_file divide o ficheiro em intervalos de bytes que começam sempre no início de um número, e cada
+parte pode ser convertida noutro processo com read_values ou read_sorted_keys. As funções e as partes
+(tuplos (caminho, início, fim)) podem ser enviadas a um ProcessPoolExecutor. Não depende de Tkinter.
+"""
+import os
+from heapq import merge
+
+# Um número tem no máximo 20 caracteres, por isso há sempre um separador neste bloco
+BOUNDARY_SCAN = 64
+
+
+def split_file(path, parts):
+    # Até parts intervalos de tamanho semelhante; cada corte avança até logo depois de um separador
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as source:
+        for part in range(1, parts):
+            position = max(size * part // parts, bounds[-1])
+            source.seek(position)
+            block = source.read(BOUNDARY_SCAN)
+            cut = next((i for i, byte in enumerate(block) if chr(byte).isspace()), len(block))
+            bounds.append(min(position + cut + 1, size))
+    bounds.append(size)
+    return [(path, start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def _read(part):
+    path, start, stop = part
+    with open(path, 'rb') as source:
+        source.seek(start)
+        return source.read(stop - start).split()
+
+
+def read_values(part):
+    # Os inteiros de uma parte, pela ordem do ficheiro
+    return list(map(int, _read(part)))
+
+
+def read_sorted_keys(part):
+    # As chaves distintas de uma parte, por ordem crescente (para BinaryTree.from_sorted)
+    return sorted(set(map(int, _read(part))))
+
+
+def merge_unique(*sorted_keys):
+    # Junta sequências crescentes numa só, sem repetições, sob demanda
+    last = None
+    first = True
+    for key in merge(*sorted_keys):
+        if first or key != last:
+            yield key
+            last = key
+            first = False
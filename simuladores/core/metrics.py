@@ -0,0 +1,126 @@
+"""
+Instrumentação opcional das estruturas: por operação conta comparações (nós cuja chave foi comparada
+com a procurada), saltos de ponteiro (next/prev/left/right seguidos), alocações de nós e tempo de
+relógio, com um histograma de latências em potências de dois de microssegundos. Guarda também uma
+série temporal de um indicador da estrutura (altura da árvore, tamanho da lista ou da pilha).
+Não depende de Tkinter.
+
+Uso: LinkedList(metrics=Metrics()), Stack(metrics=...) ou BinaryTree(balance, metrics=...). Sem
+Metrics, as estruturas não pagam mais do que um teste `self.metrics is not None` por operação; os
+ciclos mais quentes da árvore têm uma variante com contagem usada só quando as métricas estão ligadas.
+"""
+import json
+import time
+from collections import deque
+from functools import wraps
+
+class OperationStats:
+    __slots__ = ('count', 'seconds', 'max_seconds', 'comparisons', 'hops', 'allocations', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.comparisons = 0
+        self.hops = 0
+        self.allocations = 0
+        # Balde k conta as operações com latência em [2**(k-1), 2**k) µs; o balde 0, as de menos de 1 µs
+        self.histogram = {}
+
+    def add(self, seconds, comparisons, hops, allocations):
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.comparisons += comparisons
+        self.hops += hops
+        self.allocations += allocations
+        bucket = int(seconds * 1e6).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'seconds': self.seconds,
+            'mean_seconds': self.seconds / self.count if self.count else 0.0,
+            'max_seconds': self.max_seconds,
+            'comparisons': self.comparisons,
+            'hops': self.hops,
+            'allocations': self.allocations,
+            # Pares [limite superior em µs, número de operações]
+            'histogram_us': [[2 ** bucket, count] for bucket, count in sorted(self.histogram.items())],
+        }
+
+class Metrics:
+    def __init__(self, sample_every=1, max_samples=10000):
+        # Contadores da operação em curso; as estruturas somam diretamente neles
+        self.comparisons = 0
+        self.hops = 0
+        self.allocations = 0
+        self.operations = {}
+        self.total = 0
+        # Série (número da operação, valor do indicador), amostrada a cada sample_every operações.
+        # Na árvore sem balanceamento a altura custa O(n) por amostra; com sample_every=None só se
+        # amostra quando sample() é chamado (o painel de estatísticas fá-lo a cada atualização).
+        self.sample_every = sample_every
+        self.samples = deque(maxlen=max_samples)
+        self.gauge_name = None
+        self._gauge = None
+        self._depth = 0
+
+    def attach(self, structure, operations, gauge_name, gauge):
+        # Troca, só nesta instância, os métodos públicos indicados por versões cronometradas
+        for name in operations:
+            setattr(structure, name, self._timed(name, getattr(structure, name)))
+        self.gauge_name = gauge_name
+        self._gauge = gauge
+
+    def _timed(self, name, method):
+        @wraps(method)
+        def timed(*args, **kwargs):
+            # Chamadas internas entre métodos públicos contam para a operação de fora
+            if self._depth:
+                return method(*args, **kwargs)
+            self._depth = 1
+            self.comparisons = self.hops = self.allocations = 0
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+                self._depth = 0
+        return timed
+
+    def record(self, name, seconds):
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = OperationStats()
+        stats.add(seconds, self.comparisons, self.hops, self.allocations)
+        self.total += 1
+        if self._gauge is not None and self.sample_every and self.total % self.sample_every == 0:
+            self.samples.append((self.total, self._gauge()))
+
+    def gauge(self):
+        return self._gauge() if self._gauge is not None else None
+
+    def sample(self):
+        # Lê o indicador agora e junta-o à série, se houve operações desde a última amostra
+        value = self.gauge()
+        if value is not None and (not self.samples or self.samples[-1][0] != self.total):
+            self.samples.append((self.total, value))
+        return value
+
+    def reset(self):
+        self.operations = {}
+        self.total = 0
+        self.samples.clear()
+
+    def to_dict(self):
+        return {
+            'total_operations': self.total,
+            'operations': {name: stats.to_dict() for name, stats in self.operations.items()},
+            'gauge': {'name': self.gauge_name, 'current': self.gauge(), 'samples': list(self.samples)},
+        }
+
+    def dump(self, path):
+        with open(path, 'w') as output:
+            json.dump(self.to_dict(), output, indent=2)
@@ -0,0 +1,294 @@
+"""
+Versões persistentes da árvore binária e da pilha. Têm a mesma interface das estruturas mutáveis,
+mas nunca alteram um nó que pertença a uma versão anterior: a árvore copia o caminho da raiz até a
+chave (e os nós tocados por rotações) e a pilha partilha a cadeia de nós abaixo do topo. Assim
+snapshot() custa O(1), cada versão guardada custa O(log n) nós na árvore balanceada e na árvore B+ e
+O(1) na pilha, e um leitor pode percorrer uma versão enquanto outra thread altera a estrutura. History
+usa essas versões para desfazer e refazer. Não depende de Tkinter.
+"""
+from bisect import bisect_right
+from collections import deque
+
+from .binary_tree import BinaryTree
+from .bplus_tree import DEFAULT_FANOUT, BPlusTree
+from .simplificado import Node
+
+class PersistentBinaryTree(BinaryTree):
+    # Antes de cada insert/delete, _copy_path substitui por cópias os nós do caminho até a chave
+    # (e, numa remoção, até o sucessor); os algoritmos da BinaryTree alteram só esses nós, mais os
+    # que rodam ou mudam de cor, que _own copia na hora. _fresh guarda os id() das cópias da
+    # operação em curso, que podem ser alteradas à vontade.
+    def __init__(self, balance=None, metrics=None):
+        super().__init__(balance, metrics)
+        self._fresh = None
+
+    def snapshot(self):
+        # Versão imutável na prática: partilha todos os nós e, se for alterada, também copia caminhos
+        version = PersistentBinaryTree(self.balance)
+        version.root = self.root
+        return version
+
+    def restore(self, version):
+        self.root = version.root
+        self._snapshot = None
+
+    def _own(self, node):
+        if node is None or id(node) in self._fresh:
+            return node
+        copy = node.copy()
+        self._fresh.add(id(copy))
+        return copy
+
+    def _copy_path(self, key, successor):
+        node = self.root = self._own(self.root)
+        while node is not None and key != node.val:
+            if key < node.val:
+                node.left = child = self._own(node.left)
+            else:
+                node.right = child = self._own(node.right)
+            node = child
+        if successor and node is not None and node.left is not None and node.right is not None:
+            node.right = child = self._own(node.right)
+            while child.left is not None:
+                child.left = child = self._own(child.left)
+
+    def insert(self, key):
+        self._fresh = set()
+        try:
+            self._copy_path(key, False)
+            super().insert(key)
+        finally:
+            self._fresh = None
+
+    def delete(self, key):
+        self._fresh = set()
+        try:
+            self._copy_path(key, True)
+            super().delete(key)
+        finally:
+            self._fresh = None
+
+    def _copying(self, operation, *args):
+        # As operações de conjunto copiam, com _own, cada nó que alteram
+        self._fresh = set()
+        try:
+            return operation(*args)
+        finally:
+            self._fresh = None
+
+    def split(self, key):
+        return self._copying(super().split, key)
+
+    def union(self, other, executor=None):
+        self._copying(super().union, other, executor)
+
+    def intersection(self, other, executor=None):
+        self._copying(super().intersection, other, executor)
+
+    def difference(self, other, executor=None):
+        self._copying(super().difference, other, executor)
+
+    def _concatenate(self, other):
+        self._copying(super()._concatenate, other)
+
+    def _rotate_left(self, node):
+        node = self._own(node)
+        node.right = self._own(node.right)
+        return super()._rotate_left(node)
+
+    def _rotate_right(self, node):
+        node = self._own(node)
+        node.left = self._own(node.left)
+        return super()._rotate_right(node)
+
+    def _flip_colors(self, node):
+        # node já é uma cópia; os filhos podem pertencer a outras versões
+        node.left = self._own(node.left)
+        node.right = self._own(node.right)
+        super()._flip_colors(node)
+
+class PersistentBPlusTree(BPlusTree):
+    # Como a PersistentBinaryTree: numa alteração, _descend substitui por cópias os nós do caminho até
+    # a folha e _fill copia os irmãos que emprestam ou recebem chaves; _fresh guarda os id() das cópias
+    # da operação em curso. As folhas não são ligadas, porque ligar uma folha copiada obrigaria a copiar
+    # a anterior, e assim sucessivamente; travessias e intervalos sobem pelo caminho (ver _leaves_from).
+    LINKED_LEAVES = False
+
+    def __init__(self, fanout=DEFAULT_FANOUT, metrics=None):
+        super().__init__(fanout, metrics)
+        self._fresh = None
+
+    def snapshot(self):
+        version = PersistentBPlusTree(self.fanout)
+        version.root, version.size = self.root, self.size
+        return version
+
+    def restore(self, version):
+        self.root, self.size = version.root, version.size
+
+    def _own(self, node):
+        if id(node) in self._fresh:
+            return node
+        copy = node.copy()
+        self._fresh.add(id(copy))
+        return copy
+
+    def _descend(self, key):
+        if self._fresh is None:
+            return super()._descend(key)
+        path = []
+        node = self.root = self._own(self.root)
+        while node.children is not None:
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node.children[index] = node = self._own(node.children[index])
+        if self.metrics is not None:
+            self._count(len(path), len(path) + 1)
+        return path, node
+
+    def _fill(self, parent, index):
+        # parent já é uma cópia; os irmãos podem pertencer a outras versões
+        children = parent.children
+        if index > 0:
+            children[index - 1] = self._own(children[index - 1])
+        if index + 1 < len(children):
+            children[index + 1] = self._own(children[index + 1])
+        super()._fill(parent, index)
+
+    def insert(self, key):
+        self._fresh = set()
+        try:
+            super().insert(key)
+        finally:
+            self._fresh = None
+
+    def delete(self, key):
+        self._fresh = set()
+        try:
+            super().delete(key)
+        finally:
+            self._fresh = None
+
+class PersistentStack:
+    # Pilha sobre uma cadeia de Node (data/next) que nunca é alterada: push cria um nó à frente do
+    # topo e pop apenas avança o topo, por isso snapshot() é só (topo, tamanho).
+    #
+    # _cells guarda os nós da cadeia por índice, da base para o topo, para o acesso indexado ser O(1).
+    # push e pop mantêm-na; depois de um restore ela pode descrever outro ramo, e __getitem__ repara-a
+    # a partir do topo até o primeiro nó que já lá esteja (custa a distância ao ponto em que os dois
+    # ramos divergem, normalmente 1 depois de desfazer ou refazer). Cada instância tem a sua lista,
+    # por isso uma thread pode empilhar numa versão sem tocar na da estrutura de origem.
+    INSTRUMENTED = ('push', 'push_many', 'pop', 'peek')
+
+    def __init__(self, metrics=None):
+        self.top = None
+        self.size = 0
+        self._cells = []
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'tamanho', self.__len__)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        # Índice a partir da base, como numa lista (negativos contam a partir do topo)
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Posição fora dos limites")
+        cells = self._cells
+        if len(cells) < self.size or cells[self.size - 1] is not self.top:
+            self._repair()
+        return cells[index].data
+
+    def _repair(self):
+        cells = self._cells
+        if len(cells) < self.size:
+            cells.extend([None] * (self.size - len(cells)))
+        node, index = self.top, self.size - 1
+        while node is not None and cells[index] is not node:
+            cells[index] = node
+            node, index = node.next, index - 1
+
+    def iter_from_top(self):
+        node = self.top
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def snapshot(self):
+        version = PersistentStack()
+        version.top, version.size = self.top, self.size
+        return version
+
+    def restore(self, version):
+        # Os nós acima do novo tamanho deixam de ser guardados aqui (continuam nas versões do History)
+        self.top, self.size = version.top, version.size
+        del self._cells[self.size:]
+
+    def push(self, value):
+        node = Node(value)
+        node.next = self.top
+        cells = self._cells
+        if len(cells) == self.size and (not cells or cells[-1] is self.top):
+            cells.append(node)
+        self.top = node
+        self.size += 1
+
+    def push_many(self, values):
+        for value in values:
+            self.push(value)
+
+    def pop(self):
+        if not self.is_empty():
+            value = self.top.data
+            cells = self._cells
+            if len(cells) == self.size and cells[-1] is self.top:
+                cells.pop()
+            self.top = self.top.next
+            self.size -= 1
+            return value
+        else:
+            raise IndexError("Remover de uma pilha vazia")
+
+    def peek(self):
+        if not self.is_empty():
+            return self.top.data
+        else:
+            raise IndexError("Ver elemento no topo")
+
+    def is_empty(self):
+        return self.top is None
+
+class History:
+    # Pilhas de desfazer/refazer sobre as versões de uma estrutura persistente. record(versão)
+    # guarda a versão anterior a uma operação bem-sucedida; limit descarta as mais antigas.
+    def __init__(self, structure, limit=1000):
+        self.structure = structure
+        self.undo_versions = deque(maxlen=limit)
+        self.redo_versions = deque(maxlen=limit)
+
+    def record(self, version):
+        self.undo_versions.append(version)
+        self.redo_versions.clear()
+
+    def can_undo(self):
+        return bool(self.undo_versions)
+
+    def can_redo(self):
+        return bool(self.redo_versions)
+
+    def undo(self):
+        if not self.undo_versions:
+            return False
+        self.redo_versions.append(self.structure.snapshot())
+        self.structure.restore(self.undo_versions.pop())
+        return True
+
+    def redo(self):
+        if not self.redo_versions:
+            return False
+        self.undo_versions.append(self.structure.snapshot())
+        self.structure.restore(self.redo_versions.pop())
+        return True
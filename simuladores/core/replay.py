@@ -0,0 +1,134 @@
+"""
+Repetição de registos de operações sobre uma estrutura, em fluxo: os comandos são lidos à medida que
+são aplicados, em lotes, com checkpoints periódicos (snapshots de simuladores.core.storage) e relatório
+de débito. Não depende de Tkinter; simuladores.gui.replay_player anima a mesma repetição nas aplicações.
+
+Formato: uma operação por linha, `método [inteiros...]`, onde método é uma das operações públicas da
+estrutura (as de INSTRUMENTED), por exemplo `push 5`, `pop`, `insert 3`, `delete 3`, `search 3` ou
+`insert_at_position 7 2`. Linhas vazias ou começadas por # são ignoradas; push_many, extend, search_many
+e find_values recebem todos os argumentos como uma lista.
+"""
+import sys
+import time
+from itertools import islice
+
+from .storage import SAVABLE, save
+
+# Métodos que recebem os argumentos como uma lista
+VARIADIC = frozenset({'push_many', 'extend', 'search_many', 'find_values'})
+# Sequências seguidas destes comandos são aplicadas numa só chamada ao método em lote. Em todas as
+# estruturas de simuladores.core estes métodos ou aplicam o lote inteiro ou falham antes de alterar a
+# estrutura (RingStack cheia); quando falham, Replayer repete o grupo comando a comando.
+BULK = {'push': 'push_many', 'append': 'extend'}
+# Erros normais numa carga (pilha vazia, valor inexistente, posição inválida): contados, não fatais
+EXPECTED_ERRORS = (IndexError, ValueError)
+
+
+def parse(lines, allowed):
+    # Gera (método, argumentos) a partir de linhas de texto, sem as ler todas de uma vez
+    for number, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts or parts[0].startswith('#'):
+            continue
+        name = parts[0]
+        if name not in allowed:
+            raise ValueError(f"Linha {number}: operação desconhecida {name!r}")
+        try:
+            args = [int(part) for part in parts[1:]]
+        except ValueError:
+            raise ValueError(f"Linha {number}: argumentos inválidos em {line.strip()!r}") from None
+        yield name, (args,) if name in VARIADIC else tuple(args)
+
+
+class Replayer:
+    def __init__(self, structure, lines, checkpoint=None, checkpoint_every=0, strict=False):
+        # checkpoint: ficheiro regravado a cada checkpoint_every operações e no fim; strict=True
+        # deixa passar os erros esperados em vez de só os contar
+        if checkpoint and not isinstance(structure, SAVABLE):
+            raise TypeError(f"Não é possível gravar checkpoints de {type(structure).__name__}")
+        self.structure = structure
+        self.commands = parse(lines, frozenset(structure.INSTRUMENTED))
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.strict = strict
+        self.operations = 0
+        self.errors = 0
+        self.checkpoints = 0
+        self.seconds = 0.0
+        self._next_checkpoint = checkpoint_every
+        self._methods = {}
+
+    def _method(self, name):
+        method = self._methods.get(name)
+        if method is None:
+            method = self._methods[name] = getattr(self.structure, name)
+        return method
+
+    def _call(self, name, args):
+        try:
+            self._method(name)(*args)
+        except EXPECTED_ERRORS:
+            if self.strict:
+                raise
+            self.errors += 1
+
+    def _call_group(self, name, bulk, commands):
+        # Um erro do método em lote diria respeito ao lote inteiro; repetir cada comando dá os mesmos
+        # elementos aplicados e a mesma contagem de erros que sem agrupamento
+        try:
+            self._method(bulk)([value for _, (value,) in commands])
+        except EXPECTED_ERRORS:
+            for _, args in commands:
+                self._call(name, args)
+
+    def step(self, limit):
+        # Aplica até limit operações e devolve quantas aplicou (0 quando o registo terminou)
+        start = time.perf_counter()
+        batch = list(islice(self.commands, limit))
+        i = 0
+        while i < len(batch):
+            name, args = batch[i]
+            j = i + 1
+            bulk = BULK.get(name)
+            if bulk is not None and len(args) == 1 and hasattr(self.structure, bulk):
+                while j < len(batch) and batch[j][0] == name and len(batch[j][1]) == 1:
+                    j += 1
+            if j - i > 1:
+                self._call_group(name, bulk, batch[i:j])
+            else:
+                self._call(name, args)
+            i = j
+        self.operations += len(batch)
+        self.seconds += time.perf_counter() - start
+        if self.checkpoint and self.checkpoint_every and self.operations >= self._next_checkpoint:
+            self.save_checkpoint()
+            self._next_checkpoint = self.operations + self.checkpoint_every
+        return len(batch)
+
+    def save_checkpoint(self):
+        # save já grava num ficheiro temporário, por isso nunca fica um checkpoint truncado
+        save(self.structure, self.checkpoint)
+        self.checkpoints += 1
+
+    def stats(self):
+        return {
+            'operations': self.operations,
+            'errors': self.errors,
+            'checkpoints': self.checkpoints,
+            'seconds': self.seconds,
+            'ops_per_second': self.operations / self.seconds if self.seconds else 0.0,
+        }
+
+    def run(self, batch_size=10000, report_every=1.0, report=sys.stderr):
+        # Repete o registo inteiro, escrevendo o débito em report a cada report_every segundos
+        last_report = time.perf_counter()
+        while self.step(batch_size):
+            now = time.perf_counter()
+            if report is not None and now - last_report >= report_every:
+                stats = self.stats()
+                print(f"{stats['operations']} operações, {stats['ops_per_second']:.0f} ops/s, "
+                      f"{stats['errors']} erros", file=report)
+                last_report = now
+        if self.checkpoint:
+            self.save_checkpoint()
+        return self.stats()
@@ -0,0 +1,277 @@
+"""
+Versões simplificadas de lista encadeada, pilha e árvore binária, com nós que guardam o valor em data.
+"""
+from collections import deque
+
+class Node:
+    __slots__ = ('data', 'next', 'prev')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None  # Só é mantido com índice de valores
+
+# Com indexed=True, LinkedList e Stack mantêm um dicionário valor -> nós com esse valor
+# (na ordem em que serão removidos) e ligações prev, tornando pertença e remoção por valor
+# O(1) em média. Custo extra por valor distinto: uma entrada de dicionário mais um deque
+# (~800 bytes) na LinkedList ou uma lista (~120 bytes) na Stack; cada repetição soma ~8 bytes
+# e cada nó passa a usar o atributo prev.
+
+class LinkedList:
+    def __init__(self, indexed=False):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.index = {} if indexed else None
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, data):
+        if self.index is not None:
+            return data in self.index
+        current = self.head
+        while current:
+            if current.data == data:
+                return True
+            current = current.next
+        return False
+
+    def insert(self, data):
+        new_node = Node(data)
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+            if self.index is not None:
+                new_node.prev = self.tail
+        self.tail = new_node
+        self.size += 1
+        if self.index is not None:
+            self.index.setdefault(data, deque()).append(new_node)
+
+    def extend(self, values):
+        if self.index is not None:
+            for data in values:
+                self.insert(data)
+            return
+        tail = self.tail
+        added = 0
+        for data in values:
+            new_node = Node(data)
+            if tail:
+                tail.next = new_node
+            else:
+                self.head = new_node
+            tail = new_node
+            added += 1
+        self.tail = tail
+        self.size += added
+
+    def delete(self, data):
+        if not self.head:
+            return
+
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if not nodes:
+                return
+            # Inserções só acontecem no fim: o primeiro nó do deque é a primeira ocorrência
+            node = nodes.popleft()
+            if not nodes:
+                del self.index[data]
+            if node.prev:
+                node.prev.next = node.next
+            else:
+                self.head = node.next
+            if node.next:
+                node.next.prev = node.prev
+            else:
+                self.tail = node.prev
+            self.size -= 1
+            return
+
+        if self.head.data == data:
+            self.head = self.head.next
+            if not self.head:
+                self.tail = None
+            self.size -= 1
+            return
+
+        current = self.head
+        while current.next and current.next.data != data:
+            current = current.next
+
+        if current.next:
+            if current.next is self.tail:
+                self.tail = current
+            current.next = current.next.next
+            self.size -= 1
+
+    def display(self):
+        nodes = []
+        current = self.head
+        while current:
+            nodes.append(current.data)
+            current = current.next
+        return nodes
+
+
+class Stack:
+    def __init__(self, indexed=False):
+        self.top = None
+        self.index = {} if indexed else None
+
+    def __contains__(self, data):
+        if self.index is not None:
+            return data in self.index
+        current = self.top
+        while current:
+            if current.data == data:
+                return True
+            current = current.next
+        return False
+
+    def push(self, data):
+        new_node = Node(data)
+        new_node.next = self.top
+        if self.index is not None:
+            if self.top:
+                self.top.prev = new_node
+            self.index.setdefault(data, []).append(new_node)
+        self.top = new_node
+
+    def push_many(self, values):
+        if self.index is not None:
+            for data in values:
+                self.push(data)
+            return
+        top = self.top
+        for data in values:
+            new_node = Node(data)
+            new_node.next = top
+            top = new_node
+        self.top = top
+
+    def pop(self):
+        if not self.top:
+            return None
+        popped_node = self.top
+        self.top = self.top.next
+        if self.index is not None:
+            if self.top:
+                self.top.prev = None
+            self._unindex(popped_node.data)
+        return popped_node.data
+
+    def _unindex(self, data):
+        # O nó mais próximo do topo é sempre o último empilhado com esse valor
+        nodes = self.index[data]
+        node = nodes.pop()
+        if not nodes:
+            del self.index[data]
+        return node
+
+    def delete(self, data):
+        if not self.top:
+            return
+
+        if self.index is not None:
+            if data not in self.index:
+                return
+            node = self._unindex(data)
+            if node.prev:
+                node.prev.next = node.next
+            else:
+                self.top = node.next
+            if node.next:
+                node.next.prev = node.prev
+            return
+
+        if self.top.data == data:
+            self.top = self.top.next
+            return
+
+        current = self.top
+        while current.next and current.next.data != data:
+            current = current.next
+
+        if current.next:
+            current.next = current.next.next
+
+    def display(self):
+        nodes = []
+        current = self.top
+        while current:
+            nodes.append(current.data)
+            current = current.next
+        return nodes
+
+class TreeNode:
+    __slots__ = ('data', 'left', 'right')
+
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+
+class BinaryTree:
+    def __init__(self):
+        self.root = None
+
+    def insert(self, data):
+        new_node = TreeNode(data)
+        if not self.root:
+            self.root = new_node
+            return
+        current = self.root
+        while True:
+            if new_node.data < current.data:
+                if not current.left:
+                    current.left = new_node
+                    return
+                current = current.left
+            else:
+                if not current.right:
+                    current.right = new_node
+                    return
+                current = current.right
+
+    def delete(self, data):
+        parent = None
+        current = self.root
+        while current and current.data != data:
+            parent = current
+            current = current.left if data < current.data else current.right
+        if not current:
+            return
+
+        if current.left and current.right:
+            parent = current
+            min_larger_node = current.right
+            while min_larger_node.left:
+                parent = min_larger_node
+                min_larger_node = min_larger_node.left
+            current.data = min_larger_node.data
+            current = min_larger_node
+
+        child = current.left if current.left else current.right
+        if not parent:
+            self.root = child
+        elif parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def in_order_traversal(self):
+        nodes = []
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            nodes.append(current.data)
+            current = current.right
+        return nodes
@@ -0,0 +1,300 @@
+"""
+Pilha baseada em lista (ou em array('q') no modo compacto), e RingStack: pilha de inteiros em blocos
+array('q'), opcionalmente limitada a uma capacidade (anel), com mínimo e máximo em O(1). Não depende de
+Tkinter.
+"""
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain, compress
+from operator import ge, le
+
+# Elementos por bloco de um RingStack sem capacidade
+CHUNK_SIZE = 4096
+# O que fazer ao empilhar num RingStack cheio: erro, descartar a base ou descartar os novos valores
+OVERFLOW_POLICIES = ('error', 'overwrite', 'discard')
+
+class Stack:
+    # Operações cronometradas quando há métricas (ver simuladores.core.metrics). Todas são O(1)
+    # sem percorrer nós, por isso só o tempo, o número de chamadas e o tamanho são registados.
+    INSTRUMENTED = ('push', 'push_many', 'pop', 'peek')
+
+    def __init__(self, compact=False, metrics=None):
+        # compact=True guarda inteiros num array('q') (8 bytes por elemento) em vez de uma lista
+        self.items = array('q') if compact else []
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'tamanho', self.__len__)
+
+    def __len__(self):
+        return len(self.items)
+
+    def save(self, path):
+        # Snapshot binário (ver simuladores.core.storage)
+        from .storage import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path, **options):
+        from .storage import load
+        return load(cls, path, **options)
+
+    def push(self, value):
+        self.items.append(value)
+
+    def push_many(self, values):
+        self.items.extend(values)
+
+    def pop(self):
+        if not self.is_empty():
+            return self.items.pop()
+        else:
+            raise IndexError("Remover de uma pilha vazia")
+
+    def peek(self):
+        if not self.is_empty():
+            return self.items[-1]
+        else:
+            raise IndexError("Ver elemento no topo")
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+
+def _extremes(values, positions, current, choose, keeps):
+    # Posições dos valores que igualam ou ultrapassam o extremo acumulado desde current (o extremo
+    # anterior, ou None). accumulate, map e compress percorrem os valores em C, sem ciclos em Python.
+    if not values:
+        return ()
+    if current is None:
+        current = values[0]
+    return compress(positions, map(keeps, values, accumulate(chain((current,), values), choose)))
+
+
+class RingStack:
+    # Pilha de inteiros de 64 bits. Sem capacidade, os valores ficam em blocos array('q') de chunk_size
+    # elementos (crescer não copia o que já existe e esvaziar devolve a memória); com capacidade, num
+    # único array('q') circular reservado de início, e overflow decide o que acontece quando está cheia.
+    #
+    # min() e max() são O(1): pilhas auxiliares monótonas guardam as posições (numeradas desde a
+    # criação, por isso não mudam quando a base avança) dos elementos que igualam ou ultrapassam todos
+    # os que estão abaixo deles. Com overflow='overwrite' também se remove da base, e uma pilha monótona
+    # não suporta isso; os elementos dividem-se então em duas metades (de base a middle e de middle ao
+    # topo), cada uma com as suas auxiliares: a de cima cresce para o topo, a de baixo para a base.
+    # Quando uma remoção esgota uma metade, as duas são refeitas a partir do meio (O(n) amortizado a O(1)).
+    INSTRUMENTED = ('push', 'push_many', 'pop', 'pop_many', 'peek', 'min', 'max')
+
+    def __init__(self, capacity=None, overflow='error', chunk_size=CHUNK_SIZE, metrics=None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política de excesso desconhecida: {overflow}")
+        if capacity is not None and capacity < 1:
+            raise ValueError("A capacidade tem de ser positiva")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.chunk_size = chunk_size
+        if capacity is None:
+            self.chunks = [array('q')]
+        else:
+            self.ring = array('q', bytes(8 * capacity))
+            self.start = 0
+        self.size = 0
+        # Número do elemento da base e primeiro número da metade de cima
+        self.base = 0
+        self.middle = 0
+        self._clear_extremes()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self, self.INSTRUMENTED, 'tamanho', self.__len__)
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def push(self, value):
+        if self.size == self.capacity:
+            if self.overflow == 'error':
+                raise IndexError("Empilhar numa pilha cheia")
+            if self.overflow == 'discard':
+                return
+            self._drop(1)
+        position = self.base + self.size
+        if self.capacity is None:
+            chunk = self.chunks[-1]
+            if len(chunk) == self.chunk_size:
+                chunk = array('q')
+                self.chunks.append(chunk)
+            chunk.append(value)
+        else:
+            self.ring[(self.start + self.size) % self.capacity] = value
+        self.size += 1
+        low, high = self.back_min, self.back_max
+        if not low or value <= self._get(low[-1] - self.base):
+            low.append(position)
+        if not high or value >= self._get(high[-1] - self.base):
+            high.append(position)
+
+    def push_many(self, values):
+        # Um só array('q') com todos os valores; guardar e atualizar as auxiliares são operações em bloco
+        if not isinstance(values, array) or values.typecode != 'q':
+            values = array('q', values)
+        if self.capacity is not None and self.size + len(values) > self.capacity:
+            if self.overflow == 'error':
+                raise IndexError("Empilhar numa pilha cheia")
+            if self.overflow == 'discard':
+                values = values[:self.capacity - self.size]
+            elif len(values) >= self.capacity:
+                # Só os últimos capacity valores ficariam: recomeça com eles
+                self.base += self.size + len(values) - self.capacity
+                self.start = self.size = 0
+                self.middle = self.base
+                self._clear_extremes()
+                values = values[len(values) - self.capacity:]
+            else:
+                self._drop(self.size + len(values) - self.capacity)
+        if not values:
+            return
+        position = self.base + self.size
+        self._store(values)
+        positions = range(position, position + len(values))
+        for extremes, choose, keeps in ((self.back_min, min, le), (self.back_max, max, ge)):
+            current = self._get(extremes[-1] - self.base) if extremes else None
+            extremes.extend(_extremes(values, positions, current, choose, keeps))
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("Remover de uma pilha vazia")
+        if self.base + self.size == self.middle:
+            self._rebalance()
+        self.size -= 1
+        position = self.base + self.size
+        if self.capacity is None:
+            chunk = self.chunks[-1]
+            value = chunk.pop()
+            if not chunk and len(self.chunks) > 1:
+                self.chunks.pop()
+        else:
+            value = self.ring[(self.start + self.size) % self.capacity]
+        for extremes in (self.back_min, self.back_max):
+            if extremes and extremes[-1] == position:
+                extremes.pop()
+        return value
+
+    def pop_many(self, count):
+        # Os count elementos do topo num array('q'), do topo para a base (como count chamadas a pop)
+        if count > self.size:
+            raise IndexError("Remover mais elementos do que os da pilha")
+        values = self._slice(self.size - max(count, 0), self.size)
+        values.reverse()
+        self._truncate(self.size - len(values))
+        top = self.base + self.size
+        if top >= self.middle:
+            # As posições nas auxiliares de cima são crescentes
+            for extremes in (self.back_min, self.back_max):
+                del extremes[bisect_left(extremes, top):]
+        else:
+            self._rebalance()
+        return values
+
+    def peek(self):
+        if not self.size:
+            raise IndexError("Ver elemento no topo")
+        return self._get(self.size - 1)
+
+    def peek_many(self, count):
+        # Os count elementos do topo (ou todos, se houver menos), do topo para a base, sem os remover
+        values = self._slice(max(self.size - max(count, 0), 0), self.size)
+        values.reverse()
+        return values
+
+    def min(self):
+        return self._extreme(self.front_min, self.back_min, min)
+
+    def max(self):
+        return self._extreme(self.front_max, self.back_max, max)
+
+    def to_array(self):
+        # Cópia dos elementos, da base para o topo
+        return self._slice(0, self.size)
+
+    def _extreme(self, front, back, choose):
+        if not self.size:
+            raise IndexError("Extremo de uma pilha vazia")
+        return choose(self._get(extremes[-1] - self.base) for extremes in (front, back) if extremes)
+
+    def _clear_extremes(self):
+        self.front_min, self.front_max = array('q'), array('q')
+        self.back_min, self.back_max = array('q'), array('q')
+
+    def _get(self, index):
+        # Elemento index, contado a partir da base
+        if self.capacity is None:
+            chunk, offset = divmod(index, self.chunk_size)
+            return self.chunks[chunk][offset]
+        return self.ring[(self.start + index) % self.capacity]
+
+    def _slice(self, low, high):
+        # array('q') com os elementos de low (inclusive) a high (exclusive), contados a partir da base
+        if self.capacity is None:
+            size = self.chunk_size
+            values = array('q')
+            for chunk in range(low // size, (high - 1) // size + 1 if high > low else low // size):
+                values.extend(self.chunks[chunk][max(low - chunk * size, 0):high - chunk * size])
+            return values
+        capacity = self.capacity
+        low, high = self.start + low, self.start + high
+        if high <= capacity:
+            return self.ring[low:high]
+        if low >= capacity:
+            return self.ring[low - capacity:high - capacity]
+        return self.ring[low:] + self.ring[:high - capacity]
+
+    def _store(self, values):
+        # Acrescenta values ao topo (já se sabe que cabem)
+        if self.capacity is None:
+            size = self.chunk_size
+            free = size - len(self.chunks[-1])
+            self.chunks[-1].extend(values[:free])
+            for first in range(free, len(values), size):
+                self.chunks.append(values[first:first + size])
+        else:
+            first = (self.start + self.size) % self.capacity
+            head = min(len(values), self.capacity - first)
+            self.ring[first:first + head] = values[:head]
+            self.ring[:len(values) - head] = values[head:]
+        self.size += len(values)
+
+    def _truncate(self, size):
+        # Fica só com os size elementos de baixo; todos os blocos menos o último estão cheios
+        if self.capacity is None:
+            used = max(1, -(-size // self.chunk_size))
+            del self.chunks[used:]
+            del self.chunks[-1][size - (used - 1) * self.chunk_size:]
+        self.size = size
+
+    def _drop(self, count):
+        # Descarta count elementos da base (overflow='overwrite')
+        self.start = (self.start + count) % self.capacity
+        self.size -= count
+        self.base += count
+        if self.base > self.middle:
+            self._rebalance()
+            return
+        # As posições nas auxiliares de baixo são decrescentes: as descartadas estão no topo delas
+        for extremes in (self.front_min, self.front_max):
+            while extremes and extremes[-1] < self.base:
+                extremes.pop()
+
+    def _rebalance(self):
+        # Reparte os elementos em duas metades e refaz as quatro auxiliares
+        values = self._slice(0, self.size)
+        half = self.size // 2
+        self.middle = self.base + half
+        below, above = values[:half], values[half:]
+        below.reverse()
+        down = range(self.middle - 1, self.base - 1, -1)
+        up = range(self.middle, self.base + self.size)
+        self.front_min = array('q', _extremes(below, down, None, min, le))
+        self.front_max = array('q', _extremes(below, down, None, max, ge))
+        self.back_min = array('q', _extremes(above, up, None, min, le))
+        self.back_max = array('q', _extremes(above, up, None, max, ge))
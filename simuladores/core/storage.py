@@ -0,0 +1,322 @@
+"""
+Formato binário de snapshot para árvores, listas e pilhas de inteiros, com carregamento normal (save/load)
+e um modo só de leitura mapeado em memória (open_mapped). Não depende de Tkinter.
+
+Um ficheiro tem um cabeçalho de HEADER.size bytes seguido de registos de largura fixa de inteiros de
+64 bits little-endian:
+
+    árvore: (valor, índice do filho esquerdo, índice do filho direito), -1 = nenhum
+    lista:  (valor, índice do próximo), -1 = nenhum
+    pilha:  (valor,), da base para o topo
+
+Uma BinaryTree é gravada em pré-ordem, a partir dos tamanhos das subárvores, sem montar os registos em
+memória; nos modos 'rb' segue-se aos registos um byte de cor por nó. As versões em arrays (ArrayBinaryTree
+e ArrayLinkedList) gravam os seus arrays tal como estão, com as posições livres. Os modos mapeados
+respondem a search, travessias, find_value e find_position lendo diretamente o ficheiro, sem criar nós.
+
+save escreve primeiro em path + '.tmp' e só no fim o renomeia para path, pelo que uma gravação falhada
+nunca deixa um ficheiro truncado.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .binary_tree import RED, BLACK, TreeNode, BinaryTree, ArrayBinaryTree
+from .linked_list import LinkedList, ArrayLinkedList
+from .stack import Stack
+
+MAGIC = b'SIMU'
+VERSION = 1
+# magia, versão, tipo, balanceamento, registos, tamanho, raiz/cabeça, cauda, lista livre
+HEADER = struct.Struct('<4sBBBxqqqqq')
+TREE, LIST, STACK = 1, 2, 3
+BALANCE_CODES = {None: 0, 'avl': 1, 'rb': 2}
+BALANCES = {code: balance for balance, code in BALANCE_CODES.items()}
+FIELDS = {TREE: 3, LIST: 2, STACK: 1}
+# Estruturas (e subclasses) que save sabe gravar
+SAVABLE = (BinaryTree, ArrayBinaryTree, LinkedList, ArrayLinkedList, Stack)
+# Registos escritos de cada vez
+CHUNK = 1 << 16
+
+
+def _little_endian(records):
+    if sys.byteorder == 'big':
+        records.byteswap()
+    return records
+
+
+def _write_header(output, kind, records, size, first=-1, last=-1, free=-1, balance=None):
+    output.write(HEADER.pack(MAGIC, VERSION, kind, BALANCE_CODES[balance], records, size, first, last, free))
+
+
+def _write_tree(output, tree):
+    # Pré-ordem com índices atribuídos pela ordem de escrita: o filho esquerdo do nó i é i + 1 e o
+    # direito i + 1 + tamanho da subárvore esquerda, por isso cada registo sai completo
+    count = len(tree)
+    _write_header(output, TREE, count, count, 0 if count else -1, balance=tree.balance)
+    colors = bytearray() if tree.balance == 'rb' else None
+    chunk = array('q')
+    stack = [tree.root] if tree.root is not None else []
+    index = 0
+    while stack:
+        node = stack.pop()
+        left = index + 1 if node.left is not None else -1
+        right = index + 1 + tree._size(node.left) if node.right is not None else -1
+        chunk.extend((node.val, left, right))
+        if colors is not None:
+            colors.append(node.color == RED)
+        index += 1
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+        if len(chunk) >= 3 * CHUNK:
+            _little_endian(chunk).tofile(output)
+            chunk = array('q')
+    _little_endian(chunk).tofile(output)
+    if colors is not None:
+        output.write(colors)
+
+
+def _write_list(output, linked_list):
+    count = len(linked_list)
+    _write_header(output, LIST, count, count, 0 if count else -1, count - 1)
+    chunk = array('q')
+    index = 0
+    current = linked_list.head
+    while current:
+        index += 1
+        chunk.extend((current.value, index if index < count else -1))
+        if len(chunk) >= 2 * CHUNK:
+            _little_endian(chunk).tofile(output)
+            chunk = array('q')
+        current = current.next
+    _little_endian(chunk).tofile(output)
+
+
+def _write_arrays(output, columns):
+    # Intercala as colunas de um pool (values, links ou lefts/rights) em registos
+    count = len(columns[0])
+    for start in range(0, count, CHUNK):
+        stop = min(start + CHUNK, count)
+        chunk = array('q', bytes(8 * len(columns) * (stop - start)))
+        for field, column in enumerate(columns):
+            part = column[start:stop]
+            chunk[field::len(columns)] = part if isinstance(part, array) else _copy(part)
+        _little_endian(chunk).tofile(output)
+
+
+def save(structure, path):
+    if not isinstance(structure, SAVABLE):
+        raise TypeError(f"Não é possível gravar {type(structure).__name__}")
+    # Grava num ficheiro temporário e troca-o no fim: um valor que não seja inteiro (ou qualquer
+    # outro erro a meio) não deixa em path um ficheiro truncado nem estraga o snapshot anterior
+    temporary = f"{path}.tmp"
+    try:
+        with open(temporary, 'wb') as output:
+            _write(output, structure)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    os.replace(temporary, path)
+
+
+def _write(output, structure):
+    if isinstance(structure, BinaryTree):
+        _write_tree(output, structure)
+    elif isinstance(structure, ArrayBinaryTree):
+        _write_header(output, TREE, len(structure.values), structure.size, structure.root_index,
+                      free=structure.free)
+        _write_arrays(output, (structure.values, structure.lefts, structure.rights))
+    elif isinstance(structure, LinkedList):
+        _write_list(output, structure)
+    elif isinstance(structure, ArrayLinkedList):
+        _write_header(output, LIST, len(structure.values), structure.size, structure.head_index,
+                      structure.tail_index, structure.free)
+        _write_arrays(output, (structure.values, structure.links))
+    elif isinstance(structure, Stack):
+        _write_header(output, STACK, len(structure.items), len(structure.items))
+        _write_arrays(output, (array('q', structure.items),))
+
+
+class _File:
+    # Cabeçalho e registos de um ficheiro mapeado; columns são vistas (memoryview) de cada campo
+    def __init__(self, path, kind):
+        with open(path, 'rb') as source:
+            self.map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, found, balance, self.records, self.size, self.first, self.last, self.free = \
+            HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} não é um snapshot válido")
+        if found != kind:
+            self.close()
+            raise ValueError(f"{path} não contém o tipo de estrutura pedido")
+        if sys.byteorder == 'big':
+            self.close()
+            raise ValueError("Snapshots só podem ser abertos em máquinas little-endian")
+        self.balance = BALANCES[balance]
+        fields = FIELDS[kind]
+        end = HEADER.size + 8 * fields * self.records
+        self.view = memoryview(self.map)
+        self.data = self.view[HEADER.size:end].cast('q')
+        self.columns = [self.data[field::fields] for field in range(fields)]
+        self.extra = self.view[end:]
+
+    def close(self):
+        for view in getattr(self, 'columns', ()):
+            view.release()
+        for name in ('data', 'extra', 'view'):
+            if hasattr(self, name):
+                getattr(self, name).release()
+        self.map.close()
+
+
+def _copy(column):
+    # Copia uma coluna (possivelmente com passo) para um array('q')
+    copied = array('q')
+    copied.frombytes(column.tobytes())
+    return copied
+
+
+def _load_tree(cls, path):
+    source = _File(path, TREE)
+    try:
+        if cls is ArrayBinaryTree:
+            tree = ArrayBinaryTree()
+            tree.values, tree.lefts, tree.rights = (_copy(column) for column in source.columns)
+            tree.root_index, tree.size, tree.free = source.first, source.size, source.free
+            return tree
+        tree = cls(source.balance)
+        if source.first == -1:
+            return tree
+        values, lefts, rights = source.columns
+        colors = source.extra if source.balance == 'rb' else None
+        nodes = {}
+        order = []
+        stack = [source.first]
+        while stack:
+            index = stack.pop()
+            order.append(index)
+            if rights[index] != -1:
+                stack.append(rights[index])
+            if lefts[index] != -1:
+                stack.append(lefts[index])
+        # Pré-ordem invertida: os filhos são criados antes dos pais
+        for index in reversed(order):
+            node = nodes[index] = TreeNode(values[index])
+            if lefts[index] != -1:
+                node.left = nodes.pop(lefts[index])
+            if rights[index] != -1:
+                node.right = nodes.pop(rights[index])
+            if colors is not None:
+                node.color = RED if colors[index] else BLACK
+            tree._update(node)
+        tree.root = nodes.pop(source.first)
+        return tree
+    finally:
+        source.close()
+
+
+def _load_list(cls, path, options):
+    source = _File(path, LIST)
+    try:
+        if cls is ArrayLinkedList:
+            linked_list = ArrayLinkedList()
+            linked_list.values, linked_list.links = (_copy(column) for column in source.columns)
+            linked_list.head_index, linked_list.tail_index = source.first, source.last
+            linked_list.size, linked_list.free = source.size, source.free
+            return linked_list
+        values, links = source.columns
+
+        def chain():
+            index = source.first
+            while index != -1:
+                yield values[index]
+                index = links[index]
+        linked_list = cls(**options)
+        linked_list.extend(chain())
+        return linked_list
+    finally:
+        source.close()
+
+
+def _load_stack(cls, path, options):
+    source = _File(path, STACK)
+    try:
+        stack = cls(**options)
+        stack.push_many(_copy(source.columns[0]))
+        return stack
+    finally:
+        source.close()
+
+
+def load(cls, path, **options):
+    # Reconstrói uma estrutura de cls (BinaryTree, ArrayBinaryTree, LinkedList, ArrayLinkedList ou
+    # Stack); options são passadas ao construtor das listas e da pilha
+    if issubclass(cls, (BinaryTree, ArrayBinaryTree)):
+        return _load_tree(cls, path)
+    if issubclass(cls, (LinkedList, ArrayLinkedList)):
+        return _load_list(cls, path, options)
+    if issubclass(cls, Stack):
+        return _load_stack(cls, path, options)
+    raise TypeError(f"Não é possível carregar {cls.__name__}")
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("Estrutura só de leitura (mapeada em memória)")
+
+
+class _Mapped:
+    def close(self):
+        self.source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class MappedBinaryTree(_Mapped, ArrayBinaryTree):
+    # As leituras da ArrayBinaryTree (search, iter_*, inorder...) percorrem as vistas do ficheiro
+    insert = delete = _read_only
+
+    def __init__(self, path):
+        self.source = _File(path, TREE)
+        self.values, self.lefts, self.rights = self.source.columns
+        self.root_index, self.size, self.free = self.source.first, self.source.size, -1
+        self.balance = self.source.balance
+
+
+class MappedLinkedList(_Mapped, ArrayLinkedList):
+    append = extend = insert_at_start = insert_at_position = _read_only
+    remove_first = remove_last = remove_at_position = _read_only
+
+    def __init__(self, path):
+        self.source = _File(path, LIST)
+        self.values, self.links = self.source.columns
+        self.head_index, self.tail_index = self.source.first, self.source.last
+        self.size, self.free = self.source.size, -1
+
+
+class MappedStack(_Mapped, Stack):
+    push = push_many = pop = _read_only
+
+    def __init__(self, path):
+        self.source = _File(path, STACK)
+        self.items = self.source.columns[0]
+        self.metrics = None
+
+
+def open_mapped(path):
+    # Abre um snapshot só de leitura sem copiar os registos; feche-o com close() ou num bloco with
+    with open(path, 'rb') as source:
+        header = source.read(HEADER.size)
+    mapped = {TREE: MappedBinaryTree, LIST: MappedLinkedList, STACK: MappedStack}
+    if len(header) != HEADER.size or header[:4] != MAGIC or header[5] not in mapped:
+        raise ValueError(f"{path} não é um snapshot válido")
+    return mapped[header[5]](path)
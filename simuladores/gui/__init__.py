@@ -0,0 +1,22 @@
+"""
+Aplicações Tkinter dos simuladores. Os módulos das aplicações (e o próprio Tkinter) só são importados
+quando uma delas é pedida, por exemplo `from simuladores.gui import StackApp`.
+"""
+_APPS = {
+    'BinaryTreeApp': 'binary_tree_app',
+    'LinkedListApp': 'linked_list_app',
+    'StackApp': 'stack_app',
+    'ScrollableCanvas': 'viewport',
+    'TidyTreeLayout': 'tree_layout',
+    'BPlusLayout': 'tree_layout',
+    'StatsPanel': 'stats_panel',
+    'ReplayPlayer': 'replay_player',
+    'Animator': 'animation',
+}
+
+
+def __getattr__(name):
+    if name in _APPS:
+        from importlib import import_module
+        return getattr(import_module(f'.{_APPS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,100 @@
+"""
+Fila de animações partilhada pelas aplicações, conduzida por after() para nunca bloquear o mainloop().
+
+Cada animação é um gerador: cada yield é um passo (normalmente marcar um nó em highlighted) e o valor
+devolvido com return é passado à função done, chamada no fim. A cada quadro aplicam-se todos os passos
+já vencidos, segundo a velocidade atual, e redesenha-se uma única vez; um quadro nunca gasta mais de
+FRAME_BUDGET segundos em passos, por isso percorrer milhares de nós não atrasa os eventos do teclado e
+do rato. finish() salta para o fim de todas as animações pendentes.
+"""
+import time
+from collections import deque
+
+# Intervalo mínimo entre quadros (~60 por segundo)
+FRAME_MS = 16
+# Tempo máximo de passos aplicados num quadro
+FRAME_BUDGET = 0.008
+# Cores dos destaques: elementos percorridos e o elemento procurado, inserido ou removido
+VISITED = '#ffc107'
+TARGET = '#4caf50'
+
+class Animator:
+    def __init__(self, master, redraw, speed=4):
+        # speed: passos por segundo; redraw: o desenho incremental da aplicação, que consulta highlighted
+        self.master = master
+        self.redraw = redraw
+        self.speed = speed
+        # Chave do elemento destacado (valor, posição ou índice, conforme a aplicação) -> cor
+        self.highlighted = {}
+        self.queue = deque()
+        self._job = None
+        self._due = 0.0  # Passos vencidos e ainda não aplicados
+        self._last = 0.0
+
+    def add(self, steps, done=None):
+        # Enfileira uma animação; começa depois das que já estão na fila
+        self.queue.append((iter(steps), done))
+        if self._job is None:
+            self._last = time.perf_counter()
+            self._due = 1.0  # O primeiro passo aparece logo
+            self._job = self.master.after(0, self._tick)
+
+    def busy(self):
+        return bool(self.queue)
+
+    def set_speed(self, speed):
+        self.speed = max(float(speed), 0.1)
+
+    def finish(self):
+        # Aplica já todos os passos pendentes e desenha apenas o estado final
+        if self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+        try:
+            while self._advance():
+                pass
+        finally:
+            self._due = 0.0
+            self.redraw()
+
+    def _advance(self):
+        # Aplica um passo da primeira animação; devolve False quando a fila está vazia
+        while self.queue:
+            steps, done = self.queue[0]
+            try:
+                next(steps)
+                return True
+            except StopIteration as stop:
+                result = stop.value
+            except BaseException:
+                self.queue.popleft()
+                self.highlighted.clear()
+                raise
+            self.queue.popleft()
+            if done is not None:
+                self.redraw()  # O estado final fica visível enquanto done mostra o resultado
+            self.highlighted.clear()
+            if done is not None:
+                done(result)
+        return False
+
+    def _tick(self):
+        now = time.perf_counter()
+        self._due += (now - self._last) * self.speed
+        self._last = now
+        deadline = now + FRAME_BUDGET
+        try:
+            while self._due >= 1 and self._advance():
+                self._due -= 1
+                if time.perf_counter() > deadline:
+                    # Atrasa a animação em vez dos eventos: o atraso acumulado é descartado
+                    self._due = min(self._due, 1.0)
+                    break
+            self.redraw()
+        finally:
+            if self.queue:
+                wait = (1 - self._due) / self.speed * 1000 if self._due < 1 else 0
+                self._job = self.master.after(max(FRAME_MS, int(wait)), self._tick)
+            else:
+                self._job = None
+                self._due = 0.0
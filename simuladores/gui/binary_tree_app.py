@@ -0,0 +1,484 @@
+"""
+Aplicação Tkinter da árvore binária: desenha a árvore com o layout de Reingold–Tilford e permite
+inserir, remover, pesquisar e percorrer. Com fanout, mostra uma árvore B+, com nós de várias chaves.
+
+Trabalho em segundo plano (ver workers): ao carregar um ficheiro, só a conversão e a ordenação das partes
+correm no pool de processos. A fusão com a árvore atual, a construção da nova árvore (from_sorted) e as
+travessias correm numa thread, porque produzem ou leem nós que têm de viver neste processo: enviá-los de
+ou para outro processo obrigaria a serializar a árvore inteira, o que custa mais do que construí-la. Essa
+thread partilha o GIL com o Tkinter; a janela continua a responder (o interpretador alterna entre threads
+de poucos em poucos milissegundos), mas estes passos não ficam mais rápidos com mais núcleos.
+"""
+import argparse
+import tkinter as tk
+from tkinter import filedialog, simpledialog, messagebox
+
+from ..core.binary_tree import RED, BinaryTree
+from ..core.bplus_tree import BPlusTree
+from ..core.loader import merge_unique, read_sorted_keys, split_file
+from ..core.metrics import Metrics
+from ..core.persistent import PersistentBinaryTree, PersistentBPlusTree, History
+from .animation import Animator, TARGET, VISITED
+from .stats_panel import StatsPanel
+from .tree_layout import BPlusLayout, TidyTreeLayout
+from .viewport import ScrollableCanvas
+from .workers import PROGRESS_EVERY, Workers
+
+color1 = '#393946'
+color2 = '#FFFFFF'
+
+class BinaryTreeApp:
+    def __init__(self, master, balance=None, fanout=None):
+        # fanout: em vez da árvore binária (e de balance), uma árvore B+ com esse número de filhos por nó
+        self.master = master
+        self.master.title("Binary Tree" if fanout is None else "B+ Tree")
+        self.center_window()
+        self.view = ScrollableCanvas(master, 800, 600, color1, self.draw_tree)
+        self.view.pack()
+        self.canvas = self.view.canvas
+
+        # O indicador (a altura, O(n) sem balanceamento) só é lido quando o painel de estatísticas se
+        # atualiza, não a cada operação
+        self.metrics = Metrics(sample_every=None)
+        self.stats_panel = None
+        # Árvore persistente: cada operação guarda a versão anterior para desfazer/refazer em O(log n)
+        self.fanout = fanout
+        if fanout is None:
+            self.tree = PersistentBinaryTree(balance, metrics=self.metrics)
+            self.layout = TidyTreeLayout()
+        else:
+            self.tree = PersistentBPlusTree(fanout, metrics=self.metrics)
+            self.layout = BPlusLayout()
+        self.history = History(self.tree)
+        # Itens já desenhados: nó -> [oval, texto, x, y, valor, cor] e (pai, filho) -> [linha, coords]
+        self.node_items = {}
+        self.edge_items = {}
+        self.drawn_scale = self.view.scale
+        # Destaques dos percursos, indexados pelo valor do nó (e, na árvore B+, também pelo próprio nó)
+        self.animator = Animator(master, self.draw_tree)
+        # Travessias e carregamentos correm sobre versões imutáveis da árvore, fora da thread do Tkinter
+        self.workers = Workers(master)
+
+        control_frame = tk.Frame(master, bg=color1)
+        control_frame.pack()
+
+        self.insert_button = tk.Button(control_frame, text="Inserir", command=self.insert, bg='#4caf50', fg='white')
+        self.insert_button.grid(row=0, column=1, padx=5, pady=5)
+
+        self.delete_button = tk.Button(control_frame, text="Remover", command=self.delete, bg='#f44336', fg='white')
+        self.delete_button.grid(row=0, column=2, padx=5, pady=5)
+
+        self.search_button = tk.Button(control_frame, text="Pesquisar", command=self.search, bg='#2196f3', fg='white')
+        self.search_button.grid(row=0, column=3, padx=5, pady=5)
+
+        self.inorder_button = tk.Button(control_frame, text="Em ordem", command=self.inorder, bg='#ffc107', fg='black')
+        self.inorder_button.grid(row=0, column=4, padx=5, pady=5)
+
+        self.preorder_button = tk.Button(control_frame, text="Pré-ordem", command=self.preorder, bg='#ffc107', fg='black')
+        self.preorder_button.grid(row=0, column=5, padx=5, pady=5)
+
+        self.postorder_button = tk.Button(control_frame, text="Pós-ordem", command=self.postorder, bg='#ffc107', fg='black')
+        self.postorder_button.grid(row=0, column=6, padx=5, pady=5)
+
+        self.levelorder_button = tk.Button(control_frame, text="Por nível", command=self.levelorder, bg='#ffc107', fg='black')
+        self.levelorder_button.grid(row=0, column=7, padx=5, pady=5)
+
+        if fanout is not None:
+            # Na árvore B+ as chaves dos nós internos são só separadores: só a travessia em ordem
+            # (as folhas da esquerda para a direita) tem sentido
+            for button in (self.preorder_button, self.postorder_button, self.levelorder_button):
+                button.config(state=tk.DISABLED)
+
+        self.stats_button = tk.Button(control_frame, text="Estatísticas", command=self.show_stats, bg='#9e9e9e', fg='black')
+        self.stats_button.grid(row=0, column=8, padx=5, pady=5)
+
+        self.undo_button = tk.Button(control_frame, text="Desfazer", command=self.undo, bg='#9e9e9e', fg='black')
+        self.undo_button.grid(row=0, column=9, padx=5, pady=5)
+
+        self.redo_button = tk.Button(control_frame, text="Refazer", command=self.redo, bg='#9e9e9e', fg='black')
+        self.redo_button.grid(row=0, column=10, padx=5, pady=5)
+
+        self.speed_label = tk.Label(control_frame, text="Passos/s", bg=color1, fg=color2)
+        self.speed_label.grid(row=1, column=1, padx=5)
+
+        self.speed_scale = tk.Scale(control_frame, from_=1, to=500, orient=tk.HORIZONTAL, length=300,
+                                    command=self.animator.set_speed, bg=color1, fg=color2, highlightthickness=0)
+        self.speed_scale.set(self.animator.speed)
+        self.speed_scale.grid(row=1, column=2, columnspan=5, padx=5)
+
+        self.skip_button = tk.Button(control_frame, text="Saltar animação", command=self.skip, bg='#9e9e9e', fg='black')
+        self.skip_button.grid(row=1, column=7, columnspan=2, padx=5, pady=5)
+
+        self.load_button = tk.Button(control_frame, text="Carregar", command=self.load_file, bg='#4caf50', fg='white')
+        self.load_button.grid(row=1, column=9, padx=5, pady=5)
+
+        self.cancel_button = tk.Button(control_frame, text="Cancelar", command=self.workers.cancel_all, bg='#f44336',
+                                       fg='white')
+        self.cancel_button.grid(row=1, column=10, padx=5, pady=5)
+
+        master.bind('<Control-z>', self.undo)
+        master.bind('<Control-y>', self.redo)
+        master.bind('<Escape>', self.skip)
+        master.protocol('WM_DELETE_WINDOW', self.close)
+
+        self.draw_tree()
+
+    def center_window(self):
+        self.master.update_idletasks()
+        width = self.master.winfo_width()
+        height = self.master.winfo_height()
+        x = (self.master.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.master.winfo_screenheight() // 2) - (height // 2)
+        self.master.geometry('{}x{}+{}+{}'.format(width, height, x, y))
+
+    def draw_tree(self):
+        # Só os nós cuja subárvore intersecta a área visível são materializados, e o redesenho é
+        # incremental: só cria, move, altera ou apaga os itens do canvas que mudaram. Subárvores
+        # fora da vista ou densas demais para a escala atual aparecem como um triângulo recolhido.
+        if self.fanout is not None:
+            self.draw_bplus()
+            return
+        canvas = self.canvas
+        scale = self.view.scale
+        if scale != self.drawn_scale:
+            canvas.delete('node', 'edge')
+            self.node_items = {}
+            self.edge_items = {}
+            self.drawn_scale = scale
+        canvas.delete('summary')
+
+        self.layout.update(self.tree.root)
+        self.view.set_extent(*self.layout.extent(self.tree.root))
+        positions, collapsed = self.layout.visible(self.tree.root, self.view.visible_region(), scale)
+
+        edges = {}
+        for node, (x, y) in positions.items():
+            for child in (node.left, node.right):
+                if child in positions:
+                    edges[(node, child)] = (x, y) + positions[child]
+        new_edges = False
+        for edge in [edge for edge in self.edge_items if edge not in edges]:
+            canvas.delete(self.edge_items.pop(edge)[0])
+        for edge, coords in edges.items():
+            item = self.edge_items.get(edge)
+            if item is None:
+                line = canvas.create_line(*[c * scale for c in coords], fill='#ffffff', tags='edge')
+                self.edge_items[edge] = [line, coords]
+                new_edges = True
+            elif item[1] != coords:
+                canvas.coords(item[0], *[c * scale for c in coords])
+                item[1] = coords
+
+        for node in [node for node in self.node_items if node not in positions]:
+            oval, text = self.node_items.pop(node)[:2]
+            canvas.delete(oval)
+            if text is not None:
+                canvas.delete(text)
+        show_text = 30 * scale >= 14
+        highlighted = self.animator.highlighted
+        for node, (x, y) in positions.items():
+            fill = highlighted.get(node.val)
+            if fill is None:
+                fill = '#f44336' if self.tree.balance == 'rb' and node.color == RED else '#3f51b5'
+            item = self.node_items.get(node)
+            if item is None:
+                oval = canvas.create_oval((x-15) * scale, (y-15) * scale, (x+15) * scale, (y+15) * scale,
+                                          outline='#ffffff', fill=fill, tags='node')
+                text = None
+                if show_text:
+                    text = canvas.create_text(x * scale, y * scale, text=str(node.val), fill='#ffffff', tags='node')
+                self.node_items[node] = [oval, text, x, y, node.val, fill]
+                continue
+            oval, text, old_x, old_y, old_val, old_fill = item
+            if (old_x, old_y) != (x, y):
+                for part in (oval, text):
+                    if part is not None:
+                        canvas.move(part, (x - old_x) * scale, (y - old_y) * scale)
+                item[2:4] = [x, y]
+            if old_val != node.val:
+                if text is not None:
+                    canvas.itemconfig(text, text=str(node.val))
+                item[4] = node.val
+            if old_fill != fill:
+                canvas.itemconfig(oval, fill=fill)
+                item[5] = fill
+
+        self.draw_collapsed(positions, collapsed)
+        if new_edges or collapsed:
+            canvas.tag_lower('edge')
+
+    def draw_collapsed(self, positions, collapsed):
+        canvas = self.canvas
+        scale = self.view.scale
+        for parent, x, y in collapsed:
+            px, py = positions[parent]
+            canvas.create_line(px * scale, py * scale, x * scale, (y-10) * scale, fill='#ffffff', dash=(2, 2),
+                               tags='summary')
+            canvas.create_polygon(x * scale, (y-10) * scale, (x-8) * scale, (y+6) * scale, (x+8) * scale,
+                                  (y+6) * scale, outline='#ffffff', fill=color1, tags='summary')
+
+    def draw_bplus(self):
+        # Cada nó é uma fila de células, uma por chave; as arestas saem da fronteira entre as chaves
+        # que delimitam o filho e as folhas ligam-se por setas. Só os nós visíveis são materializados,
+        # por isso o desenho é refeito por inteiro a cada chamada.
+        canvas = self.canvas
+        scale = self.view.scale
+        canvas.delete('bplus', 'summary')
+        root = self.tree.root
+        self.layout.update(root)
+        self.view.set_extent(*self.layout.extent(root))
+        positions, collapsed = self.layout.visible(root, self.view.visible_region(), scale)
+        cell = self.layout.CELL
+        half = self.layout.NODE_HEIGHT / 2
+        show_text = cell * scale >= 14
+        highlighted = self.animator.highlighted
+        for node, (x, y) in positions.items():
+            left = x - len(node.keys) * cell / 2
+            leaf = node.children is None
+            if not leaf:
+                for index, child in enumerate(node.children):
+                    if child in positions:
+                        cx, cy = positions[child]
+                        canvas.create_line((left + index * cell) * scale, (y + half) * scale, cx * scale,
+                                           (cy - half) * scale, fill='#ffffff', tags=('bplus', 'link'))
+                self.draw_leaf_links(node, positions)
+            fill = highlighted.get(node, '#009688' if leaf else '#3f51b5')
+            for index, key in enumerate(node.keys):
+                x0 = left + index * cell
+                canvas.create_rectangle(x0 * scale, (y - half) * scale, (x0 + cell) * scale, (y + half) * scale,
+                                        outline='#ffffff', fill=highlighted.get(key, fill) if leaf else fill,
+                                        tags='bplus')
+                if show_text:
+                    canvas.create_text((x0 + cell / 2) * scale, y * scale, text=str(key), fill='#ffffff',
+                                       tags='bplus')
+        self.draw_collapsed(positions, collapsed)
+        canvas.tag_lower('link')
+
+    def draw_leaf_links(self, node, positions):
+        # Setas entre as folhas vizinhas que se separam em node: a última folha de cada filho e a primeira
+        # do filho seguinte. Não se usa next, que a PersistentBPlusTree não mantém; as descidas param no
+        # primeiro nó fora da vista.
+        cell = self.layout.CELL
+        scale = self.view.scale
+        for before, after in zip(node.children, node.children[1:]):
+            while before.children is not None and before in positions:
+                before = before.children[-1]
+            while after.children is not None and after in positions:
+                after = after.children[0]
+            if before.children is None and after.children is None and before in positions and after in positions:
+                bx, by = positions[before]
+                ax, ay = positions[after]
+                self.canvas.create_line((bx + len(before.keys) * cell / 2) * scale, by * scale,
+                                        (ax - len(after.keys) * cell / 2) * scale, ay * scale, arrow=tk.LAST,
+                                        fill='#ffc107', tags=('bplus', 'link'))
+
+    # As operações passam pela fila de animações, por isso aplicam-se pela ordem em que foram pedidas;
+    # cada uma percorre a árvore só quando chega a sua vez
+
+    def path_steps(self, value):
+        # Destaca o caminho de uma pesquisa; devolve o nó com value, se existir
+        if self.fanout is not None:
+            return (yield from self.leaf_path_steps(value))
+        node = None
+        for node in self.tree.search_path(value):
+            self.animator.highlighted[node.val] = VISITED
+            yield
+        if node is not None and node.val == value:
+            self.animator.highlighted[value] = TARGET
+            yield
+            return node
+        return None
+
+    def leaf_path_steps(self, value):
+        # Na árvore B+ destacam-se os nós do caminho até a folha e, nela, a célula de value
+        node = None
+        for node in self.tree.search_path(value):
+            self.animator.highlighted[node] = VISITED
+            yield
+        if node is not None and value in node.keys:
+            self.animator.highlighted[value] = TARGET
+            yield
+            return node
+        return None
+
+    def insert_steps(self, value):
+        yield from self.path_steps(value)
+        before = self.tree.snapshot()
+        self.tree.insert(value)
+        self.history.record(before)
+        self.animator.highlighted[value] = TARGET
+        yield
+
+    def delete_steps(self, value):
+        node = yield from self.path_steps(value)
+        if self.fanout is None and node is not None and node.left is not None and node.right is not None:
+            # Com dois filhos, o valor é substituído pelo sucessor: o mínimo da subárvore direita
+            successor = node.right
+            while successor is not None:
+                self.animator.highlighted[successor.val] = VISITED
+                yield
+                successor = successor.left
+        try:
+            before = self.tree.snapshot()
+            self.tree.delete(value)
+            self.history.record(before)
+        except ValueError as e:
+            return str(e)
+
+    def search_steps(self, value):
+        yield from self.path_steps(value)
+        # O resultado vem da pesquisa normal, que é a cronometrada pelas métricas
+        return self.tree.search(value) is not None
+
+    def traversal_steps(self, version, values, order, title, label):
+        # A travessia foi feita sobre version; se a árvore mudou entretanto, é repetida sobre a atual
+        if self.tree.root is not version.root:
+            self.start_traversal(order, title, label)
+            return None
+        for value in values:
+            self.animator.highlighted[value] = VISITED
+            yield
+        return values
+
+    def apply_load(self, version, built, parts):
+        # Mesma regra: as chaves carregadas juntam-se à versão em que foram fundidas
+        if self.tree.root is not version.root:
+            self.build(parts)
+            return
+        before = self.tree.snapshot()
+        self.tree.restore(built)
+        self.history.record(before)
+
+    def insert(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.insert_steps(value))
+
+    def delete(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.delete_steps(value), self.show_error)
+
+    def search(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.search_steps(value), lambda found: self.show_search_result(value, found))
+
+    def show_search_result(self, value, found):
+        if found:
+            messagebox.showinfo("Resultado da pesquisa", f"O valor {value} foi encontrado na árvore.")
+        else:
+            messagebox.showinfo("Resultado da pesquisa", f"O Valor {value} não foi encontrado na árvore.")
+
+    def show_error(self, error):
+        if error is not None:
+            messagebox.showerror("Erro", str(error))
+
+    def start_traversal(self, order, title, label):
+        version = self.tree.snapshot()
+
+        def done(values):
+            self.animator.add(self.traversal_steps(version, values, order, title, label),
+                              lambda result: self.show_traversal(title, label, result))
+        self.workers.run(traverse(version, order), done, self.workers.title_progress(label), self.show_error)
+
+    def show_traversal(self, title, label, result):
+        if result is not None:
+            messagebox.showinfo(title, f"{label}: {result}")
+
+    def inorder(self):
+        self.start_traversal('inorder', "Travessia em Ordem", "Em ordem")
+
+    def preorder(self):
+        self.start_traversal('preorder', "Travessia em Pré-ordem", "Pré-ordem")
+
+    def postorder(self):
+        self.start_traversal('postorder', "Travessia Pós-ordem", "Pós-ordem")
+
+    def levelorder(self):
+        self.start_traversal('levelorder', "Travessia por Nível", "Por nível")
+
+    def load_file(self):
+        # Um inteiro por linha (ou separados por espaços): os processos convertem e ordenam partes do
+        # ficheiro, uma thread funde-as com a árvore atual e constrói a nova árvore balanceada
+        path = filedialog.askopenfilename(title="Carregar chaves")
+        if path:
+            parts = split_file(path, 4 * self.workers.processes)
+            self.workers.map(read_sorted_keys, parts, self.build, self.workers.title_progress("A ler"),
+                             self.show_error)
+
+    def build(self, parts):
+        version = self.tree.snapshot()
+
+        def done(built):
+            # A troca passa pela fila de animações, depois das operações já pedidas
+            self.animator.add((), lambda _: self.apply_load(version, built, parts))
+        self.workers.run(build(version, parts), done, self.workers.title_progress("A construir"), self.show_error)
+
+    def skip(self, event=None):
+        self.animator.finish()
+
+    def undo(self, event=None):
+        self.animator.finish()
+        if self.history.undo():
+            self.draw_tree()
+
+    def redo(self, event=None):
+        self.animator.finish()
+        if self.history.redo():
+            self.draw_tree()
+
+    def show_stats(self):
+        if self.stats_panel is not None and self.stats_panel.exists():
+            self.stats_panel.lift()
+        else:
+            self.stats_panel = StatsPanel(self.master, self.metrics, color1, color2)
+
+    def close(self):
+        self.workers.shutdown()
+        self.master.destroy()
+
+    def get_value_from_user(self):
+        value = simpledialog.askinteger("Input", "Digite um valor:")
+        return value
+
+
+# Corridos nas threads de Workers (não nos processos: ver a docstring do módulo); só leem a versão
+# recebida, que nunca é alterada
+
+def traverse(version, order):
+    total = len(version)
+    values = []
+    for value in getattr(version, f'iter_{order}')():
+        values.append(value)
+        if len(values) % PROGRESS_EVERY == 0:
+            yield len(values), total
+    return values
+
+
+def build(version, parts):
+    total = len(version) + sum(map(len, parts))
+    keys = []
+    for key in merge_unique(version.iter_inorder(), *parts):
+        keys.append(key)
+        if len(keys) % PROGRESS_EVERY == 0:
+            yield len(keys), total
+    if isinstance(version, BPlusTree):
+        # Da classe da versão, para a árvore construída ter (ou não) as folhas ligadas como ela
+        return type(version).from_sorted(keys, version.fanout)
+    return BinaryTree.from_sorted(keys, version.balance)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de árvores binárias de busca e árvores B+.")
+    parser.add_argument('--balance', choices=('avl', 'rb'), help="modo de balanceamento da árvore binária")
+    parser.add_argument('--fanout', type=int, help="mostrar uma árvore B+ com este número de filhos por nó")
+    args = parser.parse_args()
+    root = tk.Tk()
+    root.geometry('820x710')
+    root.config(bg=color1)
+    app = BinaryTreeApp(root, args.balance, args.fanout)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""
+Aplicação Tkinter da lista encadeada: inserções e remoções no início, no fim ou numa posição, e
+buscas por valor ou posição, com o desenho atualizado num Canvas.
+"""
+import math
+import os
+import tkinter as tk
+from tkinter import filedialog, simpledialog, messagebox
+
+from ..core.linked_list import LinkedList
+from ..core.loader import read_values, split_file
+from ..core.metrics import Metrics
+from .animation import Animator, TARGET, VISITED
+from .stats_panel import StatsPanel
+from .viewport import ScrollableCanvas
+from .workers import Workers
+
+color1 = '#393946'
+color2 = '#FFFFFF'
+
+class LinkedListApp:
+    def __init__(self, master):
+        self.master = master
+        self.master.title('Linked List')
+        self.view = ScrollableCanvas(master, 855, 400, color1, self.draw_linked_list)
+        self.view.pack()
+        self.canvas = self.view.canvas
+        
+        self.metrics = Metrics(sample_every=None)
+        self.stats_panel = None
+        self.linked_list = LinkedList(metrics=self.metrics)
+        # Itens já desenhados: nó -> [retângulo, texto ou None, seta ou None, x, preenchimento]
+        self.node_items = {}
+        self.drawn_scale = self.view.scale
+        # Destaques dos percursos, indexados pela posição
+        self.animator = Animator(master, self.draw_linked_list)
+        # Carregamentos de ficheiros correm numa thread, sobre uma lista separada
+        self.workers = Workers(master)
+        
+        self.insert_start_button = tk.Button(master, relief='raised', text="Inserir no início", command=self.insert_at_start)
+        self.insert_start_button.pack(side=tk.LEFT)
+
+        self.insert_end_button = tk.Button(master, text="Inserir no fim", command=self.insert_at_end)
+        self.insert_end_button.pack(side=tk.LEFT)
+        
+        self.insert_position_button = tk.Button(master, text="Inserir na posição", command=self.insert_at_position)
+        self.insert_position_button.pack(side=tk.LEFT)
+
+        self.remove_first_button = tk.Button(master, text="Remover o primeiro", command=self.remove_first)
+        self.remove_first_button.pack(side=tk.LEFT)
+        
+        self.remove_last_button = tk.Button(master, text="Remover o último", command=self.remove_last)
+        self.remove_last_button.pack(side=tk.LEFT)
+        
+        self.remove_position_button = tk.Button(master, text="Remove na posição", command=self.remove_at_position)
+        self.remove_position_button.pack(side=tk.LEFT)
+        
+        self.find_value_button = tk.Button(master, text="Encontrar pelo valor", command=self.find_value)
+        self.find_value_button.pack(side=tk.LEFT)
+        
+        self.find_position_button = tk.Button(master, text="Encontrar pela posição", command=self.find_position)
+        self.find_position_button.pack(side=tk.LEFT)
+
+        self.stats_button = tk.Button(master, text="Estatísticas", command=self.show_stats)
+        self.stats_button.pack(side=tk.LEFT)
+
+        self.speed_scale = tk.Scale(master, label="Passos/s", from_=1, to=500, orient=tk.HORIZONTAL,
+                                    command=self.animator.set_speed)
+        self.speed_scale.set(self.animator.speed)
+        self.speed_scale.pack(side=tk.LEFT)
+
+        self.skip_button = tk.Button(master, text="Saltar animação", command=self.skip)
+        self.skip_button.pack(side=tk.LEFT)
+
+        self.load_button = tk.Button(master, text="Carregar", command=self.load_file)
+        self.load_button.pack(side=tk.LEFT)
+
+        self.cancel_button = tk.Button(master, text="Cancelar", command=self.workers.cancel_all)
+        self.cancel_button.pack(side=tk.LEFT)
+
+        master.bind('<Escape>', self.skip)
+        master.protocol('WM_DELETE_WINDOW', self.close)
+
+    def draw_linked_list(self, text_color=color2, arrow_color=color2):
+        # O nó na posição i ocupa x = 50 + 100*i. Só os nós dentro da área visível são
+        # materializados (e redesenhados de forma incremental: criados, movidos ou apagados);
+        # os que ficam de fora resumem-se a marcadores "+N" nas margens.
+        canvas = self.canvas
+        scale = self.view.scale
+        size = len(self.linked_list)
+        self.view.set_extent(100 + 100 * size, 400)
+        if scale != self.drawn_scale:
+            for item in self.node_items.values():
+                for part in item[:3]:
+                    if part is not None:
+                        canvas.delete(part)
+            self.node_items = {}
+            self.drawn_scale = scale
+        canvas.delete('summary')
+
+        x0, y0, x1, y1 = self.view.visible_region()
+        first = max(0, math.ceil((x0 - 150) / 100))
+        last = min(size - 1, math.floor((x1 - 50) / 100))
+        # Nível de detalhe: sem texto se a caixa tiver menos de 15px, uma faixa única abaixo de 2px por nó
+        box_width = 50 * scale
+        if 100 * scale < 2:
+            first = last + 1
+
+        visited = set()
+        highlighted = self.animator.highlighted
+        current = self.linked_list.node_at(first) if first <= last else None
+        x, y = 50 + 100 * first, 50
+        for position in range(first, last + 1):
+            visited.add(current)
+            fill = highlighted.get(position, '')
+            item = self.node_items.get(current)
+            if item is None:
+                text = None
+                if box_width >= 15:
+                    text = canvas.create_text((x+25) * scale, (y+15) * scale, text=str(current.value), fill=text_color)
+                rectangle = canvas.create_rectangle(x * scale, y * scale, (x+50) * scale, (y+30) * scale,
+                                                    outline=color2, fill=fill)
+                if text is not None:
+                    canvas.tag_raise(text, rectangle)
+                item = [rectangle, text, None, x, fill]
+                self.node_items[current] = item
+            else:
+                if item[3] != x:
+                    for part in item[:3]:
+                        if part is not None:
+                            canvas.move(part, (x - item[3]) * scale, 0)
+                    item[3] = x
+                if item[4] != fill:
+                    canvas.itemconfig(item[0], fill=fill)
+                    item[4] = fill
+            if current.next and item[2] is None:
+                item[2] = canvas.create_line((x+50) * scale, (y+15) * scale, (x+100) * scale, (y+15) * scale,
+                                             arrow=tk.LAST, fill=arrow_color)
+            elif not current.next and item[2] is not None:
+                canvas.delete(item[2])
+                item[2] = None
+            current = current.next
+            x += 100
+        for node in [node for node in self.node_items if node not in visited]:
+            for part in self.node_items.pop(node)[:3]:
+                if part is not None:
+                    canvas.delete(part)
+
+        if first > last and size:
+            left, right = max(x0, 50), min(x1, 100 * size)
+            if left < right:
+                canvas.create_rectangle(left * scale, 50 * scale, right * scale, 80 * scale, outline=color2,
+                                        fill=color2, stipple='gray50', tags='summary')
+        else:
+            if first > 0:
+                canvas.create_text(x0 * scale + 30, 100 * scale, text=f"◀ +{first}", fill=color2, tags='summary')
+            if last < size - 1:
+                canvas.create_text(x1 * scale - 30, 100 * scale, text=f"+{size - 1 - last} ▶", fill=color2,
+                                   tags='summary')
+
+    # As operações passam pela fila de animações, por isso aplicam-se pela ordem em que foram pedidas;
+    # cada uma lê a lista só quando chega a sua vez
+
+    def walk_steps(self, last):
+        # Destaca as posições 0..last, como o percurso a partir da cabeça
+        for position in range(last + 1):
+            self.animator.highlighted[position] = VISITED
+            yield
+
+    def target_step(self, position):
+        self.animator.highlighted[position] = TARGET
+        yield
+
+    def insert_steps(self, value, position):
+        # Posições inválidas chegam logo à lista, que devolve o erro sem percorrer nós
+        if 0 <= position <= len(self.linked_list):
+            yield from self.walk_steps(position - 1)
+        try:
+            self.linked_list.insert_at_position(value, position)
+        except IndexError as e:
+            return str(e)
+        yield from self.target_step(position)
+
+    def remove_steps(self, position):
+        if not 0 <= position < len(self.linked_list):
+            # Erro, ou nada a fazer na posição igual ao tamanho
+            try:
+                self.linked_list.remove_at_position(position)
+            except IndexError as e:
+                return str(e)
+            return None
+        yield from self.walk_steps(position - 1)
+        yield from self.target_step(position)
+        self.linked_list.remove_at_position(position)
+
+    def find_value_steps(self, value):
+        position = self.linked_list.find_value(value)
+        if position == -1:
+            yield from self.walk_steps(len(self.linked_list) - 1)
+        else:
+            yield from self.walk_steps(position - 1)
+            yield from self.target_step(position)
+        return position
+
+    def find_position_steps(self, position):
+        value = self.linked_list.find_position(position)
+        if value is not None:
+            yield from self.walk_steps(position - 1)
+            yield from self.target_step(position)
+        return value
+
+    def insert_at_start(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.insert_at_start_steps(value))
+
+    def insert_at_start_steps(self, value):
+        self.linked_list.insert_at_start(value)
+        yield from self.target_step(0)
+
+    def insert_at_end(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.append_steps(value))
+
+    def append_steps(self, value):
+        # O fim é alcançado pela cauda, sem percurso
+        self.linked_list.append(value)
+        yield from self.target_step(len(self.linked_list) - 1)
+    
+    def insert_at_position(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            position = self.get_position_from_user()
+            if position is not None:
+                self.animator.add(self.insert_steps(value, position), self.show_error)
+
+    def remove_first(self):
+        self.animator.add(self.remove_first_steps())
+
+    def remove_first_steps(self):
+        if len(self.linked_list):
+            yield from self.target_step(0)
+        self.linked_list.remove_first()
+
+    def remove_last(self):
+        self.animator.add(self.remove_last_steps())
+
+    def remove_last_steps(self):
+        # Numa lista simplesmente encadeada é preciso chegar ao penúltimo nó
+        size = len(self.linked_list)
+        if size:
+            yield from self.walk_steps(size - 2)
+            yield from self.target_step(size - 1)
+        self.linked_list.remove_last()
+
+    def remove_at_position(self):
+        position = self.get_position_from_user()
+        if position is not None:
+            self.animator.add(self.remove_steps(position), self.show_error)
+    
+    def find_value(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.find_value_steps(value), self.show_find_value_result)
+
+    def show_find_value_result(self, position):
+        if position == -1:
+            messagebox.showinfo("Resultado", "Valor não encontrado")
+        else:
+            messagebox.showinfo("Resultado", f"Valor encontrado na posição {position}")
+
+    def find_position(self):
+        position = self.get_position_from_user()
+        if position is not None:
+            self.animator.add(self.find_position_steps(position),
+                              lambda value: self.show_find_position_result(position, value))
+
+    def show_find_position_result(self, position, value):
+        if value is None:
+            messagebox.showinfo("Resultado", "Posição fora dos limites")
+        else:
+            messagebox.showinfo("Resultado", f"Valor {value} está na posição {position}")
+
+    def show_error(self, error):
+        if error is not None:
+            messagebox.showerror("Erro", str(error))
+
+    def load_file(self):
+        # Os valores são anexados ao fim da lista, pela ordem do ficheiro
+        path = filedialog.askopenfilename(title="Carregar valores")
+        if path:
+            self.workers.run(load(path), self.append_loaded, self.workers.title_progress("A carregar"),
+                             self.show_error)
+
+    def append_loaded(self, loaded):
+        # A lista carregada não é partilhada com ninguém: anexá-la, pela fila de animações, custa O(1)
+        self.animator.add((), lambda _: self.linked_list.splice(loaded))
+
+    def skip(self, event=None):
+        self.animator.finish()
+
+    def close(self):
+        self.workers.shutdown()
+        self.master.destroy()
+
+    def show_stats(self):
+        if self.stats_panel is not None and self.stats_panel.exists():
+            self.stats_panel.lift()
+        else:
+            self.stats_panel = StatsPanel(self.master, self.metrics, color1, color2)
+
+    def get_value_from_user(self):
+        value = simpledialog.askinteger("Input", "Digite um valor:")
+        return value
+
+    def get_position_from_user(self):
+        position = simpledialog.askinteger("Input", "Digite uma posição:")
+        return position
+
+
+# Bytes lidos entre dois yield de progresso
+LOAD_BLOCK = 1 << 20
+
+
+def load(path):
+    # Corre numa thread de Workers e constrói uma lista nova, que a thread do Tkinter ainda não vê
+    size = os.path.getsize(path)
+    loaded = LinkedList()
+    for part in split_file(path, max(1, size // LOAD_BLOCK)):
+        loaded.extend(read_values(part))
+        yield part[2], size
+    return loaded
+
+
+def main():
+    root = tk.Tk()
+    root.config(bg=color1)
+    root.resizable(width=False, height=False)
+    app = LinkedListApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
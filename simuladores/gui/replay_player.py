@@ -0,0 +1,37 @@
+"""
+Anima a repetição de um registo de operações numa das aplicações: a cada quadro, com after(), aplica
+até ops_per_frame operações do Replayer e redesenha uma única vez, a no máximo fps quadros por segundo.
+"""
+import time
+
+class ReplayPlayer:
+    def __init__(self, master, replayer, draw, fps=30, ops_per_frame=100):
+        self.master = master
+        self.replayer = replayer
+        self.draw = draw
+        self.interval = 1000 / fps
+        self.ops_per_frame = ops_per_frame
+        self.title = master.title()
+        self._job = None
+
+    def start(self):
+        if self._job is None:
+            self._job = self.master.after(0, self.frame)
+
+    def stop(self):
+        if self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+
+    def frame(self):
+        start = time.perf_counter()
+        applied = self.replayer.step(self.ops_per_frame)
+        self.draw()
+        stats = self.replayer.stats()
+        self.master.title(f"{self.title} — {stats['operations']} operações, {stats['errors']} erros")
+        if not applied:
+            self._job = None
+            return
+        # Desconta o tempo gasto neste quadro para manter a cadência pedida
+        elapsed = (time.perf_counter() - start) * 1000
+        self._job = self.master.after(max(1, int(self.interval - elapsed)), self.frame)
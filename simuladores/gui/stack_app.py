@@ -0,0 +1,274 @@
+"""
+Aplicação Tkinter da pilha: push, pop e peek, com a pilha desenhada num Canvas.
+"""
+import math
+import os
+import tkinter as tk
+from tkinter import filedialog, simpledialog, messagebox
+
+from ..core.loader import read_values, split_file
+from ..core.metrics import Metrics
+from ..core.persistent import PersistentStack, History
+from .animation import Animator, TARGET
+from .stats_panel import StatsPanel
+from .viewport import ScrollableCanvas
+from .workers import Workers
+
+color1 = '#393946'
+color2 = '#FFFFFF'
+
+class StackApp:
+    def __init__(self, master):
+        self.master = master
+        self.master.title("Stack")
+        self.view = ScrollableCanvas(master, 200, 300, color1, self.draw_stack)
+        self.view.pack()
+        self.canvas = self.view.canvas
+
+        self.metrics = Metrics(sample_every=None)
+        self.stats_panel = None
+        # Pilha persistente: cada operação guarda a versão anterior para desfazer/refazer em O(1)
+        self.stack = PersistentStack(metrics=self.metrics)
+        self.history = History(self.stack)
+        # Itens já desenhados: índice a partir da base -> [retângulo, texto ou None, valor, preenchimento]
+        self.item_ids = {}
+        self.drawn_size = 0
+        self.drawn_scale = self.view.scale
+        # Destaques, indexados a partir da base
+        self.animator = Animator(master, self.draw_stack)
+        # Carregamentos de ficheiros correm numa thread, sobre uma versão imutável da pilha
+        self.workers = Workers(master)
+
+        self.push_button = tk.Button(master, width=10, font='Arial 15', text="Push", command=self.push)
+        self.push_button.pack(side=tk.LEFT)
+
+        self.pop_button = tk.Button(master, width=10, font='Arial 15', text="Pop", command=self.pop)
+        self.pop_button.pack(side=tk.LEFT)
+
+        self.peek_button = tk.Button(master, width=10, font='Arial 15', text="Peek", command=self.peek)
+        self.peek_button.pack(side=tk.LEFT)
+
+        self.stats_button = tk.Button(master, width=10, font='Arial 15', text="Estatísticas", command=self.show_stats)
+        self.stats_button.pack(side=tk.LEFT)
+
+        self.undo_button = tk.Button(master, width=10, font='Arial 15', text="Desfazer", command=self.undo)
+        self.undo_button.pack(side=tk.LEFT)
+
+        self.redo_button = tk.Button(master, width=10, font='Arial 15', text="Refazer", command=self.redo)
+        self.redo_button.pack(side=tk.LEFT)
+
+        self.speed_scale = tk.Scale(master, label="Passos/s", from_=1, to=500, orient=tk.HORIZONTAL,
+                                    command=self.animator.set_speed)
+        self.speed_scale.set(self.animator.speed)
+        self.speed_scale.pack(side=tk.LEFT)
+
+        self.skip_button = tk.Button(master, width=10, font='Arial 15', text="Saltar", command=self.skip)
+        self.skip_button.pack(side=tk.LEFT)
+
+        self.load_button = tk.Button(master, width=10, font='Arial 15', text="Carregar", command=self.load_file)
+        self.load_button.pack(side=tk.LEFT)
+
+        self.cancel_button = tk.Button(master, width=10, font='Arial 15', text="Cancelar",
+                                       command=self.workers.cancel_all)
+        self.cancel_button.pack(side=tk.LEFT)
+
+        master.bind('<Control-z>', self.undo)
+        master.bind('<Control-y>', self.redo)
+        master.bind('<Escape>', self.skip)
+        master.protocol('WM_DELETE_WINDOW', self.close)
+
+        self.draw_stack()
+
+    def draw_stack(self, text_color=color2):
+        # O topo fica na linha 0 (y=50) e cada elemento abaixo desce 30px. Só as linhas dentro da
+        # área visível são materializadas; as restantes resumem-se a marcadores "+N". Push e pop
+        # deslocam os itens já desenhados numa única chamada (tag 'stack').
+        canvas = self.canvas
+        scale = self.view.scale
+        size = len(self.stack)
+        self.view.set_extent(200, 50 + 30 * size)
+        if scale != self.drawn_scale:
+            canvas.delete('stack')
+            self.item_ids = {}
+            self.drawn_scale = scale
+        elif size != self.drawn_size and self.item_ids:
+            canvas.move('stack', 0, 30 * scale * (size - self.drawn_size))
+        self.drawn_size = size
+        canvas.delete('summary')
+
+        x0, y0, x1, y1 = self.view.visible_region()
+        first_row = max(0, math.ceil((y0 - 65) / 30))
+        last_row = min(size - 1, math.floor((y1 - 35) / 30))
+        # Nível de detalhe: sem texto abaixo de 8px por linha, uma faixa única abaixo de 3px
+        row_height = 30 * scale
+        if row_height < 3:
+            first_row, last_row = last_row + 1, last_row
+        lowest, highest = size - 1 - last_row, size - 1 - first_row
+
+        for index in [index for index in self.item_ids if not lowest <= index <= highest]:
+            for part in self.item_ids.pop(index)[:2]:
+                if part is not None:
+                    canvas.delete(part)
+        x = 100 * scale
+        highlighted = self.animator.highlighted
+        for index in range(lowest, highest + 1):
+            value = self.stack[index]
+            fill = highlighted.get(index, '')
+            item = self.item_ids.get(index)
+            if item is not None:
+                if item[2] != value:
+                    if item[1] is not None:
+                        canvas.itemconfig(item[1], text=str(value))
+                    item[2] = value
+                if item[3] != fill:
+                    canvas.itemconfig(item[0], fill=fill)
+                    item[3] = fill
+                continue
+            y = (50 + 30 * (size - 1 - index)) * scale
+            rectangle = canvas.create_rectangle(x - 25*scale, y - 15*scale, x + 25*scale, y + 15*scale,
+                                                outline=color2, fill=fill, tags='stack')
+            text = None
+            if row_height >= 8:
+                text = canvas.create_text(x, y, text=str(value), fill=text_color, tags='stack')
+            self.item_ids[index] = [rectangle, text, value, fill]
+
+        if row_height < 3 and size:
+            top, bottom = max(y0, 35), min(y1, 35 + 30 * size)
+            if top < bottom:
+                canvas.create_rectangle(x - 25*scale, top * scale, x + 25*scale, bottom * scale,
+                                        outline=color2, fill=color2, stipple='gray50', tags='summary')
+        else:
+            if first_row > 0:
+                canvas.create_text(x, y0 * scale + 8, text=f"+{first_row} acima", fill=color2, tags='summary')
+            if last_row < size - 1:
+                canvas.create_text(x, y1 * scale - 8, text=f"+{size - 1 - last_row} abaixo", fill=color2,
+                                   tags='summary')
+
+    # As operações passam pela fila de animações, por isso aplicam-se pela ordem em que foram pedidas
+
+    def target_step(self):
+        # Destaca o topo
+        self.animator.highlighted[len(self.stack) - 1] = TARGET
+        yield
+
+    def push_steps(self, value):
+        before = self.stack.snapshot()
+        self.stack.push(value)
+        self.history.record(before)
+        yield from self.target_step()
+
+    def pop_steps(self):
+        if not self.stack.is_empty():
+            yield from self.target_step()
+        try:
+            before = self.stack.snapshot()
+            self.stack.pop()
+            self.history.record(before)
+        except IndexError as e:
+            return str(e)
+
+    def peek_steps(self):
+        try:
+            value = self.stack.peek()
+        except IndexError as e:
+            return None, str(e)
+        yield from self.target_step()
+        return value, None
+
+    def push(self):
+        value = self.get_value_from_user()
+        if value is not None:
+            self.animator.add(self.push_steps(value))
+
+    def pop(self):
+        self.animator.add(self.pop_steps(), self.show_error)
+
+    def peek(self):
+        self.animator.add(self.peek_steps(), self.show_peek_result)
+
+    def show_peek_result(self, result):
+        value, error = result
+        if error is not None:
+            messagebox.showerror("Erro", error)
+        else:
+            messagebox.showinfo("Valor do Topo", f"O valor do topo é {value}")
+
+    def show_error(self, error):
+        if error is not None:
+            messagebox.showerror("Erro", str(error))
+
+    def load_file(self):
+        # Os valores são empilhados pela ordem do ficheiro (o último fica no topo)
+        path = filedialog.askopenfilename(title="Carregar valores")
+        if path:
+            self.start_load(path)
+
+    def start_load(self, path):
+        base = self.stack.top
+
+        def done(loaded):
+            # A troca passa pela fila de animações, depois das operações já pedidas
+            self.animator.add((), lambda _: self.apply_load(path, base, loaded))
+        self.workers.run(load(path, self.stack.snapshot()), done, self.workers.title_progress("A carregar"),
+                         self.show_error)
+
+    def apply_load(self, path, base, loaded):
+        # Os valores foram empilhados sobre o topo base; se a pilha mudou entretanto, carrega de novo
+        if self.stack.top is not base:
+            self.start_load(path)
+            return
+        before = self.stack.snapshot()
+        self.stack.restore(loaded)
+        self.history.record(before)
+
+    def skip(self, event=None):
+        self.animator.finish()
+
+    def close(self):
+        self.workers.shutdown()
+        self.master.destroy()
+
+    def undo(self, event=None):
+        self.animator.finish()
+        if self.history.undo():
+            self.draw_stack()
+
+    def redo(self, event=None):
+        self.animator.finish()
+        if self.history.redo():
+            self.draw_stack()
+
+    def show_stats(self):
+        if self.stats_panel is not None and self.stats_panel.exists():
+            self.stats_panel.lift()
+        else:
+            self.stats_panel = StatsPanel(self.master, self.metrics, color1, color2)
+
+    def get_value_from_user(self):
+        value = simpledialog.askinteger("Input", "Digite um valor:")
+        return value
+
+
+# Bytes lidos entre dois yield de progresso
+LOAD_BLOCK = 1 << 20
+
+
+def load(path, version):
+    # Corre numa thread de Workers: empilha sobre a versão recebida, que é só desta tarefa, sem
+    # alterar nenhum nó partilhado com a pilha da aplicação
+    size = os.path.getsize(path)
+    for part in split_file(path, max(1, size // LOAD_BLOCK)):
+        version.push_many(read_values(part))
+        yield part[2], size
+    return version
+
+
+def main():
+    root = tk.Tk()
+    root.config(bg=color1)
+    root.resizable(width=False, height=False)
+    app = StackApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Painel de estatísticas ao vivo partilhado pelos simuladores: uma janela que mostra, para cada operação
+registada num Metrics, o número de chamadas, a latência média e máxima e as comparações, saltos e
+alocações por chamada, além do indicador atual da estrutura. Atualiza-se a cada REFRESH_MS com after()
+e permite exportar as métricas em JSON.
+"""
+import tkinter as tk
+from tkinter import filedialog
+
+REFRESH_MS = 500
+
+
+class StatsPanel:
+    def __init__(self, master, metrics, bg, fg):
+        self.metrics = metrics
+        self.window = tk.Toplevel(master, bg=bg)
+        self.window.title("Estatísticas")
+        self.label = tk.Label(self.window, font='Courier 10', justify=tk.LEFT, anchor='nw', bg=bg, fg=fg)
+        self.label.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        buttons = tk.Frame(self.window, bg=bg)
+        buttons.pack()
+        tk.Button(buttons, text="Exportar JSON", command=self.export).pack(side=tk.LEFT, padx=5, pady=5)
+        tk.Button(buttons, text="Limpar", command=self.metrics.reset).pack(side=tk.LEFT, padx=5, pady=5)
+        self.window.protocol('WM_DELETE_WINDOW', self.close)
+        self._job = None
+        self.refresh()
+
+    def format(self):
+        lines = [f"{'operação':<20}{'n':>6}{'média µs':>10}{'máx µs':>10}{'comp.':>8}{'saltos':>8}{'aloc.':>7}"]
+        for name, stats in self.metrics.operations.items():
+            count = stats.count
+            lines.append(f"{name:<20}{count:>6}{stats.seconds / count * 1e6:>10.1f}{stats.max_seconds * 1e6:>10.1f}"
+                         f"{stats.comparisons / count:>8.1f}{stats.hops / count:>8.1f}{stats.allocations / count:>7.2f}")
+        if self.metrics.gauge_name is not None:
+            lines.append(f"\n{self.metrics.gauge_name}: {self.metrics.sample()}")
+        return '\n'.join(lines)
+
+    def refresh(self):
+        self.label.config(text=self.format())
+        self._job = self.window.after(REFRESH_MS, self.refresh)
+
+    def export(self):
+        path = filedialog.asksaveasfilename(parent=self.window, defaultextension='.json',
+                                            filetypes=[("JSON", "*.json")])
+        if path:
+            self.metrics.dump(path)
+
+    def close(self):
+        if self._job is not None:
+            self.window.after_cancel(self._job)
+            self._job = None
+        self.window.destroy()
+
+    def lift(self):
+        self.window.lift()
+
+    def exists(self):
+        return self._job is not None
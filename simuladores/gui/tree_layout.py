@@ -0,0 +1,194 @@
+"""
+Layouts usados pelo BinaryTreeApp: Reingold–Tilford para as árvores binárias e BPlusLayout para as
+árvores B+. Só fazem cálculos sobre os nós (o cache fica em TreeNode.layout e BPlusNode.layout), por
+isso não importam Tkinter.
+"""
+
+
+class TidyTreeLayout:
+    # Layout de Reingold–Tilford para árvores binárias. Cada nó guarda em node.layout o
+    # deslocamento dos filhos e os contornos esquerdo/direito da sua subárvore, relativos ao próprio
+    # nó. Um contorno é uma cadeia imutável de pares (delta, resto), um por nível, em que delta é a
+    # posição nesse nível menos a do nível anterior; assim um pai reaproveita a cauda do contorno do
+    # filho mais profundo e só copia os níveis do filho mais raso, o que dá O(n) no total. Como a
+    # árvore anula o cache ao longo do caminho alterado, update() só recalcula esse caminho.
+    SEPARATION = 40
+    LEVEL_HEIGHT = 60
+    MARGIN = 50
+
+    def update(self, root):
+        # Pós-ordem iterativa que só desce a nós sem cache
+        stack = [(root, False)] if root is not None and root.layout is None else []
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                node.layout = self._combine(node)
+                continue
+            stack.append((node, True))
+            for child in (node.left, node.right):
+                if child is not None and child.layout is None:
+                    stack.append((child, False))
+
+    def _combine(self, node):
+        # node.layout = (x do filho esquerdo, x do filho direito, contorno esquerdo, contorno direito,
+        #                altura, menor x, maior x), tudo relativo ao nó
+        left, right = node.left, node.right
+        if left is None and right is None:
+            return (0, 0, (0, None), (0, None), 1, 0, 0)
+        if left is None or right is None:
+            child = left or right
+            offset = -self.SEPARATION / 2 if child is left else self.SEPARATION / 2
+            _, _, left_contour, right_contour, height, low, high = child.layout
+            return (offset, offset, (0, (offset, left_contour[1])), (0, (offset, right_contour[1])),
+                    height + 1, min(0, offset + low), max(0, offset + high))
+
+        _, _, left_left, left_right, left_height, left_low, left_high = left.layout
+        _, _, right_left, right_right, right_height, right_low, right_high = right.layout
+        # Distância mínima entre as raízes dos filhos para que nenhum nível se sobreponha
+        distance = self.SEPARATION
+        cell_left, cell_right = left_right, right_left
+        position_left = position_right = 0
+        while True:
+            distance = max(distance, position_left - position_right + self.SEPARATION)
+            cell_left, cell_right = cell_left[1], cell_right[1]
+            if cell_left is None or cell_right is None:
+                break
+            position_left += cell_left[0]
+            position_right += cell_right[0]
+        half = distance / 2
+
+        if left_height >= right_height:
+            contour_left = (0, (-half, left_left[1]))
+        else:
+            contour_left = (0, self._splice(left_left, -half, right_left, half, left_height))
+        if right_height >= left_height:
+            contour_right = (0, (half, right_right[1]))
+        else:
+            contour_right = (0, self._splice(right_right, half, left_right, -half, right_height))
+        return (-half, half, contour_left, contour_right, 1 + max(left_height, right_height),
+                min(0, left_low - half, right_low + half), max(0, left_high - half, right_high + half))
+
+    def _splice(self, shallow, shallow_offset, deep, deep_offset, levels):
+        # Copia os `levels` níveis do contorno raso (deslocado) e continua com o contorno profundo a
+        # partir desse nível, reaproveitando o resto da cadeia dele
+        positions = []
+        position, cell = 0, shallow
+        for _ in range(levels):
+            positions.append(shallow_offset + position)
+            cell = cell[1]
+            if cell is not None:
+                position += cell[0]
+        position, cell = 0, deep
+        for _ in range(levels):
+            cell = cell[1]
+            position += cell[0]
+        chain = (deep_offset + position - positions[-1], cell[1])
+        for index in range(levels - 1, 0, -1):
+            chain = (positions[index] - positions[index - 1], chain)
+        return (positions[0], chain)
+
+    def extent(self, root):
+        # Largura e altura do desenho completo, em coordenadas de layout
+        if root is None:
+            return 0, 0
+        _, _, _, _, height, low, high = root.layout
+        return high - low + 2 * self.MARGIN, (height - 1) * self.LEVEL_HEIGHT + 2 * self.MARGIN
+
+    def visible(self, root, region, scale):
+        # Posições absolutas dos nós cuja subárvore intersecta a região visível. Subárvores fora
+        # da vista ou mais estreitas que 12px na escala atual ficam recolhidas: devolve-se
+        # (pai, x, y) para desenhar um marcador no lugar delas, se estiver à vista.
+        x0, y0, x1, y1 = region
+        positions = {}
+        collapsed = []
+        if root is None:
+            return positions, collapsed
+        stack = [(root, self.MARGIN - root.layout[5], self.MARGIN)]
+        while stack:
+            node, x, y = stack.pop()
+            positions[node] = (x, y)
+            offset_left, offset_right = node.layout[:2]
+            for child, cx in ((node.left, x + offset_left), (node.right, x + offset_right)):
+                if child is None:
+                    continue
+                cy = y + self.LEVEL_HEIGHT
+                low, high = cx + child.layout[5], cx + child.layout[6]
+                if ((high - low + self.SEPARATION) * scale >= 12 and cy - 15 <= y1
+                        and high + 15 >= x0 and low - 15 <= x1):
+                    stack.append((child, cx, cy))
+                elif x0 - 15 <= cx <= x1 + 15 and y0 - 15 <= cy <= y1 + 15:
+                    collapsed.append((node, cx, cy))
+        return positions, collapsed
+
+
+class BPlusLayout:
+    # Layout das árvores B+, com a mesma interface da TidyTreeLayout. Cada nó é uma fila de CELL
+    # unidades por chave; as subárvores dos filhos ficam lado a lado, separadas por GAP, e o nó fica
+    # centrado entre o primeiro e o último filho. node.layout = (x de cada filho, menor x, maior x,
+    # altura), relativos ao nó; a árvore anula o cache ao longo do caminho alterado e nos irmãos que
+    # emprestam ou recebem chaves, por isso update() só recalcula esses nós.
+    CELL = 36
+    NODE_HEIGHT = 30
+    GAP = 16
+    LEVEL_HEIGHT = 80
+    MARGIN = 50
+
+    def update(self, root):
+        # Pós-ordem iterativa que só desce a nós sem cache
+        stack = [(root, False)] if root is not None and root.layout is None else []
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                node.layout = self._combine(node)
+                continue
+            stack.append((node, True))
+            for child in node.children or ():
+                if child.layout is None:
+                    stack.append((child, False))
+
+    def _combine(self, node):
+        half = len(node.keys) * self.CELL / 2
+        if node.children is None:
+            return ((), -half, half, 1)
+        centers = []
+        cursor = 0
+        for child in node.children:
+            _, low, high, _ = child.layout
+            centers.append(cursor - low)
+            cursor += high - low + self.GAP
+        middle = (centers[0] + centers[-1]) / 2
+        offsets = tuple(center - middle for center in centers)
+        first, last = node.children[0].layout, node.children[-1].layout
+        return (offsets, min(-half, offsets[0] + first[1]), max(half, offsets[-1] + last[2]), first[3] + 1)
+
+    def extent(self, root):
+        # Largura e altura do desenho completo, em coordenadas de layout
+        if root is None:
+            return 0, 0
+        _, low, high, height = root.layout
+        return high - low + 2 * self.MARGIN, (height - 1) * self.LEVEL_HEIGHT + 2 * self.MARGIN
+
+    def visible(self, root, region, scale):
+        # Como TidyTreeLayout.visible: posições dos centros dos nós cuja subárvore intersecta a região
+        # e (pai, x, y) das subárvores recolhidas
+        x0, y0, x1, y1 = region
+        positions = {}
+        collapsed = []
+        if root is None:
+            return positions, collapsed
+        stack = [(root, self.MARGIN - root.layout[1], self.MARGIN)]
+        while stack:
+            node, x, y = stack.pop()
+            positions[node] = (x, y)
+            if node.children is None:
+                continue
+            cy = y + self.LEVEL_HEIGHT
+            for child, offset in zip(node.children, node.layout[0]):
+                cx = x + offset
+                low, high = cx + child.layout[1], cx + child.layout[2]
+                if ((high - low + self.GAP) * scale >= 12 and cy - self.NODE_HEIGHT / 2 <= y1
+                        and high >= x0 and low <= x1):
+                    stack.append((child, cx, cy))
+                elif x0 - 15 <= cx <= x1 + 15 and y0 - 15 <= cy <= y1 + 15:
+                    collapsed.append((node, cx, cy))
+        return positions, collapsed
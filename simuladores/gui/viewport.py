@@ -0,0 +1,84 @@
+"""
+Descrição: Canvas com barras de rolagem e zoom partilhado pelos simuladores. As aplicações desenham em
+coordenadas de layout; o ScrollableCanvas converte-as com a escala atual e avisa a aplicação sempre que a
+área visível muda, para que apenas os nós dentro dela sejam materializados no Canvas.
+
+Roda do rato: rolagem vertical; Shift + roda: rolagem horizontal; Ctrl + roda: zoom.
+"""
+import tkinter as tk
+
+MIN_SCALE = 0.05
+MAX_SCALE = 4.0
+
+
+class ScrollableCanvas:
+    def __init__(self, master, width, height, bg, on_view_change):
+        self.frame = tk.Frame(master, bg=bg)
+        self.canvas = tk.Canvas(self.frame, width=width, height=height, bg=bg, highlightbackground=bg)
+        self.hbar = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self._xview)
+        self.vbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._yview)
+        self.canvas.config(xscrollcommand=self.hbar.set, yscrollcommand=self.vbar.set)
+        self.canvas.grid(row=0, column=0)
+        self.vbar.grid(row=0, column=1, sticky='ns')
+        self.hbar.grid(row=1, column=0, sticky='ew')
+
+        self.width = width
+        self.height = height
+        self.scale = 1.0
+        self.extent = (width, height)
+        self.on_view_change = on_view_change
+        self.set_extent(width, height)
+
+        self.canvas.bind('<MouseWheel>', lambda e: self._scroll(self.canvas.yview, e.delta))
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._scroll(self.canvas.xview, e.delta))
+        self.canvas.bind('<Control-MouseWheel>', lambda e: self.zoom(1.25 if e.delta > 0 else 0.8))
+        # Em X11 a roda do rato chega como os botões 4 e 5
+        self.canvas.bind('<Button-4>', lambda e: self._scroll(self.canvas.yview, 1))
+        self.canvas.bind('<Button-5>', lambda e: self._scroll(self.canvas.yview, -1))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self._scroll(self.canvas.xview, 1))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self._scroll(self.canvas.xview, -1))
+        self.canvas.bind('<Control-Button-4>', lambda e: self.zoom(1.25))
+        self.canvas.bind('<Control-Button-5>', lambda e: self.zoom(0.8))
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    def set_extent(self, width, height):
+        # Tamanho total do desenho em coordenadas de layout
+        self.extent = (width, height)
+        self.canvas.config(scrollregion=(0, 0, max(width * self.scale, self.width),
+                                         max(height * self.scale, self.height)))
+
+    def visible_region(self):
+        # Retângulo visível (x0, y0, x1, y1) em coordenadas de layout
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        return (x0 / self.scale, y0 / self.scale,
+                (x0 + self.width) / self.scale, (y0 + self.height) / self.scale)
+
+    def zoom(self, factor):
+        scale = min(MAX_SCALE, max(MIN_SCALE, self.scale * factor))
+        if scale == self.scale:
+            return
+        x0, y0, x1, y1 = self.visible_region()
+        center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+        self.scale = scale
+        self.set_extent(*self.extent)
+        # Mantém o mesmo ponto do layout no centro da janela
+        total_width = max(self.extent[0] * scale, self.width)
+        total_height = max(self.extent[1] * scale, self.height)
+        self.canvas.xview_moveto((center_x * scale - self.width / 2) / total_width)
+        self.canvas.yview_moveto((center_y * scale - self.height / 2) / total_height)
+        self.on_view_change()
+
+    def _scroll(self, view, delta):
+        view(tk.SCROLL, -1 if delta > 0 else 1, tk.UNITS)
+        self.on_view_change()
+
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self.on_view_change()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.on_view_change()
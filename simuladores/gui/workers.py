@@ -0,0 +1,189 @@
+"""
+Execução em segundo plano das operações pesadas das aplicações (travessias e carregamentos grandes),
+para que a janela continue a responder.
+
+Workers tem dois tipos de tarefa. run() executa um gerador numa thread de um ThreadPoolExecutor: cada
+yield (feito, total) é progresso e o valor devolvido com return é o resultado; serve para leituras de
+ficheiros e para trabalho sobre versões imutáveis das estruturas persistentes. map() aplica uma função a
+várias partes num ProcessPoolExecutor (trabalho de CPU que não pode partilhar o GIL, como converter e
+ordenar um ficheiro grande); o progresso é o número de partes concluídas.
+
+As threads e os processos só comunicam por uma queue.Queue, lida com after() na thread do Tkinter: as
+funções on_progress, on_done e on_error correm sempre nessa thread, e nunca depois de cancel(). O
+cancelamento é cooperativo: o gerador para no próximo yield e as partes ainda não iniciadas são
+descartadas.
+"""
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# Intervalo entre leituras da fila
+POLL_MS = 50
+# Elementos processados entre dois yield de progresso nos geradores das aplicações
+PROGRESS_EVERY = 1 << 16
+
+class Task:
+    def __init__(self, on_done, on_progress, on_error):
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.cancelled = False
+        self.futures = []
+        # Resultados das partes de map(), pela ordem das partes
+        self.parts = None
+        self.remaining = 0
+
+    def cancel(self):
+        # Chamado na thread do Tkinter
+        self.cancelled = True
+        for future in self.futures:
+            future.cancel()
+
+class Workers:
+    def __init__(self, master, threads=2, processes=None):
+        self.master = master
+        self.threads = threads
+        self.processes = processes or os.cpu_count() or 1
+        self.events = queue.Queue()
+        self.tasks = set()
+        self._thread_pool = None
+        self._process_pool = None
+        self._job = None
+        self.title = master.title()
+
+    def _threads(self):
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(self.threads, thread_name_prefix='simuladores')
+        return self._thread_pool
+
+    def _processes(self):
+        # 'spawn': bifurcar um processo com o Tkinter e outras threads ativas não é seguro
+        if self._process_pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            context = multiprocessing.get_context('spawn')
+            self._process_pool = ProcessPoolExecutor(self.processes, mp_context=context)
+        return self._process_pool
+
+    def busy(self):
+        return bool(self.tasks)
+
+    def title_progress(self, label):
+        # on_progress que mostra a percentagem no título da janela (reposto quando não há tarefas)
+        def show(done, total):
+            percent = done * 100 // total if total else 100
+            self.master.title(f"{self.title} — {label} {percent}%")
+        return show
+
+    def run(self, steps, on_done, on_progress=None, on_error=None):
+        task = self._start(on_done, on_progress, on_error)
+        task.futures.append(self._threads().submit(self._drive, task, steps))
+        return task
+
+    def map(self, function, parts, on_done, on_progress=None, on_error=None):
+        # function e as partes têm de poder ser enviadas a outro processo (funções de módulo)
+        task = self._start(on_done, on_progress, on_error)
+        task.parts = [None] * len(parts)
+        task.remaining = len(parts)
+        if not parts:
+            self.events.put((task, 'done', []))
+            return task
+        pool = self._processes()
+        for index, part in enumerate(parts):
+            future = pool.submit(function, part)
+            future.add_done_callback(lambda future, index=index: self._part_done(task, index, future))
+            task.futures.append(future)
+        return task
+
+    def cancel_all(self):
+        for task in list(self.tasks):
+            task.cancel()
+        self.tasks.clear()
+
+    def shutdown(self):
+        # Para fechar a aplicação sem esperar pelas tarefas em curso
+        self.cancel_all()
+        if self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
+
+    def _start(self, on_done, on_progress, on_error):
+        task = Task(on_done, on_progress, on_error)
+        self.tasks.add(task)
+        if self._job is None:
+            self._job = self.master.after(POLL_MS, self._poll)
+        return task
+
+    def _drive(self, task, steps):
+        # Corre numa thread do pool
+        try:
+            while not task.cancelled:
+                try:
+                    progress = next(steps)
+                except StopIteration as stop:
+                    self.events.put((task, 'done', stop.value))
+                    return
+                self.events.put((task, 'progress', progress))
+            steps.close()
+        except BaseException as error:
+            self.events.put((task, 'error', error))
+
+    def _part_done(self, task, index, future):
+        # Corre na thread interna do ProcessPoolExecutor
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.events.put((task, 'error', error))
+        else:
+            self.events.put((task, 'part', (index, future.result())))
+
+    def _poll(self):
+        # Só o último progresso de cada tarefa é mostrado, por muitos que tenham chegado
+        self.tasks = {task for task in self.tasks if not task.cancelled}
+        progress = {}
+        finished = []
+        while True:
+            try:
+                task, kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if task not in self.tasks:
+                continue
+            if kind == 'progress':
+                progress[task] = payload
+            elif kind == 'part':
+                index, result = payload
+                task.parts[index] = result
+                task.remaining -= 1
+                progress[task] = (len(task.parts) - task.remaining, len(task.parts))
+                if not task.remaining:
+                    finished.append((task, 'done', task.parts))
+            else:
+                finished.append((task, kind, payload))
+        # As funções chamadas podem cancelar ou iniciar outras tarefas
+        for task, value in progress.items():
+            if task.on_progress is not None and not task.cancelled:
+                task.on_progress(*value)
+        for task, kind, payload in finished:
+            if task.cancelled or task not in self.tasks:
+                continue
+            self.tasks.discard(task)
+            if kind == 'done':
+                task.on_done(payload)
+            else:
+                for future in task.futures:
+                    future.cancel()
+                if task.on_error is not None:
+                    task.on_error(payload)
+                else:
+                    self.master.report_callback_exception(type(payload), payload, payload.__traceback__)
+        if self.tasks:
+            self._job = self.master.after(POLL_MS, self._poll)
+        else:
+            self._job = None
+            self.master.title(self.title)
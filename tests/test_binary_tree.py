@@ -0,0 +1,24 @@
+import random
+import unittest
+
+from simuladores.core import ArrayBinaryTree, BinaryTree
+
+
+class BatchTest(unittest.TestCase):
+    def test_array_tree_search_many_matches_binary_tree(self):
+        rng = random.Random(16)
+        tree, pooled = BinaryTree(), ArrayBinaryTree()
+        keys = list(range(-5, 120))
+        for _ in range(300):
+            key = rng.randrange(100)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                pooled.insert(key)
+            elif tree.search(key) is not None:
+                tree.delete(key)
+                pooled.delete(key)
+            self.assertEqual(list(pooled.search_many(keys)), list(tree.search_many(keys)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from simuladores.core import ArrayLinkedList, LinkedList
+from simuladores.core.metrics import Metrics
+
+
+class ValueIndexTest(unittest.TestCase):
+    def test_many_duplicates_match_a_list(self):
+        rng = random.Random(6)
+        linked = LinkedList(value_index=True)
+        model = []
+        for _ in range(3000):
+            value = rng.randrange(5)
+            operation = rng.random()
+            if operation < 0.3:
+                linked.append(value)
+                model.append(value)
+            elif operation < 0.6:
+                position = rng.randint(0, len(model))
+                linked.insert_at_position(value, position)
+                model.insert(position, value)
+            elif operation < 0.75:
+                linked.insert_at_start(value)
+                model.insert(0, value)
+            elif model:
+                position = rng.randrange(len(model))
+                linked.remove_at_position(position)
+                del model[position]
+            expected = model.index(value) if value in model else -1
+            self.assertEqual(linked.find_value(value), expected)
+            self.assertEqual(value in linked, value in model)
+        self.assertEqual([linked.find_position(i) for i in range(len(model))], model)
+
+    def test_find_value_does_not_visit_every_duplicate(self):
+        # 20 000 nós com só 10 valores: a busca calcula a posição de um único nó
+        metrics = Metrics()
+        linked = LinkedList(value_index=True, metrics=metrics)
+        linked.extend(random.Random(7).randrange(10) for _ in range(20000))
+        linked.insert_at_position(10, 15000)
+        self.assertEqual(linked.find_value(10), 15000)
+        for value in range(10):
+            linked.find_value(value)
+        self.assertLess(metrics.operations['find_value'].hops, 11 * 400)
+
+
+class BatchTest(unittest.TestCase):
+    def test_array_list_find_values_matches_linked_list(self):
+        rng = random.Random(16)
+        linked, pooled = LinkedList(), ArrayLinkedList()
+        for structure in (linked, pooled):
+            structure.extend(range(50))
+        queries = list(range(-5, 120))
+        for _ in range(200):
+            value, position = rng.randrange(100), rng.randint(0, len(linked))
+            if rng.random() < 0.6:
+                linked.insert_at_position(value, position)
+                pooled.insert_at_position(value, position)
+            else:
+                linked.remove_at_position(position)
+                pooled.remove_at_position(position)
+            self.assertEqual(list(pooled.find_values(queries)), list(linked.find_values(queries)))
+
+
+if __name__ == "__main__":
+    unittest.main()
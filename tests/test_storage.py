@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+
+from simuladores.core import LinkedList, Stack
+from simuladores.core.storage import load, save
+
+
+class SaveTest(unittest.TestCase):
+    def test_failed_save_keeps_the_previous_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stack.simu')
+            stack = Stack()
+            for value in range(5):
+                stack.push(value)
+            save(stack, path)
+            stack.push('x')
+            with self.assertRaises(TypeError):
+                save(stack, path)
+            self.assertEqual(os.listdir(directory), ['stack.simu'])
+            self.assertEqual(load(Stack, path).items, [0, 1, 2, 3, 4])
+
+    def test_failed_list_save_leaves_no_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'list.simu')
+            linked = LinkedList()
+            linked.extend([1, 2, 3.5])
+            with self.assertRaises(TypeError):
+                save(linked, path)
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()